@@ -1,31 +1,81 @@
 from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.analytics import ComparisonResponse, DailyMetricsRow
-from app.services import analytics_service
+from app.schemas.analytics import ComparisonResponse, DailyMetricsRow, WeeklyMetricsRow
+from app.services import analytics_service, daily_metrics_service
+from app.services.arrow import ARROW_STREAM_MEDIA_TYPE, arrow_response, wants_arrow
+from app.services.etag import check_etag, weak_etag
+from app.services.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
 
 router = APIRouter()
 
 
-@router.get("/daily-metrics", response_model=List[DailyMetricsRow])
+def _check_mart_etag(request: Request, response: Response, version: Optional[str]) -> None:
+    """304 if the data at `version` is unchanged since the client's copy of this URL.
+
+    No version (the cache generation couldn't be read) means no ETag.
+    """
+    if version is None:
+        return
+    if wants_arrow(request):
+        media_type = ARROW_STREAM_MEDIA_TYPE
+    elif wants_ndjson(request):
+        media_type = NDJSON_MEDIA_TYPE
+    else:
+        media_type = "application/json"
+    check_etag(request, response, weak_etag(version, request.url.path, request.url.query, media_type))
+
+
+@router.get(
+    "/daily-metrics",
+    response_model=List[DailyMetricsRow],
+    responses={200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}, NDJSON_MEDIA_TYPE: {}}}},
+)
 def get_daily_metrics(
+    request: Request,
+    response: Response,
     baby_id: UUID,
     min_age_days: Optional[int] = Query(None, ge=0),
     max_age_days: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db),
 ) -> List[dict]:
-    """One baby's daily metrics from the dbt mart, oldest first."""
+    """One baby's daily metrics, oldest first (see DAILY_METRICS_SOURCE).
+
+    Sent as an Arrow IPC stream if the client accepts application/vnd.apache.arrow.stream,
+    or streamed one row per line for application/x-ndjson.
+    """
+    if settings.DAILY_METRICS_SOURCE == "app":
+        version = daily_metrics_service.daily_metrics_version(db, baby_id)
+    else:
+        version = analytics_service.mart_version(db)
+    _check_mart_etag(request, response, version)
+    if wants_arrow(request):
+        columns = analytics_service.get_daily_metrics(
+            db, baby_id, min_age_days=min_age_days, max_age_days=max_age_days, columnar=True
+        )
+        return arrow_response(columns, DailyMetricsRow, headers=dict(response.headers))
+    if wants_ndjson(request):
+        return ndjson_response(db, analytics_service.daily_metrics_statement(
+            baby_id, min_age_days=min_age_days, max_age_days=max_age_days
+        ), DailyMetricsRow, headers=dict(response.headers))
     return analytics_service.get_daily_metrics(
         db, baby_id, min_age_days=min_age_days, max_age_days=max_age_days
     )
 
 
-@router.get("/compare", response_model=ComparisonResponse)
+@router.get(
+    "/compare",
+    response_model=ComparisonResponse,
+    responses={200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}, NDJSON_MEDIA_TYPE: {}}}},
+)
 def compare_babies(
+    request: Request,
+    response: Response,
     align: Literal["age_weeks", "age_days"] = "age_weeks",
     db: Session = Depends(get_db),
 ) -> ComparisonResponse:
@@ -33,8 +83,31 @@ def compare_babies(
 
     age_weeks returns per-week averages (one row per baby per week of age);
     age_days returns the raw daily rows. Join/overlay on the age column.
+
+    As an Arrow IPC stream (Accept: application/vnd.apache.arrow.stream)
+    the batch holds the weekly or daily rows; `align` and `babies` are
+    JSON values in the schema metadata. As NDJSON (Accept:
+    application/x-ndjson) the first line is {"align", "babies"} and each
+    following line is one weekly or daily row.
     """
+    _check_mart_etag(request, response, analytics_service.comparison_version(db))
     babies = analytics_service.get_comparison_babies(db)
+    if wants_arrow(request):
+        if align == "age_weeks":
+            model, columns = WeeklyMetricsRow, analytics_service.get_weekly_comparison(db, columnar=True)
+        else:
+            model, columns = DailyMetricsRow, analytics_service.get_daily_comparison(db, columnar=True)
+        return arrow_response(
+            columns, model, headers=dict(response.headers), metadata={"align": align, "babies": babies}
+        )
+    if wants_ndjson(request):
+        return ndjson_response(
+            db,
+            analytics_service.comparison_statement(db, align),
+            WeeklyMetricsRow if align == "age_weeks" else DailyMetricsRow,
+            header={"align": align, "babies": babies},
+            headers=dict(response.headers),
+        )
     if align == "age_weeks":
         return ComparisonResponse(
             align=align,
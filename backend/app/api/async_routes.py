@@ -0,0 +1,244 @@
+"""Async CRUD routers, mounted instead of the sync ones when DATABASE_ASYNC is on.
+
+Each resource exposes the same paths, parameters and response models as
+its sync router in this package, but the handlers are coroutines awaiting
+an AsyncSession, so a request waiting on Postgres does not hold one of
+Starlette's threadpool threads. The per-baby timeline and summary have
+no async variants yet; they are mounted from the sync babies router and
+run in the threadpool as before.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import babies as sync_babies
+from app.core.database import get_async_db
+from app.schemas.baby import BabyProfileCreate, BabyProfileResponse, BabyProfileUpdate
+from app.schemas.bulk import BULK_MAX_ITEMS, BulkCreateResponse
+from app.schemas.diaper import DiaperEventCreate, DiaperEventResponse, DiaperEventUpdate
+from app.schemas.feeding import FeedingSessionCreate, FeedingSessionResponse, FeedingSessionUpdate
+from app.schemas.growth import (
+    GrowthMeasurementCreate,
+    GrowthMeasurementResponse,
+    GrowthMeasurementUpdate,
+)
+from app.schemas.health import HealthEventCreate, HealthEventResponse, HealthEventUpdate
+from app.schemas.sleep import SleepSessionCreate, SleepSessionResponse, SleepSessionUpdate
+from app.schemas.summary import DailySummaryResponse
+from app.schemas.timeline import TimelineResponse
+from app.services import (
+    async_baby_service,
+    async_diaper_service,
+    async_feeding_service,
+    async_growth_service,
+    async_health_service,
+    async_sleep_service,
+)
+from app.services.async_base import AsyncCRUDBase
+from app.services.bulk import async_bulk_create, bulk_status_code
+from app.services.etag import check_etag, list_variant
+from app.services.ndjson import NDJSON_RESPONSES, async_ndjson_response, wants_ndjson
+from app.services.pagination import next_cursor_headers
+from app.services.serialization import item_model, json_list_response, parse_fields
+
+
+def build_event_router(
+    service: AsyncCRUDBase,
+    create_schema: type,
+    update_schema: type,
+    response_schema: type,
+) -> APIRouter:
+    """Async CRUD routes for one event resource, mirroring its sync router."""
+    router = APIRouter()
+    order_by_field = service.model.event_time_field
+
+    @router.post("/", response_model=response_schema, status_code=status.HTTP_201_CREATED)
+    async def create_event(
+        event: create_schema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """Create a new event."""
+        return await service.create(db, obj_in=event)
+
+    @router.post("/bulk", response_model=BulkCreateResponse[response_schema], status_code=status.HTTP_201_CREATED)
+    async def bulk_create_events(
+        response: Response,
+        items: List[Any] = Body(..., max_length=BULK_MAX_ITEMS),
+        atomic: bool = Query(False, description="Create nothing if any item is invalid"),
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """Create many events in one transaction, with per-item results."""
+        result = await async_bulk_create(db, service, create_schema, items, atomic=atomic)
+        response.status_code = bulk_status_code(result)
+        return result
+
+    @router.get("/", response_model=List[response_schema], responses=NDJSON_RESPONSES)
+    async def list_events(
+        request: Request,
+        response: Response,
+        baby_id: Optional[UUID] = Query(None, description="Filter by baby ID"),
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+        since: Optional[datetime] = Query(None, description="Only events at or after this time"),
+        until: Optional[datetime] = Query(None, description="Only events before this time"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """List events with optional filtering, newest first."""
+        field_set = parse_fields(response_schema, fields)
+        check_etag(request, response, await service.list_etag(
+            db, baby_id=baby_id, since=since, until=until, variant=list_variant(request)
+        ))
+        if wants_ndjson(request):
+            return async_ndjson_response(db, service.rows_statement(
+                response_model=response_schema, fields=field_set,
+                skip=skip, limit=limit, baby_id=baby_id, order_by_field=order_by_field,
+                cursor=cursor, since=since, until=until
+            ), item_model(response_schema, field_set), include=field_set, headers=dict(response.headers))
+        events = await service.get_multi_rows(
+            db, response_model=response_schema, fields=field_set,
+            skip=skip, limit=limit, baby_id=baby_id, order_by_field=order_by_field,
+            cursor=cursor, since=since, until=until
+        )
+        response.headers.update(
+            next_cursor_headers(service.next_cursor(events, limit=limit, order_by_field=order_by_field))
+        )
+        return json_list_response(events, response_schema, fields=field_set, headers=dict(response.headers))
+
+    @router.get("/{event_id}", response_model=response_schema)
+    async def get_event(
+        event_id: UUID,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """Get a specific event by ID."""
+        return await service.get_or_404(db, event_id)
+
+    @router.put("/{event_id}", response_model=response_schema)
+    async def update_event(
+        event_id: UUID,
+        event_update: update_schema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """Update an event."""
+        db_event = await service.get_or_404(db, event_id)
+        return await service.update(db, db_obj=db_event, obj_in=event_update)
+
+    @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+    async def delete_event(
+        event_id: UUID,
+        db: AsyncSession = Depends(get_async_db)
+    ) -> None:
+        """Delete an event."""
+        await service.remove(db, id=event_id)
+
+    return router
+
+
+babies_router = APIRouter()
+
+
+@babies_router.post("/", response_model=BabyProfileResponse, status_code=status.HTTP_201_CREATED)
+async def create_baby_profile(
+    baby: BabyProfileCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create a new baby profile."""
+    return await async_baby_service.create(db, obj_in=baby)
+
+
+@babies_router.get("/", response_model=List[BabyProfileResponse], responses=NDJSON_RESPONSES)
+async def list_baby_profiles(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    is_active: bool = True,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List all baby profiles with optional filtering, ordered by name."""
+    field_set = parse_fields(BabyProfileResponse, fields)
+    check_etag(request, response, await async_baby_service.list_etag(
+        db, is_active=is_active, variant=list_variant(request)
+    ))
+    if wants_ndjson(request):
+        return async_ndjson_response(db, async_baby_service.rows_statement(
+            response_model=BabyProfileResponse, fields=field_set,
+            skip=skip, limit=limit, is_active=is_active, cursor=cursor
+        ), item_model(BabyProfileResponse, field_set), include=field_set, headers=dict(response.headers))
+    babies = await async_baby_service.get_multi_rows(
+        db, response_model=BabyProfileResponse, fields=field_set,
+        skip=skip, limit=limit, is_active=is_active, cursor=cursor
+    )
+    response.headers.update(next_cursor_headers(async_baby_service.next_cursor(babies, limit=limit)))
+    return json_list_response(babies, BabyProfileResponse, fields=field_set, headers=dict(response.headers))
+
+
+@babies_router.get("/{baby_id}", response_model=BabyProfileResponse)
+async def get_baby_profile(
+    baby_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific baby profile by ID."""
+    return await async_baby_service.get_or_404(db, baby_id)
+
+
+babies_router.add_api_route(
+    "/{baby_id}/timeline",
+    sync_babies.get_baby_timeline,
+    methods=["GET"],
+    response_model=TimelineResponse,
+)
+babies_router.add_api_route(
+    "/{baby_id}/summary",
+    sync_babies.get_baby_summary,
+    methods=["GET"],
+    response_model=DailySummaryResponse,
+)
+
+
+@babies_router.put("/{baby_id}", response_model=BabyProfileResponse)
+async def update_baby_profile(
+    baby_id: UUID,
+    baby_update: BabyProfileUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update a baby profile."""
+    db_baby = await async_baby_service.get_or_404(db, baby_id)
+    return await async_baby_service.update(db, db_obj=db_baby, obj_in=baby_update)
+
+
+@babies_router.delete("/{baby_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_baby_profile(
+    baby_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
+) -> None:
+    """Soft delete a baby profile by setting is_active to False."""
+    await async_baby_service.remove(db, id=baby_id)
+
+
+# URL prefix under API_V1_STR -> router, in the same order as the sync routers
+ROUTERS: Dict[str, APIRouter] = {
+    "babies": babies_router,
+    "feeding": build_event_router(
+        async_feeding_service, FeedingSessionCreate, FeedingSessionUpdate, FeedingSessionResponse
+    ),
+    "sleep": build_event_router(
+        async_sleep_service, SleepSessionCreate, SleepSessionUpdate, SleepSessionResponse
+    ),
+    "diaper": build_event_router(
+        async_diaper_service, DiaperEventCreate, DiaperEventUpdate, DiaperEventResponse
+    ),
+    "growth": build_event_router(
+        async_growth_service, GrowthMeasurementCreate, GrowthMeasurementUpdate, GrowthMeasurementResponse
+    ),
+    "health": build_event_router(
+        async_health_service, HealthEventCreate, HealthEventUpdate, HealthEventResponse
+    ),
+}
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 from app.core.database import get_db
 from app.models.baby import BabyProfile
 from app.schemas.baby import BabyProfileCreate, BabyProfileUpdate, BabyProfileResponse
-from app.services import baby_service
+from app.schemas.summary import DailySummaryResponse
+from app.schemas.timeline import TimelineEventType, TimelineResponse
+from app.services import baby_service, summary_service, timeline_service
+from app.services.etag import check_etag, list_variant
+from app.services.ndjson import NDJSON_RESPONSES, ndjson_response, wants_ndjson
+from app.services.pagination import next_cursor_headers
+from app.services.serialization import item_model, json_list_response, parse_fields
 
 router = APIRouter()
 
@@ -20,15 +27,37 @@ def create_baby_profile(
     return baby_service.create(db, obj_in=baby)
 
 
-@router.get("/", response_model=List[BabyProfileResponse])
+@router.get("/", response_model=List[BabyProfileResponse], responses=NDJSON_RESPONSES)
 def list_baby_profiles(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     is_active: bool = True,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,date_of_birth"),
     db: Session = Depends(get_db)
-) -> List[BabyProfile]:
-    """List all baby profiles with optional filtering."""
-    return baby_service.get_multi(db, skip=skip, limit=limit, is_active=is_active)
+) -> Response:
+    """List all baby profiles with optional filtering, ordered by name.
+
+    Streamed one object per line with Accept: application/x-ndjson.
+    ?fields= returns, and selects from the database, only those fields.
+    """
+    field_set = parse_fields(BabyProfileResponse, fields)
+    check_etag(request, response, baby_service.list_etag(
+        db, is_active=is_active, variant=list_variant(request)
+    ))
+    if wants_ndjson(request):
+        return ndjson_response(db, baby_service.rows_statement(
+            response_model=BabyProfileResponse, fields=field_set,
+            skip=skip, limit=limit, is_active=is_active, cursor=cursor
+        ), item_model(BabyProfileResponse, field_set), include=field_set, headers=dict(response.headers))
+    babies = baby_service.get_multi_rows(
+        db, response_model=BabyProfileResponse, fields=field_set,
+        skip=skip, limit=limit, is_active=is_active, cursor=cursor
+    )
+    response.headers.update(next_cursor_headers(baby_service.next_cursor(babies, limit=limit)))
+    return json_list_response(babies, BabyProfileResponse, fields=field_set, headers=dict(response.headers))
 
 
 @router.get("/{baby_id}", response_model=BabyProfileResponse)
@@ -40,6 +69,42 @@ def get_baby_profile(
     return baby_service.get_or_404(db, baby_id)
 
 
+@router.get("/{baby_id}/timeline", response_model=TimelineResponse)
+def get_baby_timeline(
+    baby_id: UUID,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    event_type: Optional[List[TimelineEventType]] = Query(None, description="Only these event types"),
+    db: Session = Depends(get_db)
+) -> TimelineResponse:
+    """All of a baby's events merged into one newest-first feed."""
+    baby_service.get_or_404(db, baby_id)
+    entries, next_cursor = timeline_service.get_timeline(
+        db, baby_id, limit=limit, cursor=cursor, event_types=event_type
+    )
+    return TimelineResponse.model_validate(
+        {
+            "items": [
+                {"event_type": kind, "event_time": event_time, "event": event}
+                for kind, event_time, event in entries
+            ],
+            "next_cursor": next_cursor,
+        },
+        from_attributes=True,
+    )
+
+
+@router.get("/{baby_id}/summary", response_model=DailySummaryResponse)
+def get_baby_summary(
+    baby_id: UUID,
+    day: Optional[date] = Query(None, alias="date", description="Local date (default: today in the baby's timezone)"),
+    db: Session = Depends(get_db)
+) -> dict:
+    """Feed, sleep, diaper and health totals for one of the baby's local days."""
+    baby = baby_service.get_or_404(db, baby_id)
+    return summary_service.get_daily_summary(db, baby, day)
+
+
 @router.put("/{baby_id}", response_model=BabyProfileResponse)
 def update_baby_profile(
     baby_id: UUID,
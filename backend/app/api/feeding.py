@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional
 
 from app.core.database import get_db
 from app.models.feeding import FeedingSession
 from app.schemas.feeding import FeedingSessionCreate, FeedingSessionUpdate, FeedingSessionResponse
+from app.schemas.bulk import BULK_MAX_ITEMS, BulkCreateResponse
 from app.services import feeding_service
+from app.services.bulk import bulk_create, bulk_status_code
+from app.services.etag import check_etag, list_variant
+from app.services.ndjson import NDJSON_RESPONSES, ndjson_response, wants_ndjson
+from app.services.pagination import next_cursor_headers
+from app.services.serialization import item_model, json_list_response, parse_fields
 
 router = APIRouter()
 
@@ -20,17 +27,64 @@ def create_feeding_session(
     return feeding_service.create(db, obj_in=feeding)
 
 
-@router.get("/", response_model=List[FeedingSessionResponse])
+@router.post("/bulk", response_model=BulkCreateResponse[FeedingSessionResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_feeding_sessions(
+    response: Response,
+    items: List[Any] = Body(..., max_length=BULK_MAX_ITEMS, description="FeedingSessionCreate objects"),
+    atomic: bool = Query(False, description="Create nothing if any item is invalid"),
+    db: Session = Depends(get_db)
+) -> dict:
+    """Create many feeding sessions in one transaction.
+
+    Each item is validated separately and reported at its index:
+    201 if all were created, 207 if some failed, 422 if none were created.
+    """
+    result = bulk_create(db, feeding_service, FeedingSessionCreate, items, atomic=atomic)
+    response.status_code = bulk_status_code(result)
+    return result
+
+
+@router.get("/", response_model=List[FeedingSessionResponse], responses=NDJSON_RESPONSES)
 def list_feeding_sessions(
+    request: Request,
+    response: Response,
     baby_id: Optional[UUID] = Query(None, description="Filter by baby ID"),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    since: Optional[datetime] = Query(None, description="Only events at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only events before this time"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. start_time,feeding_type,volume_consumed_ml"),
     db: Session = Depends(get_db)
-) -> List[FeedingSession]:
-    """List all feeding sessions with optional filtering."""
-    return feeding_service.get_multi(
-        db, skip=skip, limit=limit, baby_id=baby_id, order_by_field="start_time"
+) -> Response:
+    """List all feeding sessions with optional filtering, newest first.
+
+    A full page sets the X-Next-Cursor header; pass it back as
+    ?cursor= for the next page instead of increasing skip. Responds
+    304 when If-None-Match has the current ETag. With Accept:
+    application/x-ndjson the page is streamed one object per line and
+    limit can be as large as needed; there is no X-Next-Cursor then.
+    ?fields= returns, and selects from the database, only those fields.
+    """
+    field_set = parse_fields(FeedingSessionResponse, fields)
+    check_etag(request, response, feeding_service.list_etag(
+        db, baby_id=baby_id, since=since, until=until, variant=list_variant(request)
+    ))
+    if wants_ndjson(request):
+        return ndjson_response(db, feeding_service.rows_statement(
+            response_model=FeedingSessionResponse, fields=field_set,
+            skip=skip, limit=limit, baby_id=baby_id, order_by_field="start_time",
+            cursor=cursor, since=since, until=until
+        ), item_model(FeedingSessionResponse, field_set), include=field_set, headers=dict(response.headers))
+    sessions = feeding_service.get_multi_rows(
+        db, response_model=FeedingSessionResponse, fields=field_set,
+        skip=skip, limit=limit, baby_id=baby_id, order_by_field="start_time",
+        cursor=cursor, since=since, until=until
+    )
+    response.headers.update(
+        next_cursor_headers(feeding_service.next_cursor(sessions, limit=limit, order_by_field="start_time"))
     )
+    return json_list_response(sessions, FeedingSessionResponse, fields=field_set, headers=dict(response.headers))
 
 
 @router.get("/{feeding_id}", response_model=FeedingSessionResponse)
@@ -0,0 +1,61 @@
+"""Operational endpoints for sizing and debugging a running worker.
+
+Mounted at /internal, outside the versioned API. Figures are per worker
+process; sum them across workers.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core import database
+from app.core.database import get_db
+from app.core.pool import pool_status
+from app.services import analytics_service
+
+router = APIRouter()
+
+
+@router.get("/pool")
+def get_pool_status() -> dict:
+    """Connection pool gauges and checkout statistics for each engine."""
+    engines = {"sync": database.get_engine()}
+    if database.get_async_engine() is not None:
+        engines["async"] = database.get_async_engine().sync_engine
+    for replica in database.get_replicas().replicas:
+        engines[replica.name] = replica.engine
+    return {name: pool_status(engine.pool) for name, engine in engines.items()}
+
+
+@router.get("/replicas")
+def get_replica_status() -> dict:
+    """Health of each read replica, as of its last check."""
+    return database.get_replicas().status()
+
+
+@router.get("/analytics-cache")
+def get_analytics_cache_stats() -> dict:
+    """Hit/miss counts and current generation of the analytics result cache."""
+    if analytics_service.result_cache is None:
+        return {"backend": "off"}
+    return analytics_service.result_cache.stats()
+
+
+@router.post("/analytics-cache/invalidate")
+def invalidate_analytics_cache() -> dict:
+    """Drop all cached analytics results, e.g. from a dbt on-run-end hook.
+
+    Rebuilds and in-place changes of the mart are picked up on their own;
+    this covers anything the table fingerprint can miss. With the memory
+    backend it only reaches the worker that serves the request.
+    """
+    return {"generation": analytics_service.invalidate_cache()}
+
+
+@router.post("/analytics-views/refresh")
+def refresh_analytics_views(db: Session = Depends(get_db)) -> dict:
+    """Refresh the /analytics/compare views after a mart rebuild.
+
+    Call it from the dbt on-run-end hook instead of the cache invalidation
+    above; it invalidates the cache once the views are current.
+    """
+    return {"views": analytics_service.refresh_comparison_views(db)}
@@ -0,0 +1,41 @@
+"""Maintain the app-owned daily_metrics table.
+
+    python -m app.cli.daily_metrics rebuild   # queue every baby, then refresh
+    python -m app.cli.daily_metrics refresh   # drain the queue once
+
+The API processes run the same refresh in the background
+(DAILY_METRICS_WORKER); this is for the initial backfill and for
+deployments that run the worker separately.
+"""
+
+import argparse
+import sys
+import time
+
+from app.core.config import settings
+from app.core.database import get_session_factory
+from app.services import daily_metrics_service
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["rebuild", "refresh"])
+    parser.add_argument("--batch-size", type=int, default=settings.DAILY_METRICS_BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with get_session_factory()() as db:
+        if args.command == "rebuild":
+            print(f"Queued {daily_metrics_service.queue_rebuild(db)} babies")
+        processed = 0
+        while True:
+            batch = daily_metrics_service.refresh_dirty(db, batch_size=args.batch_size)
+            processed += batch
+            if batch < args.batch_size:
+                break
+    print(f"Processed {processed} queued changes in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
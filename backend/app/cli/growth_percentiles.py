@@ -0,0 +1,49 @@
+"""Recompute growth_measurements.percentiles from the WHO growth standards.
+
+    python -m app.cli.growth_percentiles                  # every measurement
+    python -m app.cli.growth_percentiles --missing-only   # only NULL percentiles
+    python -m app.cli.growth_percentiles --after <id>     # resume an interrupted run
+
+New and edited measurements are scored as they're written; run this once
+to replace the old placeholder percentiles, and again after the reference
+tables in app/services/data change or a baby's date of birth or gender
+is corrected. Each chunk is committed
+as it goes; the last id printed is where to resume from.
+"""
+
+import argparse
+import sys
+import time
+from uuid import UUID
+
+from app.core.database import get_session_factory
+from app.services import growth_percentile_service
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--after", type=UUID, help="Resume after this measurement id")
+    parser.add_argument("--missing-only", action="store_true", help="Skip measurements that have percentiles")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    done = 0
+    with get_session_factory()() as db:
+        total = growth_percentile_service.count_pending(db, after=args.after, missing_only=args.missing_only)
+        print(f"{total} measurements to score")
+        for chunk in growth_percentile_service.backfill_percentiles(
+            db, chunk_size=args.chunk_size, after=args.after, missing_only=args.missing_only
+        ):
+            done += chunk["rows"]
+            elapsed = time.perf_counter() - started
+            print(f"{done:>10}/{total} ({done / max(total, 1):>4.0%})  {done / elapsed:>9,.0f} rows/s  "
+                  f"read {chunk['read_s']:.3f}s  score {chunk['score_s']:.3f}s  "
+                  f"write {chunk['write_s']:.3f}s  last id {chunk['last_id']}")
+    elapsed = time.perf_counter() - started
+    print(f"Scored {done} measurements in {elapsed:.2f}s ({done / max(elapsed, 1e-9):,.0f} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
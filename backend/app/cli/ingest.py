@@ -0,0 +1,56 @@
+"""Diff-ingest a tracker export into the source='ingested' rows.
+
+Expects one CSV per table in the export directory (baby_profiles.csv,
+diaper_events.csv, feeding_sessions.csv, sleep_sessions.csv), header row
+first; see app.services.ingest_service for the columns and natural keys.
+
+    python -m app.cli.ingest path/to/export [--dry-run]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from app.core.database import get_session_factory
+from app.services.ingest_service import IngestError, ingest_export
+
+COUNT_COLUMNS = ["copied", "skipped", "duplicates", "inserted", "updated", "deleted"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("export_dir", type=Path, help="Directory holding the export CSVs")
+    parser.add_argument("--dry-run", action="store_true", help="Report the changes, then roll back")
+    args = parser.parse_args()
+
+    if not args.export_dir.is_dir():
+        parser.error(f"{args.export_dir} is not a directory")
+
+    started = time.perf_counter()
+    with get_session_factory()() as db:
+        try:
+            results = ingest_export(db, args.export_dir, dry_run=args.dry_run)
+        except IngestError as exc:
+            print(f"Ingest failed: {exc}", file=sys.stderr)
+            return 1
+    elapsed = time.perf_counter() - started
+
+    if not results:
+        print(f"No export files found in {args.export_dir}")
+        return 1
+
+    print(f"{'table':<18} | " + " | ".join(f"{c:>10}" for c in COUNT_COLUMNS)
+          + f" | {'copy s':>7} | {'apply s':>7}")
+    for r in results:
+        print(f"{r['table']:<18} | " + " | ".join(f"{r[c]:>10}" for c in COUNT_COLUMNS)
+              + f" | {r['copy_s']:>7.3f} | {r['apply_s']:>7.3f}")
+        if r.get("kept"):
+            print(f"  {r['kept']} babies missing from the export were kept: other rows still reference them")
+    verb = "Rolled back (dry run)" if args.dry_run else "Committed"
+    print(f"\n{verb} in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
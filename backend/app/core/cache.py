@@ -0,0 +1,201 @@
+"""Result caches for queries over data that changes rarely.
+
+Two backends with the same interface: LRUCache keeps entries in the
+worker process, RedisCache shares them between workers through REDIS_URL.
+Besides entries, each holds a generation counter; bumping it changes every
+key built from it, which invalidates all entries at once without having
+to find and delete them (old ones age out of the LRU or expire in Redis).
+
+Both backends store values serialized, so every get() returns a fresh
+copy and a caller mutating a result can't change what others are served.
+LRUCache pickles them; RedisCache, whose contents anyone with access to
+the Redis server can write, stores JSON (see _encode) and never unpickles.
+"""
+
+import json
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Thread-safe in-process cache evicting the least recently used entry.
+
+    Values are kept pickled (see the module docstring).
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """The cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            raw = entry[1]
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (expires, raw)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self) -> int:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            return self._generation
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": "memory", "entries": len(self._entries), "hits": self.hits,
+                "misses": self.misses, "generation": self._generation}
+
+
+# JSON for the types query results hold besides JSON's own, tagged so they
+# come back as the same types
+_TAGGED_TYPES = {"$datetime": datetime.fromisoformat, "$date": date.fromisoformat,
+                 "$decimal": Decimal, "$uuid": UUID}
+
+
+def _tag(value: Any) -> Dict[str, str]:
+    if isinstance(value, datetime):  # before date: it's a date subclass
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, UUID):
+        return {"$uuid": str(value)}
+    raise TypeError(f"Can't cache a {type(value).__name__}")
+
+
+def _untag(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        [(key, value)] = obj.items()
+        if key in _TAGGED_TYPES:
+            return _TAGGED_TYPES[key](value)
+    return obj
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, default=_tag, separators=(",", ":")).encode()
+
+
+def _decode(raw: bytes) -> Any:
+    return json.loads(raw, object_hook=_untag)
+
+
+class RedisCache:
+    """Cache shared by all workers through Redis.
+
+    Values are stored as JSON that keeps dates, datetimes, Decimals and
+    UUIDs as such. Redis errors, and values that don't decode, are logged
+    and treated as misses: the caller falls back to running the query.
+
+    The generation key is written without a TTL. Run Redis with a
+    volatile-* maxmemory-policy (e.g. volatile-lru) so that only entries,
+    which all have ANALYTICS_CACHE_TTL_SECONDS, can be evicted. Should the
+    key still disappear, generation() starts it again from the current
+    time rather than 0, so old entries can't come back.
+    """
+
+    def __init__(self, client, *, prefix: str, ttl_seconds: Optional[int] = None):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.client.get(f"{self.prefix}:{key}")
+        except Exception:
+            logger.warning("Redis cache get failed", exc_info=True)
+            raw = None
+        value = None
+        if raw is not None:
+            try:
+                value = _decode(raw)
+            except Exception:  # not JSON, or a malformed tagged value
+                logger.warning("Undecodable Redis cache entry %s:%s", self.prefix, key)
+                raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self.client.set(f"{self.prefix}:{key}", _encode(value), ex=self.ttl_seconds)
+        except Exception:
+            logger.warning("Redis cache set failed", exc_info=True)
+
+    def generation(self) -> Optional[int]:
+        """The current generation, or None if Redis can't be read (then don't use the cache)."""
+        key = f"{self.prefix}:generation"
+        try:
+            value = self.client.get(key)
+            if value is None:
+                # Missing (never set, or lost): start past any generation used before
+                self.client.set(key, time.time_ns(), nx=True)
+                value = self.client.get(key)
+            return int(value)
+        except Exception:
+            logger.warning("Redis cache generation read failed", exc_info=True)
+            return None
+
+    def bump_generation(self) -> Optional[int]:
+        try:
+            self.generation()  # so a lost key restarts from the time, not 0
+            return int(self.client.incr(f"{self.prefix}:generation"))
+        except Exception:
+            # Entries keep their keys and expire with the TTL
+            logger.warning("Redis cache generation bump failed", exc_info=True)
+            return self.generation()
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses,
+                "generation": self.generation()}
+
+
+def build_cache(backend: str, *, prefix: str, max_entries: int, ttl_seconds: Optional[int],
+                redis_url: Optional[str] = None):
+    """A cache for `backend` ("memory", "redis" or "off"; "off" returns None)."""
+    if backend == "off":
+        return None
+    if backend == "redis":
+        import redis
+
+        return RedisCache(redis.Redis.from_url(redis_url), prefix=prefix, ttl_seconds=ttl_seconds)
+    if backend == "memory":
+        return LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unknown cache backend {backend!r}")
@@ -0,0 +1,168 @@
+"""Negotiated response compression (br and gzip).
+
+Starlette's GZipMiddleware only speaks gzip and compresses on the event
+loop, so one 2000-row list blocks every other request on the worker while
+it is deflated. CompressionMiddleware picks the client's preferred
+encoding from Accept-Encoding, using brotli when the `compression` extra
+is installed and gzip otherwise. It leaves bodies under minimum_size as
+they are, and compresses chunks of thread_threshold bytes or more in a
+worker thread.
+
+Only text-like media types are compressed (JSON, NDJSON, Arrow, text/*).
+Streamed responses (NDJSON) are compressed chunk by chunk and flushed
+after each one, so clients still get rows as they are produced. Weak
+ETags are kept as they are, since the representation is unchanged.
+"""
+
+import zlib
+from typing import Dict, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # the `compression` extra isn't installed
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/vnd.apache.arrow.stream",
+    "text/",
+)
+
+# Server preference when the client accepts several equally
+ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str, available: Tuple[str, ...] = ENCODINGS) -> Optional[str]:
+    """The best of `available` for an Accept-Encoding header, or None (identity)."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            weights[name.strip().lower()] = q
+    wildcard = weights.get("*", 0.0)
+    best = max(available, key=lambda e: weights.get(e, wildcard), default=None)
+    if best is None or weights.get(best, wildcard) <= 0:
+        return None
+    return best
+
+
+class Encoder:
+    """An incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, *, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits 16 + 15: gzip header and trailer
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, *, last: bool) -> bytes:
+        """Compress `data`; flushed so far, or finished if `last`."""
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if last else self._brotli.flush())
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Compress responses in the client's preferred encoding (see module docstring)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        thread_threshold: int = 64 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.thread_threshold = thread_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        await _Responder(self, encoding, send)(scope, receive)
+
+
+class _Responder:
+    """One response's pass through CompressionMiddleware."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.encoder: Optional[Encoder] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.send_message)
+
+    async def send_message(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk says how to encode it
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            compressible = headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            self.passthrough = not compressible or "content-encoding" in headers
+            if compressible:
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            if self.encoding is None or (not more_body and len(body) < self.middleware.minimum_size):
+                self.passthrough = True
+                await self._send_start()
+                await self.send(message)
+                return
+            self.encoder = Encoder(
+                self.encoding,
+                gzip_level=self.middleware.gzip_level,
+                brotli_quality=self.middleware.brotli_quality,
+            )
+            headers = MutableHeaders(raw=self.start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            if "content-length" in headers:
+                del headers["Content-Length"]
+
+        compressed = await self._compress(body, last=not more_body)
+        if self.start is not None and not more_body:
+            MutableHeaders(raw=self.start["headers"])["Content-Length"] = str(len(compressed))
+        await self._send_start()
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    async def _compress(self, body: bytes, *, last: bool) -> bytes:
+        if len(body) >= self.middleware.thread_threshold:
+            return await anyio.to_thread.run_sync(lambda: self.encoder.compress(body, last=last))
+        return self.encoder.compress(body, last=last)
+
+    async def _send_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self.send(start)
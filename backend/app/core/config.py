@@ -23,9 +23,84 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "baby_data"
     DATABASE_URL: Optional[PostgresDsn] = None
 
+    # Connection pool, per engine and per worker process. Size workers so
+    # that workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays under Postgres
+    # max_connections; GET /internal/pool shows how much of it is used.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = -1  # seconds before a connection is replaced; -1 = never
+    # Pre-ping costs a round trip per checkout; with it off, set
+    # DB_POOL_RECYCLE below the server/proxy idle timeout instead
+    DB_POOL_PRE_PING: bool = True
+
+    # Read replicas (app.core.replicas), comma-separated. GET requests read
+    # from a healthy one; writes, and reads by a client within
+    # REPLICA_READ_YOUR_WRITES_SECONDS of its last write (a cookie set on
+    # write responses), use the primary.
+    # Replicas failing the health check, or lagging more than
+    # REPLICA_MAX_LAG_SECONDS, are skipped until they recover.
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = 5.0
+    REPLICA_HEALTH_CHECK_SECONDS: float = 10.0
+    REPLICA_MAX_LAG_SECONDS: float = 30.0
+
+    # Serve the CRUD routes with async handlers on an asyncpg engine
+    # (requires the `async` extra). Off by default: sync psycopg2 routes.
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
     # Redis configuration (optional, for caching)
     REDIS_URL: str = "redis://localhost:6379"
+
+    # Cache for the dbt mart queries: "memory" (per worker), "redis"
+    # (REDIS_URL, shared by workers) or "off". Entries are keyed on the
+    # mart's version, so a dbt run invalidates them; the TTL is a backstop.
+    # With "redis", give Redis a volatile-* maxmemory-policy so it only
+    # evicts entries (which have the TTL), never the generation key.
+    ANALYTICS_CACHE: str = "memory"
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 256
+    ANALYTICS_CACHE_TTL_SECONDS: int = 24 * 60 * 60
     
+    # App-maintained daily metrics (app.services.daily_metrics_service).
+    # DAILY_METRICS_SOURCE picks what /analytics/daily-metrics serves:
+    # "mart" (dbt's marts.mart_daily_metrics) or "app" (daily_metrics,
+    # seconds behind writes). Backfill it once with
+    # `python -m app.cli.daily_metrics rebuild` before switching to "app".
+    DAILY_METRICS_SOURCE: str = "mart"
+    # Run the refresh worker in this process; only started when the source
+    # is "app", since nothing reads daily_metrics otherwise
+    DAILY_METRICS_WORKER: bool = True
+    DAILY_METRICS_REFRESH_SECONDS: float = 2.0
+    DAILY_METRICS_BATCH_SIZE: int = 500
+
+    # Response compression (app.core.compression): br with the
+    # `compression` extra installed, else gzip, as the client accepts.
+    # Chunks of COMPRESSION_THREAD_THRESHOLD bytes or more are compressed
+    # in a worker thread rather than on the event loop.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes; smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1-9
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0-11
+    COMPRESSION_THREAD_THRESHOLD: int = 64 * 1024
+
+    # Per-route request count, latency, in-flight and size metrics,
+    # served at /metrics in Prometheus text format (app.core.metrics)
+    METRICS_ENABLED: bool = True
+
+    # SQL statement count and time per request (app.core.query_stats):
+    # sent as a Server-Timing header, with a warning logged for requests
+    # over QUERY_BUDGET statements and for any statement repeated
+    # QUERY_REPEAT_THRESHOLD times in one request (likely N+1)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_BUDGET: int = 20
+    QUERY_REPEAT_THRESHOLD: int = 5
+
+    # Serve the OpenAPI schema and /docs. The schema is built on the first
+    # request for it, not at startup; turn it off in production to skip
+    # both the routes and the schema build.
+    OPENAPI_ENABLED: bool = True
+
     # Timezone
     TIMEZONE: str = "Australia/Sydney"
 
@@ -38,6 +113,15 @@ class Settings(BaseSettings):
         values = info.data
         return f"postgresql://{values.get('POSTGRES_USER')}:{values.get('POSTGRES_PASSWORD')}@{values.get('POSTGRES_SERVER')}/{values.get('POSTGRES_DB')}"
 
+    @field_validator("ASYNC_DATABASE_URL", mode="before")
+    @classmethod
+    def assemble_async_db_connection(cls, v: Optional[str], info) -> Any:
+        if isinstance(v, str):
+            return v
+        # Same database as DATABASE_URL, through the asyncpg driver
+        _, _, rest = str(info.data.get("DATABASE_URL")).partition("://")
+        return f"postgresql+asyncpg://{rest}"
+
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
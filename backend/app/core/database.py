@@ -1,21 +1,154 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+"""Engines, session factories and the get_db dependencies.
+
+Engines are created on first use rather than at import, so importing the
+models (Alembic's env.py, the CLIs, check_feedings.py) or the app itself
+doesn't load the Postgres dialect and driver or build a pool until a
+session is actually needed. get_engine() and get_session_factory() are
+the accessors; the module attributes engine, SessionLocal, async_engine
+and AsyncSessionLocal still work, resolving through them on access.
+
+get_db reads from a replica for GET requests when DATABASE_REPLICA_URLS
+is set (see app.core.replicas). Statements executed with
+bind_arguments={"primary": True}, such as analytics_service.mart_version's
+fingerprint, still read the primary.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.requests import Request
+from starlette.responses import Response
 from app.core.config import settings
+from app.core.pool import PoolStats, instrumented_pool_class
+from app.core.query_stats import instrument_engine
+from app.core.replicas import READ_METHODS, RecentWrites, ReplicaSet, RoutingSession, client_key
+
+# Checkout statistics per engine, exposed at GET /internal/pool
+pool_stats = {"sync": PoolStats(), "async": PoolStats()}
+
+
+def _pool_options() -> dict:
+    return dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """The process's SQLAlchemy engine, created on first call."""
+    engine = create_engine(
+        str(settings.DATABASE_URL),
+        poolclass=instrumented_pool_class(QueuePool, pool_stats["sync"]),
+        **_pool_options(),
+    )
+    if settings.QUERY_STATS_ENABLED:
+        instrument_engine(engine)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_session_factory() -> sessionmaker:
+    # RoutingSession reads from the replica it's given (get_db), else the primary
+    return sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=get_engine())
+
+
+def _replica_engine(name: str, url: str) -> Engine:
+    stats = pool_stats.setdefault(name, PoolStats())
+    engine = create_engine(url, poolclass=instrumented_pool_class(QueuePool, stats), **_pool_options())
+    if settings.QUERY_STATS_ENABLED:
+        instrument_engine(engine)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_replicas() -> ReplicaSet:
+    """The read replicas (none unless DATABASE_REPLICA_URLS is set)."""
+    urls = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    return ReplicaSet(urls, engine_factory=_replica_engine, max_lag_s=settings.REPLICA_MAX_LAG_SECONDS)
 
-# Create SQLAlchemy engine
-engine = create_engine(str(settings.DATABASE_URL), pool_pre_ping=True)
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Clients that wrote recently read from the primary (see get_db)
+recent_writes = RecentWrites(settings.REPLICA_READ_YOUR_WRITES_SECONDS)
+
+
+# Async engine and session factory, only available when DATABASE_ASYNC is
+# on (create_async_engine imports asyncpg, which is an optional dependency)
+@lru_cache(maxsize=None)
+def get_async_engine():
+    if not settings.DATABASE_ASYNC:
+        return None
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, pool_stats["async"]),
+        **_pool_options(),
+    )
+    if settings.QUERY_STATS_ENABLED:
+        instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache(maxsize=None)
+def get_async_session_factory():
+    if not settings.DATABASE_ASYNC:
+        return None
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    # expire_on_commit=False: attributes can't lazy-load after commit in async code
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "SessionLocal": get_session_factory,
+    "async_engine": get_async_engine,
+    "AsyncSessionLocal": get_async_session_factory,
+}
+
+
+def __getattr__(name: str):
+    # Module-level __getattr__ (PEP 562): only called for names not defined above
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Create Base class for models
 Base = declarative_base()
 
-# Dependency to get database session
-def get_db():
-    db = SessionLocal()
+# Dependency to get database session: reads from a replica for GET
+# requests, unless the client wrote within the read-your-writes window.
+# Write requests mark the client as they start, so the mark is on the
+# response and in recent_writes before the client can see the write.
+def get_db(request: Request, response: Response):
+    replicas = get_replicas()
+    client = client_key(request)
+    replica = None
+    if request.method not in READ_METHODS:
+        recent_writes.mark(response, client)
+    elif not recent_writes.wrote_recently(request, client):
+        replica = replicas.choose()
+    db = get_session_factory()(replica=replica)
     try:
         yield db
+    except (exc.OperationalError, exc.InterfaceError) as error:
+        # Out of rotation until the next health check passes
+        if replica is not None:
+            replicas.mark_unhealthy(replica, error)
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Async dependency for the DATABASE_ASYNC routers
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
@@ -0,0 +1,166 @@
+"""Per-route request metrics, served in Prometheus text format at /metrics.
+
+MetricsMiddleware records, for every request, labelled by method and
+route template (/api/v1/feeding/{feeding_id}, not the concrete path, so
+the series stay bounded):
+
+- http_requests_total (also by status code)
+- http_requests_in_progress
+- http_request_duration_seconds, a histogram
+- http_response_size_bytes, a histogram of the bytes sent (after
+  compression, as the middleware sits outside it)
+
+The template is found by matching the path against the app's routes
+before the request runs, so in-flight requests can be counted per route.
+Paths that match no route are grouped under "unmatched". Recording is a
+few dict updates under one lock, reusing the pool's LatencyHistogram.
+Figures are per worker process, like the /internal endpoints.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from starlette.routing import Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.pool import LatencyHistogram
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket upper bounds; the last bucket is +Inf
+DURATION_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+SIZE_BUCKETS_BYTES = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+
+UNMATCHED_ROUTE = "unmatched"
+
+RouteKey = Tuple[str, str]  # (method, route template)
+
+
+class RouteMetrics:
+    """Thread-safe request metrics per (method, route template)."""
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.in_progress: Dict[RouteKey, int] = {}
+        self.durations: Dict[RouteKey, LatencyHistogram] = {}
+        # LatencyHistogram takes any value; here its "ms" are bytes
+        self.sizes: Dict[RouteKey, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def started(self, key: RouteKey) -> None:
+        with self._lock:
+            self.in_progress[key] = self.in_progress.get(key, 0) + 1
+
+    def finished(self, key: RouteKey, status: int, duration_ms: float, size: int) -> None:
+        with self._lock:
+            self.in_progress[key] -= 1
+            self.requests[(*key, status)] = self.requests.get((*key, status), 0) + 1
+            if key not in self.durations:
+                self.durations[key] = LatencyHistogram(DURATION_BUCKETS_MS)
+                self.sizes[key] = LatencyHistogram(SIZE_BUCKETS_BYTES)
+            durations, sizes = self.durations[key], self.sizes[key]
+        durations.observe(duration_ms)
+        sizes.observe(size)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            requests = dict(self.requests)
+            in_progress = dict(self.in_progress)
+            durations = dict(self.durations)
+            sizes = dict(self.sizes)
+        lines = [
+            "# HELP http_requests_total Requests handled, by route template and status.",
+            "# TYPE http_requests_total counter",
+            *(f"http_requests_total{_labels(method=m, route=r, status=s)} {n}"
+              for (m, r, s), n in sorted(requests.items())),
+            "# HELP http_requests_in_progress Requests being handled now.",
+            "# TYPE http_requests_in_progress gauge",
+            *(f"http_requests_in_progress{_labels(method=m, route=r)} {n}"
+              for (m, r), n in sorted(in_progress.items())),
+        ]
+        lines += _histogram("http_request_duration_seconds", "Request latency.", durations, scale=1000)
+        lines += _histogram("http_response_size_bytes", "Response body bytes sent.", sizes, scale=1)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: object) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    """`value` in full: integers without a decimal point, other floats by repr.
+
+    (`:g` keeps 6 significant digits, so a 1048576-byte bound became 1.04858e+06.)
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _histogram(name: str, help_text: str, histograms: Dict[RouteKey, LatencyHistogram], *, scale: float) -> List[str]:
+    """Cumulative buckets, sum and count per route; values divided by `scale`."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for (method, route), histogram in sorted(histograms.items()):
+        snapshot = histogram.snapshot()
+        cumulative = 0
+        for bound, count in snapshot["buckets"].items():
+            cumulative += count
+            le = bound if bound == "+Inf" else _number(float(bound) / scale)
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {_number(snapshot['sum_ms'] / scale)}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {snapshot['count']}")
+    return lines
+
+
+def route_template(router: Router, scope: Scope) -> str:
+    """The path template of the route `scope` goes to, as the router would pick it."""
+    path = scope.get("path", "")
+    partial: Optional[str] = None
+    for route in router.routes:
+        regex = getattr(route, "path_regex", None)
+        if regex is None or not regex.match(path):
+            continue
+        methods = getattr(route, "methods", None)
+        if not methods or scope["method"] in methods:
+            return route.path_format
+        partial = partial or route.path_format  # would be a 405
+    return partial or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Record RouteMetrics for every HTTP request (see module docstring)."""
+
+    def __init__(self, app: ASGIApp, *, router: Router, metrics: RouteMetrics):
+        self.app = app
+        self.router = router
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        key = (scope["method"], route_template(self.router, scope))
+        status, size = 500, 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.started(key)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.finished(key, status, (time.perf_counter() - started) * 1000, size)
+
+
+# The process-wide registry behind /metrics
+metrics = RouteMetrics()
@@ -0,0 +1,119 @@
+"""Connection pool instrumentation.
+
+SQLAlchemy's QueuePool reports how many connections are checked out right
+now, but not how long requests waited for one or how often the pool had
+to open overflow connections. Those are what's needed to size pool_size /
+max_overflow per worker against Postgres max_connections, so the engines
+use a QueuePool subclass that times every checkout into a PoolStats.
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, List, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (ms) of the checkout latency histogram buckets; the last is +Inf
+CHECKOUT_LATENCY_BUCKETS_MS = [0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket histogram of durations in milliseconds."""
+
+    def __init__(self, buckets_ms: List[float]):
+        self.buckets_ms = list(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, duration_ms: float) -> None:
+        index = bisect.bisect_left(self.buckets_ms, duration_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.total_ms += duration_ms
+
+    def snapshot(self) -> Dict[str, object]:
+        """Bucket counts keyed by upper bound ("+Inf" for the overflow bucket)."""
+        with self._lock:
+            counts = list(self.counts)
+            total_ms = self.total_ms
+        labels = [str(b) for b in self.buckets_ms] + ["+Inf"]
+        return {"buckets": dict(zip(labels, counts)), "count": sum(counts), "sum_ms": round(total_ms, 3)}
+
+
+class PoolStats:
+    """Cumulative checkout statistics for one pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.max_wait_ms = 0.0
+        self.checkout_latency = LatencyHistogram(CHECKOUT_LATENCY_BUCKETS_MS)
+        self._lock = threading.Lock()
+
+    def record_checkout(self, wait_ms: float, overflowed: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.overflow_checkouts += overflowed
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.checkout_latency.observe(wait_ms)
+
+    def record_timeout(self, wait_ms: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counters = {
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+        return {**counters, "checkout_latency_ms": self.checkout_latency.snapshot()}
+
+
+class _InstrumentedPoolMixin:
+    """Times QueuePool._do_get, the blocking wait for a free connection."""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        overflow_before = self._overflow
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout((time.perf_counter() - started) * 1000)
+            raise
+        # _overflow counts up from -pool_size; past 0 means a connection
+        # beyond pool_size was opened for this checkout
+        overflowed = self._overflow > 0 and self._overflow > overflow_before
+        self.stats.record_checkout((time.perf_counter() - started) * 1000, overflowed)
+        return conn
+
+
+def instrumented_pool_class(base: Type[QueuePool], stats: PoolStats) -> Type[QueuePool]:
+    """A `base` pool subclass recording into `stats`.
+
+    Bound as a class attribute so the stats survive Pool.recreate(), which
+    SQLAlchemy calls on dispose and builds via self.__class__.
+    """
+    return type(f"Instrumented{base.__name__}", (_InstrumentedPoolMixin, base), {"stats": stats})
+
+
+def pool_status(pool: QueuePool) -> Dict[str, object]:
+    """Live gauges plus cumulative stats for an instrumented pool."""
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "timeout_s": pool.timeout(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool.stats.snapshot(),
+    }
@@ -0,0 +1,120 @@
+"""Per-request SQL statement counts and database time.
+
+Round trips are easy to miss here: CRUDBase.create/update commit and then
+refresh, routes load with get_or_404 before updating, and BabyProfile's
+relationships lazy-load one statement per access. QueryStatsMiddleware
+gives each request a RequestQueries (through a context variable, which
+the threadpool running sync routes inherits), and cursor execute hooks
+on the instrumented engines add every statement and its time to it.
+
+Each response then carries
+
+    Server-Timing: db;dur=12.4;desc="7 queries"
+
+(shown by the browser's network panel). Requests running more than
+`budget` statements are logged as warnings, and so is any statement run
+`repeat_threshold` times or more in one request: the same SQL with
+different parameters is the signature of an N+1 lazy load.
+
+Statements run while a streamed body (NDJSON) is being sent come after
+the headers, so they are in the log but not in Server-Timing.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Longest statement text quoted in the N+1 warning
+STATEMENT_PREVIEW_CHARS = 200
+
+_current: ContextVar[Optional["RequestQueries"]] = ContextVar("request_queries", default=None)
+
+
+class RequestQueries:
+    """Statements run on behalf of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """(statement, times run) for statements run at least `threshold` times."""
+        return [(s, n) for s, n in self.statements.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    queries = _current.get()
+    if queries is not None and conn.info.get("query_started"):
+        started = conn.info["query_started"].pop()
+        queries.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute `engine`'s statements to the current request (sync engines;
+    pass async_engine.sync_engine for an async one)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Collect RequestQueries per HTTP request (see module docstring)."""
+
+    def __init__(self, app: ASGIApp, *, budget: int, repeat_threshold: int):
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        queries = RequestQueries()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", queries.server_timing())
+            await send(message)
+
+        token = _current.set(queries)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            self._report(scope, queries)
+
+    def _report(self, scope: Scope, queries: RequestQueries) -> None:
+        request = f"{scope['method']} {scope['path']}"
+        if queries.count > self.budget:
+            logger.warning(
+                "%s ran %d queries (budget %d) in %.1f ms",
+                request, queries.count, self.budget, queries.total_ms,
+            )
+        for statement, times in queries.repeated(self.repeat_threshold):
+            logger.warning(
+                "%s ran the same statement %d times, likely N+1: %s",
+                request, times, " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS],
+            )
@@ -0,0 +1,240 @@
+"""Read-replica routing for get_db.
+
+With DATABASE_REPLICA_URLS set, get_db gives GET and HEAD requests a
+RoutingSession that reads from a replica (round robin over the healthy
+ones) and sends everything else to the primary. List and analytics
+traffic, including analytics_service's mart queries, then stays off the
+primary. The choice is made once per request, not per statement, so a
+request never mixes data from the two; flushes and INSERT/UPDATE/DELETE
+statements still go to the primary if a GET happens to write.
+
+Read-your-writes: after a write request, the same client reads from the
+primary for REPLICA_READ_YOUR_WRITES_SECONDS, long enough for replication
+to catch up. The write is marked when the request starts, before anything
+is committed, in two places: a short-lived cookie on the response (the
+time until which to read the primary), which holds whichever worker the
+client's next request reaches; and this worker's RecentWrites, keyed on
+the X-Client-Id header, else the address, for clients that drop cookies.
+
+Versions read on the primary: a hot standby keeps no statistics of its
+own, so pg_stat_user_tables counters there don't move when the mart is
+rebuilt. analytics_service.mart_version() therefore reads its fingerprint
+from the primary (bind_arguments={"primary": True}), along with the
+primary's WAL position, and read_replayed_or_primary() sends the rest of
+the request to the primary unless the replica has replayed up to that
+position. Rows read from a replica are then never cached or ETagged under
+a version newer than themselves.
+
+Failover: a background task checks each replica every
+REPLICA_HEALTH_CHECK_SECONDS (a round trip, plus replay lag on Postgres)
+and takes replicas that fail or lag more than REPLICA_MAX_LAG_SECONDS
+out of rotation until they pass again. A request that loses its replica
+connection takes it out at once. With no healthy replica, reads go to
+the primary.
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import anyio
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+CLIENT_ID_HEADER = "X-Client-Id"
+
+# Set on write responses: the Unix time until which to read the primary
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+# Requests that only read, and so may use a replica
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+# Seconds a replica is behind; 0 when it has replayed all it received
+# (pg_last_xact_replay_timestamp alone grows while the primary is idle)
+_LAG_QUERY = text("""
+    select case
+        when not pg_is_in_recovery() then 0
+        when pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() then 0
+        else coalesce(extract(epoch from now() - pg_last_xact_replay_timestamp()), 0)
+    end
+""")
+
+
+# Whether this standby has replayed the primary's WAL up to :lsn (NULL,
+# so false, when it isn't a standby)
+_REPLAYED_QUERY = text("select pg_last_wal_replay_lsn() >= cast(:lsn as pg_lsn)")
+
+
+class RoutingSession(Session):
+    """A Session that reads from `replica` when one is given.
+
+    Flushes and DML always use the session's own bind, the primary, as do
+    statements executed with bind_arguments={"primary": True}.
+    """
+
+    def __init__(self, *args, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+
+    def get_bind(self, mapper=None, *, clause=None, primary: bool = False, **kwargs):
+        if (
+            self.replica is not None
+            and not primary
+            and not self._flushing
+            and not getattr(clause, "is_dml", False)
+        ):
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def read_replayed_or_primary(db: Session, lsn: str) -> None:
+    """Read the rest of `db`'s work from the primary unless its replica has replayed `lsn`.
+
+    `lsn` is a primary WAL position (pg_current_wal_lsn()) taken when a
+    version of the data was read there; see the module docstring.
+    """
+    if not isinstance(db, RoutingSession) or db.replica is None:
+        return
+    if not db.execute(_REPLAYED_QUERY, {"lsn": lsn}).scalar():
+        db.replica = None
+
+
+class Replica:
+    """One replica URL, its engine (created on first use) and its health."""
+
+    def __init__(self, name: str, url: str, engine_factory: Callable[[str, str], Engine]):
+        self.name = name
+        self.url = url
+        self.healthy = True
+        self.error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+        self._engine_factory = engine_factory
+        self._engine: Optional[Engine] = None
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            self._engine = self._engine_factory(self.name, self.url)
+        return self._engine
+
+
+class ReplicaSet:
+    """The configured replicas, with round-robin choice over healthy ones."""
+
+    def __init__(self, urls: List[str], *, engine_factory: Callable[[str, str], Engine], max_lag_s: float):
+        self.replicas = [
+            Replica(f"replica-{index}", url, engine_factory) for index, url in enumerate(urls)
+        ]
+        self.max_lag_s = max_lag_s
+        self._next = itertools.count()
+
+    def choose(self) -> Optional[Engine]:
+        """A healthy replica's engine, or None to read from the primary."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._next) % len(healthy)].engine
+
+    def mark_unhealthy(self, engine: Engine, error: BaseException) -> None:
+        for replica in self.replicas:
+            if replica._engine is engine and replica.healthy:
+                replica.healthy, replica.error = False, repr(error)
+                logger.warning("Read replica %s failed, reading from the primary: %r", replica.name, error)
+
+    def check(self) -> None:
+        """Check every replica now and update its health."""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    if conn.dialect.name == "postgresql":
+                        lag = float(conn.execute(_LAG_QUERY).scalar())
+                    else:
+                        conn.execute(text("select 1"))
+                        lag = 0.0
+                error = f"lagging {lag:.1f}s" if lag > self.max_lag_s else None
+            except Exception as exc:  # any failure takes it out of rotation
+                error = repr(exc)
+            if replica.healthy and error:
+                logger.warning("Read replica %s is unhealthy: %s", replica.name, error)
+            elif not replica.healthy and not error:
+                logger.info("Read replica %s is healthy again", replica.name)
+            replica.healthy, replica.error = error is None, error
+            replica.checked_at = time.time()
+
+    def status(self) -> Dict[str, Dict[str, object]]:
+        return {
+            replica.name: {"healthy": replica.healthy, "error": replica.error, "checked_at": replica.checked_at}
+            for replica in self.replicas
+        }
+
+
+async def run_health_checks(replicas: ReplicaSet, *, interval: float) -> None:
+    """Check `replicas` every `interval` seconds, off the event loop."""
+    while True:
+        await anyio.to_thread.run_sync(replicas.check)
+        await asyncio.sleep(interval)
+
+
+class RecentWrites:
+    """Clients that made a write request in the last `window_s` seconds.
+
+    record() and recent() track clients in this worker; mark() and
+    wrote_recently() also carry the write in a cookie, for the others.
+    """
+
+    def __init__(self, window_s: float, clock: Callable[[], float] = time.time):
+        self.window_s = window_s
+        self._clock = clock
+        self._written: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, client: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._written[client] = now
+            self._written.move_to_end(client)
+            # Oldest first, so expired entries are dropped from the front
+            while self._written and next(iter(self._written.values())) < now - self.window_s:
+                self._written.popitem(last=False)
+
+    def recent(self, client: str) -> bool:
+        with self._lock:
+            written = self._written.get(client)
+        return written is not None and written >= self._clock() - self.window_s
+
+    def mark(self, response: Response, client: str) -> None:
+        """Record a write starting now, here and in a cookie on `response`."""
+        self.record(client)
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            f"{self._clock() + self.window_s:.3f}",
+            max_age=math.ceil(self.window_s),
+            httponly=True,
+            samesite="lax",
+        )
+
+    def wrote_recently(self, request: Request, client: str) -> bool:
+        """Whether `request`'s client wrote within the window, in any worker."""
+        try:
+            until = float(request.cookies.get(READ_PRIMARY_COOKIE, ""))
+        except ValueError:
+            until = 0.0
+        return until >= self._clock() or self.recent(client)
+
+
+def client_key(request: Request) -> str:
+    """Who made the request, for read-your-writes."""
+    client_id = request.headers.get(CLIENT_ID_HEADER)
+    if client_id:
+        return f"id:{client_id}"
+    return f"addr:{request.client.host if request.client else ''}"
@@ -1,17 +1,69 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.metrics import PROMETHEUS_MEDIA_TYPE, MetricsMiddleware, metrics
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.database import get_replicas, get_session_factory
+from app.core.replicas import run_health_checks
+from app.services import daily_metrics_service
+from app.services.etag import ETAG_HEADER
+from app.services.pagination import NEXT_CURSOR_HEADER
 
 # Import routers
-from app.api import analytics, babies, feeding, sleep, diaper, growth, health
+from app.api import analytics, babies, feeding, sleep, diaper, growth, health, internal
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep daily_metrics current in the background while it's served (one
+    # worker per process; they share the queue safely)
+    tasks = []
+    if settings.DAILY_METRICS_WORKER and settings.DAILY_METRICS_SOURCE == "app":
+        tasks.append(asyncio.create_task(daily_metrics_service.run_worker(
+            get_session_factory(),
+            interval=settings.DAILY_METRICS_REFRESH_SECONDS,
+            batch_size=settings.DAILY_METRICS_BATCH_SIZE,
+        )))
+    # Take failing or lagging read replicas out of rotation, and back in
+    if get_replicas().replicas:
+        tasks.append(asyncio.create_task(run_health_checks(
+            get_replicas(), interval=settings.REPLICA_HEALTH_CHECK_SECONDS
+        )))
+    yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
 
 app = FastAPI(
     title="Baby Data API",
     description="Modern baby data tracking API built with FastAPI",
     version="0.1.0",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json" if settings.OPENAPI_ENABLED else None,
+    lifespan=lifespan,
 )
 
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        budget=settings.QUERY_BUDGET,
+        repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+    )
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        thread_threshold=settings.COMPRESSION_THREAD_THRESHOLD,
+    )
+
 # CORS middleware for frontend integration
 app.add_middleware(
     CORSMiddleware,
@@ -19,8 +71,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
 )
 
+# Outermost, so latency and response sizes cover everything above
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, router=app.router, metrics=metrics)
+
 @app.get("/")
 async def root():
     return {"message": "Baby Data API - Ready to track your little one's data! 👶"}
@@ -29,11 +86,24 @@ async def root():
 async def health_check():
     return {"status": "healthy", "version": "0.1.0"}
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> Response:
+    """Per-route request metrics of this worker, for Prometheus to scrape."""
+    return Response(metrics.render(), media_type=PROMETHEUS_MEDIA_TYPE)
+
 # Include routers
-app.include_router(babies.router, prefix=f"{settings.API_V1_STR}/babies", tags=["babies"])
-app.include_router(feeding.router, prefix=f"{settings.API_V1_STR}/feeding", tags=["feeding"])
-app.include_router(sleep.router, prefix=f"{settings.API_V1_STR}/sleep", tags=["sleep"])
-app.include_router(diaper.router, prefix=f"{settings.API_V1_STR}/diaper", tags=["diaper"])
-app.include_router(growth.router, prefix=f"{settings.API_V1_STR}/growth", tags=["growth"])
-app.include_router(health.router, prefix=f"{settings.API_V1_STR}/health", tags=["health"])
-app.include_router(analytics.router, prefix=f"{settings.API_V1_STR}/analytics", tags=["analytics"])
\ No newline at end of file
+if settings.DATABASE_ASYNC:
+    from app.api.async_routes import ROUTERS as crud_routers
+else:
+    crud_routers = {
+        "babies": babies.router,
+        "feeding": feeding.router,
+        "sleep": sleep.router,
+        "diaper": diaper.router,
+        "growth": growth.router,
+        "health": health.router,
+    }
+for name, router in crud_routers.items():
+    app.include_router(router, prefix=f"{settings.API_V1_STR}/{name}", tags=[name])
+app.include_router(analytics.router, prefix=f"{settings.API_V1_STR}/analytics", tags=["analytics"])
+app.include_router(internal.router, prefix="/internal", tags=["internal"])
@@ -6,6 +6,7 @@ from .feeding import FeedingSession
 from .sleep import SleepSession
 from .growth import GrowthMeasurement
 from .health import HealthEvent
+from .daily_metrics import DailyMetric, DailyMetricsDirty
 
 __all__ = [
     "BaseModel",
@@ -16,4 +17,6 @@ __all__ = [
     "SleepSession",
     "GrowthMeasurement",
     "HealthEvent",
+    "DailyMetric",
+    "DailyMetricsDirty",
 ]
\ No newline at end of file
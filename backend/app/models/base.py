@@ -42,9 +42,12 @@ class BabyEventModel(BaseModel):
     Note: Subclasses must define:
         baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id"), nullable=False)
         baby = relationship("BabyProfile", back_populates="<event_type>")
+        event_time_field = "<column>"  # when the event happened; lists sort on it
 
     The baby_id column and relationship must be defined in subclasses to allow
     unique back_populates values for each event type.
     """
 
     __abstract__ = True
+
+    event_time_field: str
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class DailyMetric(Base):
+    """One baby's metrics for one local day, kept current by the app.
+
+    Same shape as marts.mart_daily_metrics (see DailyMetricsRow), but
+    recomputed a (baby, day) at a time by daily_metrics_service as events
+    change instead of rebuilt by dbt.
+    """
+
+    __tablename__ = "daily_metrics"
+
+    # Deleting a baby deletes its metrics; the worker needn't run first
+    baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id", ondelete="CASCADE"), primary_key=True)
+    metric_date = Column(Date, primary_key=True)
+    baby_name = Column(String(100), nullable=False)
+    age_days = Column(Integer, nullable=False)
+    age_weeks = Column(Integer, nullable=False)
+
+    night_sleep_minutes = Column(Integer, nullable=False)
+    night_sleep_segments = Column(Integer, nullable=True)
+    longest_night_stretch_minutes = Column(Integer, nullable=True)
+    night_waking_count = Column(Integer, nullable=True)
+    awake_at_night_minutes = Column(Integer, nullable=True)
+    nap_count = Column(Integer, nullable=False)
+    total_nap_minutes = Column(Integer, nullable=False)
+    avg_nap_minutes = Column(Integer, nullable=True)
+
+    feed_count = Column(Integer, nullable=False)
+    breast_feed_count = Column(Integer, nullable=False)
+    bottle_feed_count = Column(Integer, nullable=False)
+    total_volume_ml = Column(Integer, nullable=True)
+    avg_feed_interval_minutes = Column(Integer, nullable=True)
+    avg_wake_window_minutes = Column(Integer, nullable=True)
+    max_wake_window_minutes = Column(Integer, nullable=True)
+
+    diaper_count = Column(Integer, nullable=False)
+    wet_diaper_count = Column(Integer, nullable=False)
+    dirty_diaper_count = Column(Integer, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DailyMetric(baby_id='{self.baby_id}', date='{self.metric_date}')>"
+
+
+class DailyMetricsDirty(Base):
+    """A change awaiting recomputation of daily_metrics.
+
+    Written in the same transaction as the event change. event_time is the
+    changed event's (UTC) time; the worker maps it to the baby's local day.
+    NULL means every day of the baby (e.g. its timezone changed).
+    """
+
+    __tablename__ = "daily_metrics_dirty"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    baby_id = Column(UUID(as_uuid=True), nullable=False)
+    event_time = Column(DateTime, nullable=True)
+    marked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DailyMetricsDirty(baby_id='{self.baby_id}', event_time='{self.event_time}')>"
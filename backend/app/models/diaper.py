@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -41,6 +41,7 @@ class DiaperEvent(BabyEventModel):
     """Diaper change event model tracking urine, stool, and diaper type."""
 
     __tablename__ = "diaper_events"
+    event_time_field = "timestamp"
 
     baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id"), nullable=False)
     timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -59,6 +60,10 @@ class DiaperEvent(BabyEventModel):
 
     notes = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("ix_diaper_events_baby_id_timestamp", baby_id, timestamp.desc()),
+    )
+
     # Relationships
     baby = relationship("BabyProfile", back_populates="diaper_events")
 
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -30,6 +30,7 @@ class FeedingSession(BabyEventModel):
     """Feeding session model supporting breast, bottle, and solid feeding."""
 
     __tablename__ = "feeding_sessions"
+    event_time_field = "start_time"
 
     baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id"), nullable=False)
     start_time = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -52,6 +53,10 @@ class FeedingSession(BabyEventModel):
 
     notes = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("ix_feeding_sessions_baby_id_start_time", baby_id, start_time.desc()),
+    )
+
     # Relationships
     baby = relationship("BabyProfile", back_populates="feeding_sessions")
 
@@ -1,7 +1,7 @@
 import enum
 from datetime import date
 
-from sqlalchemy import Column, Date, Enum, Float, ForeignKey, JSON, String, Text
+from sqlalchemy import Column, Date, Enum, Float, ForeignKey, Index, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,6 +19,7 @@ class GrowthMeasurement(BabyEventModel):
     """Growth measurement model tracking weight, length, and head circumference."""
 
     __tablename__ = "growth_measurements"
+    event_time_field = "measurement_date"
 
     baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id"), nullable=False)
     measurement_date = Column(Date, nullable=False, default=date.today)
@@ -37,31 +38,27 @@ class GrowthMeasurement(BabyEventModel):
 
     notes = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("ix_growth_measurements_baby_id_measurement_date", baby_id, measurement_date.desc()),
+    )
+
     # Relationships
     baby = relationship("BabyProfile", back_populates="growth_measurements")
 
     def calculate_percentiles(self, baby_age_days: int, baby_gender: str):
         """
-        Calculate percentiles based on baby's age and gender.
-        This would use WHO growth charts or similar reference data.
-        For now, this is a placeholder for the calculation logic.
+        Set percentiles from the WHO growth standards for the baby's age and gender.
+        Measurements that can't be scored (e.g. past 24 months) are left out.
+        growth_service already does this on create and update; to score many
+        measurements, use growth_standards.percentile_records directly.
         """
-        # TODO: Implement actual percentile calculation using WHO growth charts
-        # This would involve comparing the measurements against reference data
-        # based on the baby's age in days and gender
-        percentiles = {}
-        
-        if self.weight_kg:
-            # Placeholder calculation - replace with actual WHO chart lookup
-            percentiles["weight"] = 50  # Default to 50th percentile as placeholder
-            
-        if self.length_cm:
-            percentiles["length"] = 50
-            
-        if self.head_circumference_cm:
-            percentiles["head_circumference"] = 50
-            
-        self.percentiles = percentiles
+        from app.services.growth_standards import MEASUREMENT_COLUMNS, percentile_records
+
+        self.percentiles = percentile_records(
+            [baby_age_days],
+            [baby_gender],
+            {column: [getattr(self, column)] for column in MEASUREMENT_COLUMNS.values()},
+        )[0]
 
     def __repr__(self):
         return f"<GrowthMeasurement(baby_id='{self.baby_id}', date='{self.measurement_date}', weight={self.weight_kg}kg)>"
\ No newline at end of file
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, JSON, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -22,6 +22,7 @@ class HealthEvent(BabyEventModel):
     """Health event model for tracking medical events, vaccinations, and milestones."""
 
     __tablename__ = "health_events"
+    event_time_field = "event_date"
 
     baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id"), nullable=False)
     event_date = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -44,6 +45,10 @@ class HealthEvent(BabyEventModel):
 
     notes = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("ix_health_events_baby_id_event_date", baby_id, event_date.desc()),
+    )
+
     # Relationships
     baby = relationship("BabyProfile", back_populates="health_events")
 
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, JSON, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, JSON, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -42,6 +42,7 @@ class SleepSession(BabyEventModel):
     """Sleep session model tracking naps and nighttime sleep."""
 
     __tablename__ = "sleep_sessions"
+    event_time_field = "start_time"
 
     baby_id = Column(UUID(as_uuid=True), ForeignKey("baby_profiles.id"), nullable=False)
     start_time = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -56,6 +57,10 @@ class SleepSession(BabyEventModel):
     wake_reason = Column(Enum(WakeReason), nullable=True)
     notes = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("ix_sleep_sessions_baby_id_start_time", baby_id, start_time.desc()),
+    )
+
     # Relationships
     baby = relationship("BabyProfile", back_populates="sleep_sessions")
 
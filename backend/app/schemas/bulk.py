@@ -0,0 +1,27 @@
+"""Request limits and response schemas for the bulk create endpoints."""
+
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+# Upper bound on items per POST /{resource}/bulk request
+BULK_MAX_ITEMS = 5000
+
+ResponseT = TypeVar("ResponseT")
+
+
+class BulkItemResult(BaseModel, Generic[ResponseT]):
+    """Outcome for the item at `index` of the request body.
+
+    Exactly one of `created` / `errors` is set.
+    """
+    index: int
+    created: Optional[ResponseT] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class BulkCreateResponse(BaseModel, Generic[ResponseT]):
+    """Per-item results of a bulk create, in request order."""
+    created_count: int
+    error_count: int
+    results: List[BulkItemResult[ResponseT]]
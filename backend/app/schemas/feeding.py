@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import ClassVar, Dict, List, Optional, Tuple
 from uuid import UUID
 from pydantic import BaseModel, Field, field_validator, model_validator, computed_field
 from app.models.feeding import FeedingType, BreastSide, Appetite
@@ -94,6 +94,13 @@ class FeedingSessionUpdate(BaseModel):
 class FeedingSessionResponse(FeedingSessionFields, BabyEventResponseBase):
     """Response schema for feeding sessions (no input validators)."""
 
+    # Fields each computed field reads, for ?fields= (see app.services.serialization)
+    computed_field_sources: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "duration_minutes": (
+            "start_time", "end_time", "feeding_type", "left_breast_duration", "right_breast_duration"
+        ),
+    }
+
     @computed_field
     @property
     def duration_minutes(self) -> Optional[int]:
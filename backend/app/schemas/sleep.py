@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Any, ClassVar, Dict, Optional, Tuple
 from uuid import UUID
 from pydantic import BaseModel, Field, computed_field
 from app.models.sleep import SleepType, SleepLocation, SleepQuality, WakeReason
@@ -50,6 +50,11 @@ class SleepSessionUpdate(BaseModel):
 class SleepSessionResponse(SleepSessionFields, BabyEventResponseBase):
     """Response schema for sleep sessions (no input validators)."""
 
+    # Fields each computed field reads, for ?fields= (see app.services.serialization)
+    computed_field_sources: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "duration_minutes": ("start_time", "end_time"),
+    }
+
     @computed_field
     @property
     def duration_minutes(self) -> Optional[int]:
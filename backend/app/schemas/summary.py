@@ -0,0 +1,42 @@
+"""Response schema for a baby's daily summary."""
+
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DailySummaryResponse(BaseModel):
+    """Counts and totals for one local day of a baby's events.
+
+    The day runs from local midnight to local midnight in `timezone` (the
+    baby's); day_start and day_end are those instants in UTC. Sleep
+    minutes cover sleeps that started that day and have ended.
+    """
+    baby_id: UUID
+    date: date
+    timezone: str
+    day_start: datetime
+    day_end: datetime
+
+    feed_count: int
+    breast_feed_count: int
+    bottle_feed_count: int
+    solid_feed_count: int
+    total_volume_ml: int
+
+    sleep_count: int
+    ongoing_sleep_count: int
+    total_sleep_minutes: int
+    longest_sleep_minutes: Optional[int] = None
+
+    diaper_count: int
+    wet_diaper_count: int
+    dirty_diaper_count: int
+
+    health_event_count: int
+
+    # Most recent weight on or before `date`
+    latest_weight_kg: Optional[float] = None
+    latest_weight_date: Optional[date] = None
@@ -0,0 +1,67 @@
+"""Response schemas for the merged per-baby timeline."""
+
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from app.schemas.diaper import DiaperEventResponse
+from app.schemas.feeding import FeedingSessionResponse
+from app.schemas.growth import GrowthMeasurementResponse
+from app.schemas.health import HealthEventResponse
+from app.schemas.sleep import SleepSessionResponse
+
+TimelineEventType = Literal["feeding", "sleep", "diaper", "growth", "health"]
+
+
+class FeedingTimelineItem(BaseModel):
+    event_type: Literal["feeding"] = "feeding"
+    event_time: datetime
+    event: FeedingSessionResponse
+
+
+class SleepTimelineItem(BaseModel):
+    event_type: Literal["sleep"] = "sleep"
+    event_time: datetime
+    event: SleepSessionResponse
+
+
+class DiaperTimelineItem(BaseModel):
+    event_type: Literal["diaper"] = "diaper"
+    event_time: datetime
+    event: DiaperEventResponse
+
+
+class GrowthTimelineItem(BaseModel):
+    """Growth measurements are dated, so event_time is midnight of that day."""
+    event_type: Literal["growth"] = "growth"
+    event_time: datetime
+    event: GrowthMeasurementResponse
+
+
+class HealthTimelineItem(BaseModel):
+    event_type: Literal["health"] = "health"
+    event_time: datetime
+    event: HealthEventResponse
+
+
+TimelineItem = Annotated[
+    Union[
+        FeedingTimelineItem,
+        SleepTimelineItem,
+        DiaperTimelineItem,
+        GrowthTimelineItem,
+        HealthTimelineItem,
+    ],
+    Field(discriminator="event_type"),
+]
+
+
+class TimelineResponse(BaseModel):
+    """One page of a baby's events, newest first.
+
+    Pass next_cursor back as ?cursor= for the following page; it is null
+    on the last page.
+    """
+    items: List[TimelineItem]
+    next_cursor: Optional[str] = None
@@ -3,12 +3,16 @@
 Provides pre-configured service instances for each model type.
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.services.async_base import AsyncCRUDBase
 from app.services.base import CRUDBase
+from app.services.daily_metrics_service import mark_dirty
 from app.models import (
     BabyProfile,
     DiaperEvent,
@@ -43,6 +47,7 @@ class BabyCRUD(CRUDBase[BabyProfile, BabyProfileCreate, BabyProfileUpdate]):
         skip: int = 0,
         limit: int = 100,
         is_active: bool = True,
+        cursor: Optional[str] = None,
         **kwargs
     ) -> List[BabyProfile]:
         """Get babies with optional active filter, ordered by name.
@@ -52,6 +57,7 @@ class BabyCRUD(CRUDBase[BabyProfile, BabyProfileCreate, BabyProfileUpdate]):
             skip: Number of records to skip.
             limit: Maximum number of records to return.
             is_active: Filter by active status (default True).
+            cursor: Optional keyset cursor from next_cursor().
 
         Returns:
             List of baby profiles matching the criteria.
@@ -59,7 +65,46 @@ class BabyCRUD(CRUDBase[BabyProfile, BabyProfileCreate, BabyProfileUpdate]):
         query = db.query(self.model)
         if is_active is not None:
             query = query.filter(self.model.is_active == is_active)
-        return query.order_by(self.model.name).offset(skip).limit(limit).all()
+        return self._paginate(
+            query, self.model.name, order_desc=False, skip=skip, limit=limit, cursor=cursor
+        ).all()
+
+    def next_cursor(
+        self,
+        items: List[BabyProfile],
+        *,
+        limit: int,
+        order_by_field: str = "name"
+    ) -> Optional[str]:
+        """Cursor for the page after `items`; babies are paged by name."""
+        return super().next_cursor(items, limit=limit, order_by_field=order_by_field)
+
+    def _cursor_fields(self, order_by_field: str = "name") -> Tuple[str, str]:
+        return super()._cursor_fields(order_by_field)
+
+    def list_statement(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool = True,
+        cursor: Optional[str] = None,
+        **kwargs
+    ) -> Select:
+        """get_multi's query as a Core select(); arguments as for get_multi."""
+        stmt = select(self.model)
+        if is_active is not None:
+            stmt = stmt.filter(self.model.is_active == is_active)
+        return self._paginate(
+            stmt, self.model.name, order_desc=False, skip=skip, limit=limit, cursor=cursor
+        )
+
+    def _list_stats_statement(self, *, is_active: bool = True, **kwargs) -> Select:
+        """count(*), max(updated_at) over the babies get_multi lists."""
+        stmt = select(func.count(), func.max(self.model.updated_at)).select_from(self.model)
+        if is_active is not None:
+            stmt = stmt.filter(self.model.is_active == is_active)
+        return stmt
 
     def remove(self, db: Session, *, id: UUID) -> BabyProfile:
         """Soft-delete by setting is_active=False.
@@ -81,21 +126,93 @@ class BabyCRUD(CRUDBase[BabyProfile, BabyProfileCreate, BabyProfileUpdate]):
         return obj
 
 
-# Service instances - one per model type
-baby_service = BabyCRUD(BabyProfile)
-diaper_service = CRUDBase[DiaperEvent, DiaperEventCreate, DiaperEventUpdate](DiaperEvent)
-feeding_service = CRUDBase[FeedingSession, FeedingSessionCreate, FeedingSessionUpdate](FeedingSession)
-sleep_service = CRUDBase[SleepSession, SleepSessionCreate, SleepSessionUpdate](SleepSession)
-growth_service = CRUDBase[GrowthMeasurement, GrowthMeasurementCreate, GrowthMeasurementUpdate](GrowthMeasurement)
+class AsyncBabyCRUD(AsyncCRUDBase[BabyProfile, BabyProfileCreate, BabyProfileUpdate]):
+    """BabyCRUD for AsyncSession: name ordering and soft delete."""
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool = True,
+        cursor: Optional[str] = None,
+        **kwargs
+    ) -> List[BabyProfile]:
+        """Get babies with optional active filter, ordered by name."""
+        stmt = self.list_statement(skip=skip, limit=limit, is_active=is_active, cursor=cursor)
+        return list(await db.scalars(stmt))
+
+    def next_cursor(
+        self,
+        items: List[BabyProfile],
+        *,
+        limit: int,
+        order_by_field: str = "name"
+    ) -> Optional[str]:
+        """Cursor for the page after `items`; babies are paged by name."""
+        return super().next_cursor(items, limit=limit, order_by_field=order_by_field)
+
+    def _cursor_fields(self, order_by_field: str = "name") -> Tuple[str, str]:
+        return super()._cursor_fields(order_by_field)
+
+    list_statement = BabyCRUD.list_statement
+    _list_stats_statement = BabyCRUD._list_stats_statement
+
+    async def remove(self, db: AsyncSession, *, id: UUID) -> BabyProfile:
+        """Soft-delete by setting is_active=False.
+
+        Raises:
+            HTTPException: 404 if baby not found.
+        """
+        obj = await self.get_or_404(db, id)
+        obj.is_active = False
+        await db.commit()
+        await db.refresh(obj)
+        return obj
+
+
+def score_percentiles(db: Session, values: List[Dict[str, Any]]) -> None:
+    """Write hook setting GrowthMeasurement.percentiles (see growth_percentile_service)."""
+    # Imported on first write: it loads numpy, which app startup doesn't need
+    from app.services.growth_percentile_service import score_new_values
+
+    score_new_values(db, values)
+
+
+# Service instances - one per model type. Writes to the models behind
+# daily_metrics queue the affected days for recomputation, and growth
+# measurements are scored against the WHO standards as they're written.
+baby_service = BabyCRUD(BabyProfile, change_listeners=[mark_dirty])
+diaper_service = CRUDBase[DiaperEvent, DiaperEventCreate, DiaperEventUpdate](DiaperEvent, change_listeners=[mark_dirty])
+feeding_service = CRUDBase[FeedingSession, FeedingSessionCreate, FeedingSessionUpdate](FeedingSession, change_listeners=[mark_dirty])
+sleep_service = CRUDBase[SleepSession, SleepSessionCreate, SleepSessionUpdate](SleepSession, change_listeners=[mark_dirty])
+growth_service = CRUDBase[GrowthMeasurement, GrowthMeasurementCreate, GrowthMeasurementUpdate](GrowthMeasurement, write_hooks=[score_percentiles])
 health_service = CRUDBase[HealthEvent, HealthEventCreate, HealthEventUpdate](HealthEvent)
 
+# Async counterparts used by the DATABASE_ASYNC routers
+async_baby_service = AsyncBabyCRUD(BabyProfile, change_listeners=[mark_dirty])
+async_diaper_service = AsyncCRUDBase[DiaperEvent, DiaperEventCreate, DiaperEventUpdate](DiaperEvent, change_listeners=[mark_dirty])
+async_feeding_service = AsyncCRUDBase[FeedingSession, FeedingSessionCreate, FeedingSessionUpdate](FeedingSession, change_listeners=[mark_dirty])
+async_sleep_service = AsyncCRUDBase[SleepSession, SleepSessionCreate, SleepSessionUpdate](SleepSession, change_listeners=[mark_dirty])
+async_growth_service = AsyncCRUDBase[GrowthMeasurement, GrowthMeasurementCreate, GrowthMeasurementUpdate](GrowthMeasurement, write_hooks=[score_percentiles])
+async_health_service = AsyncCRUDBase[HealthEvent, HealthEventCreate, HealthEventUpdate](HealthEvent)
+
 __all__ = [
     "CRUDBase",
+    "AsyncCRUDBase",
     "BabyCRUD",
+    "AsyncBabyCRUD",
     "baby_service",
     "diaper_service",
     "feeding_service",
     "sleep_service",
     "growth_service",
     "health_service",
+    "async_baby_service",
+    "async_diaper_service",
+    "async_feeding_service",
+    "async_sleep_service",
+    "async_growth_service",
+    "async_health_service",
 ]
@@ -2,9 +2,22 @@
 
 marts.mart_daily_metrics is owned by the dbt-baby-data repo and refreshed
 with `dbt run`; it is not a SQLAlchemy model, so these queries use raw SQL.
+
+The mart only changes when dbt runs, so results are cached (see
+ANALYTICS_CACHE) under a key that includes mart_version(). That changes
+when dbt rebuilds or modifies the table, or when invalidate_cache() is
+called (POST /internal/analytics-cache/invalidate, e.g. from a dbt
+on-run-end hook).
+
+The /analytics/compare aggregates are served from materialized views that
+refresh_comparison_views() brings up to date after each mart rebuild
+(POST /internal/analytics-views/refresh). Their results are versioned on
+the views' fingerprints as well as the mart's, so rows read from a view
+before its refresh are never cached under the rebuilt mart's version.
 """
 
-from typing import List, Optional
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -12,8 +25,42 @@ from sqlalchemy import text
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
 
+from app.core.cache import build_cache
+from app.core.config import settings
+from app.core.replicas import read_replayed_or_primary
+from app.models import DailyMetric
+from app.services import daily_metrics_service
+
 DAILY_METRICS_TABLE = "marts.mart_daily_metrics"
 
+# A dict per row, or {column name: values} for columnar=True (Arrow responses)
+Rows = Union[List[dict], Dict[str, List[Any]]]
+
+result_cache = build_cache(
+    settings.ANALYTICS_CACHE,
+    prefix="analytics",
+    max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+    redis_url=settings.REDIS_URL,
+)
+
+# One row per relation, in order. A table-materialized dbt model (or a
+# recreated view) gets a new OID on every build; the write counters catch
+# incremental models updated in place and concurrent view refreshes. oid
+# is NULL if the relation doesn't exist.
+# Run on the primary: a standby's pg_stat_user_tables doesn't count the
+# writes it replays. lsn is where the primary's WAL was at the time.
+_FINGERPRINT_QUERY = text("""
+    select
+        c.oid::bigint as oid,
+        coalesce(s.n_tup_ins + s.n_tup_upd + s.n_tup_del, 0) as writes,
+        pg_current_wal_lsn()::text as lsn
+    from unnest(cast(:relations as text[])) with ordinality as r(name, position)
+    left join pg_class c on c.oid = to_regclass(r.name)
+    left join pg_stat_user_tables s on s.relid = c.oid
+    order by r.position
+""")
+
 _DAILY_QUERY = text(f"""
     select *
     from {DAILY_METRICS_TABLE}
@@ -29,7 +76,12 @@ _DAILY_ALL_BABIES_QUERY = text(f"""
     order by age_days, baby_name
 """)
 
-_WEEKLY_QUERY = text(f"""
+# Aggregates behind /analytics/compare. Each is kept in a materialized
+# view (see refresh_comparison_views) whose unique index both allows
+# REFRESH ... CONCURRENTLY and matches the endpoint's ORDER BY, so reads
+# are an index scan over a few hundred rows instead of a group-by over
+# the whole mart.
+_WEEKLY_SELECT = f"""
     select
         baby_id,
         baby_name,
@@ -49,10 +101,9 @@ _WEEKLY_QUERY = text(f"""
         round(avg(diaper_count), 1) as avg_diaper_count
     from {DAILY_METRICS_TABLE}
     group by baby_id, baby_name, age_weeks
-    order by age_weeks, baby_name
-""")
+"""
 
-_BABIES_QUERY = text(f"""
+_BABIES_SELECT = f"""
     select
         m.baby_id,
         m.baby_name,
@@ -61,15 +112,131 @@ _BABIES_QUERY = text(f"""
     from {DAILY_METRICS_TABLE} m
     inner join public.baby_profiles p on p.id = m.baby_id
     group by m.baby_id, m.baby_name, p.date_of_birth
-    order by p.date_of_birth
-""")
+"""
+
+WEEKLY_VIEW = "public.analytics_weekly_comparison"
+BABIES_VIEW = "public.analytics_comparison_babies"
+
+# view -> (defining query, unique index columns). The index columns are
+# the group-by key, led by the read's sort columns.
+COMPARISON_VIEWS = {
+    WEEKLY_VIEW: (_WEEKLY_SELECT, ("age_weeks", "baby_name", "baby_id")),
+    BABIES_VIEW: (_BABIES_SELECT, ("date_of_birth", "baby_id", "baby_name")),
+}
+
+_WEEKLY_ORDER = "order by age_weeks, baby_name"
+_BABIES_ORDER = "order by date_of_birth"
+
+_WEEKLY_QUERY = text(f"select * from {WEEKLY_VIEW} {_WEEKLY_ORDER}")
+_WEEKLY_LIVE_QUERY = text(f"{_WEEKLY_SELECT} {_WEEKLY_ORDER}")
+_BABIES_QUERY = text(f"select * from {BABIES_VIEW} {_BABIES_ORDER}")
+_BABIES_LIVE_QUERY = text(f"{_BABIES_SELECT} {_BABIES_ORDER}")
+
+
+def mart_version(db: Session, views: Sequence[str] = ()) -> Optional[str]:
+    """Changes whenever the mart's contents, or those of `views`, may have changed.
+
+    None if the cache generation can't be read (Redis is down): results
+    then bypass the cache and get no ETag, rather than risk matching ones
+    from before an invalidate.
+
+    The fingerprint is read from the primary. If `db` reads from a replica
+    that hasn't replayed everything the primary had written by then, the
+    rest of the request reads from the primary instead (see
+    app.core.replicas), so results are never cached under a version newer
+    than they are.
+    """
+    rows = db.execute(
+        _FINGERPRINT_QUERY,
+        {"relations": [DAILY_METRICS_TABLE, *views]},
+        bind_arguments={"primary": True},
+    ).all()
+    read_replayed_or_primary(db, rows[0].lsn)
+    fingerprint = ".".join(f"{row.oid}.{row.writes}" if row.oid is not None else "missing" for row in rows)
+    generation = result_cache.generation() if result_cache is not None else 0
+    if generation is None:
+        return None
+    return f"{fingerprint}.{generation}"
+
+
+def comparison_version(db: Session) -> Optional[str]:
+    """mart_version() of the data behind /analytics/compare."""
+    return mart_version(db, views=tuple(COMPARISON_VIEWS))
+
 
+def invalidate_cache() -> Optional[int]:
+    """Drop every cached result; returns the new cache generation (None if unknown)."""
+    if result_cache is None:
+        return 0
+    return result_cache.bump_generation()
 
-def _run(db: Session, query, **params) -> List[dict]:
-    """Execute a marts query, translating a missing table into a 503."""
+
+def _view_exists(db: Session, view: str) -> bool:
+    return db.execute(text("select to_regclass(:view)"), {"view": view}).scalar() is not None
+
+
+def refresh_comparison_views(db: Session) -> Dict[str, str]:
+    """Bring the comparison views up to date with the mart; run after each mart rebuild.
+
+    Existing views are refreshed CONCURRENTLY, so /analytics/compare keeps
+    reading the previous contents meanwhile. A view is (re)created if it
+    is missing, which includes after dbt has dropped it along with the old
+    mart table. Also invalidates the result cache.
+
+    Returns:
+        "created" or "refreshed" for each view.
+    """
+    actions = {}
+    for view, (query, unique_columns) in COMPARISON_VIEWS.items():
+        if not _view_exists(db, view):
+            index = f"{view.split('.')[-1]}_key"
+            db.execute(text(f"create materialized view {view} as {query}"))
+            db.execute(text(f"create unique index {index} on {view} ({', '.join(unique_columns)})"))
+            actions[view] = "created"
+        else:
+            db.execute(text(f"refresh materialized view concurrently {view}"))
+            actions[view] = "refreshed"
+    db.commit()
+    invalidate_cache()
+    return actions
+
+
+def _cache_key(query, params: dict, version: str, columnar: bool = False) -> str:
+    digest = hashlib.sha256(f"{query.text}|{sorted(params.items())!r}".encode()).hexdigest()
+    return f"{version}:{'columns:' if columnar else ''}{digest}"
+
+
+def _run(
+    db: Session, query, fallback=None, columnar: bool = False, views: Sequence[str] = (), **params
+) -> Rows:
+    """Execute a marts query, reading `views`, through the result cache."""
+    if result_cache is None:
+        return _execute(db, query, params, fallback, columnar)
+    version = mart_version(db, views)
+    if version is None:
+        return _execute(db, query, params, fallback, columnar)
+    key = _cache_key(query, params, version, columnar)
+    rows = result_cache.get(key)
+    if rows is None:
+        rows = _execute(db, query, params, fallback, columnar)
+        result_cache.set(key, rows)
+    return rows
+
+
+def _execute(db: Session, query, params: dict, fallback=None, columnar: bool = False) -> Rows:
+    """Execute a marts query, translating a missing table into a 503.
+
+    If `query` fails and a `fallback` is given (the live aggregate behind
+    a comparison view that hasn't been created yet), that runs instead.
+    With `columnar`, returns {column name: values} straight from the
+    cursor instead of a dict per row.
+    """
     try:
         result = db.execute(query, params or None)
     except ProgrammingError as exc:
+        if fallback is not None:
+            db.rollback()
+            return _execute(db, fallback, params, columnar=columnar)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=(
@@ -77,6 +244,10 @@ def _run(db: Session, query, **params) -> List[dict]:
                 "Run `dbt run` in the dbt-baby-data repo to build it."
             ),
         ) from exc
+    if columnar:
+        names = list(result.keys())
+        rows = result.all()
+        return {name: [row[i] for row in rows] for i, name in enumerate(names)}
     return [dict(row) for row in result.mappings()]
 
 
@@ -85,11 +256,25 @@ def get_daily_metrics(
     baby_id: UUID,
     min_age_days: Optional[int] = None,
     max_age_days: Optional[int] = None,
-) -> List[dict]:
-    """One baby's daily metric rows, oldest first."""
+    columnar: bool = False,
+) -> Rows:
+    """One baby's daily metric rows, oldest first.
+
+    Read from the app's daily_metrics table instead of the mart when
+    DAILY_METRICS_SOURCE is "app"; that table is fresh, so it isn't cached.
+    """
+    if settings.DAILY_METRICS_SOURCE == "app":
+        rows = daily_metrics_service.get_daily_metrics(
+            db, baby_id, min_age_days=min_age_days, max_age_days=max_age_days
+        )
+        if columnar:
+            names = [column.name for column in DailyMetric.__table__.columns]
+            return {name: [getattr(row, name) for row in rows] for name in names}
+        return rows
     return _run(
         db,
         _DAILY_QUERY,
+        columnar=columnar,
         baby_id=str(baby_id),
         min_age_days=min_age_days,
         max_age_days=max_age_days,
@@ -98,14 +283,37 @@ def get_daily_metrics(
 
 def get_comparison_babies(db: Session) -> List[dict]:
     """The babies present in the mart, with their data extent."""
-    return _run(db, _BABIES_QUERY)
+    return _run(db, _BABIES_QUERY, fallback=_BABIES_LIVE_QUERY, views=(BABIES_VIEW,))
 
 
-def get_weekly_comparison(db: Session) -> List[dict]:
+def get_weekly_comparison(db: Session, columnar: bool = False) -> Rows:
     """All babies' metrics averaged per week of age."""
-    return _run(db, _WEEKLY_QUERY)
+    return _run(db, _WEEKLY_QUERY, fallback=_WEEKLY_LIVE_QUERY, columnar=columnar, views=(WEEKLY_VIEW,))
 
 
-def get_daily_comparison(db: Session) -> List[dict]:
+def get_daily_comparison(db: Session, columnar: bool = False) -> Rows:
     """All babies' raw daily rows ordered by age for age-aligned charts."""
-    return _run(db, _DAILY_ALL_BABIES_QUERY)
+    return _run(db, _DAILY_ALL_BABIES_QUERY, columnar=columnar)
+
+
+# Statements for streaming (see app.services.ndjson). Streams bypass the
+# result cache: holding a whole result to cache it is what they avoid.
+
+def daily_metrics_statement(
+    baby_id: UUID,
+    min_age_days: Optional[int] = None,
+    max_age_days: Optional[int] = None,
+):
+    """The query behind get_daily_metrics, with its parameters bound."""
+    if settings.DAILY_METRICS_SOURCE == "app":
+        return daily_metrics_service.daily_metrics_statement(baby_id, min_age_days, max_age_days)
+    return _DAILY_QUERY.bindparams(
+        baby_id=str(baby_id), min_age_days=min_age_days, max_age_days=max_age_days
+    )
+
+
+def comparison_statement(db: Session, align: str):
+    """The query behind get_weekly_comparison or get_daily_comparison."""
+    if align == "age_days":
+        return _DAILY_ALL_BABIES_QUERY
+    return _WEEKLY_QUERY if _view_exists(db, WEEKLY_VIEW) else _WEEKLY_LIVE_QUERY
@@ -0,0 +1,92 @@
+"""Apache Arrow IPC responses for analytics clients that ask for them.
+
+A request with Accept: application/vnd.apache.arrow.stream gets its rows
+as one columnar record batch in the Arrow IPC stream format instead of a
+JSON array of objects. Column values come straight from the DB cursor
+(see analytics_service's `columnar` option) without per-row pydantic
+validation, and column names are sent once in the schema rather than in
+every row. The schema is derived from the JSON response model, so both
+formats carry the same columns; UUIDs are strings.
+
+pyarrow is an optional dependency (the `arrow` extra). Without it, Arrow
+requests get 406 and JSON keeps working.
+"""
+
+import json
+import typing
+from datetime import date
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import BaseModel
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def wants_arrow(request: Request) -> bool:
+    """Whether the request's Accept header names the Arrow stream format."""
+    accept = request.headers.get("accept", "")
+    return any(part.split(";")[0].strip() == ARROW_STREAM_MEDIA_TYPE for part in accept.split(","))
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"{ARROW_STREAM_MEDIA_TYPE} needs pyarrow; install the `arrow` extra.",
+        ) from exc
+    return pyarrow
+
+
+def _field_type(annotation: Any) -> type:
+    """The non-None type of a (possibly Optional) field annotation."""
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    return args[0] if args else annotation
+
+
+def _column(pa, python_type: type, values: List[Any]):
+    if python_type is UUID:
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+    if python_type is float:
+        # round(avg(...)) comes back from Postgres as Decimal
+        return pa.array([None if v is None else float(v) for v in values], type=pa.float64())
+    arrow_type = {int: pa.int64(), str: pa.string(), date: pa.date32(), bool: pa.bool_()}[python_type]
+    return pa.array(values, type=arrow_type)
+
+
+def arrow_response(
+    columns: Dict[str, List[Any]],
+    model: Type[BaseModel],
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Response:
+    """An Arrow IPC stream of `columns` shaped like `model`.
+
+    Args:
+        columns: Column name -> values, e.g. from a columnar analytics query.
+        model: The endpoint's JSON row model; its fields pick and type the columns.
+        headers: Extra response headers (e.g. the ETag).
+        metadata: JSON-encoded into the schema metadata, for whatever in the
+            JSON response isn't a row column.
+    """
+    pa = _pyarrow()
+    fields, arrays = [], []
+    for name, field in model.model_fields.items():
+        array = _column(pa, _field_type(field.annotation), columns[name])
+        fields.append(pa.field(name, array.type, nullable=not field.is_required()))
+        arrays.append(array)
+    schema = pa.schema(
+        fields, metadata={key: json.dumps(value, default=str) for key, value in (metadata or {}).items()}
+    )
+    batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return Response(
+        content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers
+    )
@@ -0,0 +1,158 @@
+"""Async variant of CRUDBase for AsyncSession (DATABASE_ASYNC=true)."""
+
+from datetime import datetime
+from typing import List, Optional, Type
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel as PydanticBaseModel
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.base import ChangePoint, CRUDBase, CreateSchemaType, ModelType, UpdateSchemaType
+from app.services.etag import weak_etag
+from app.services.serialization import FieldSet
+
+
+class AsyncCRUDBase(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """CRUDBase whose database methods are coroutines taking an AsyncSession.
+
+    Filtering, ordering and keyset cursors are built by the inherited
+    CRUDBase helpers, so both variants issue the same SQL; only execution
+    differs. next_cursor() is inherited unchanged.
+    """
+
+    async def get(self, db: AsyncSession, id: UUID) -> Optional[ModelType]:
+        """Get a single record by ID.
+
+        Args:
+            db: Async database session.
+            id: Record UUID.
+
+        Returns:
+            The record if found, None otherwise.
+        """
+        return await db.get(self.model, id)
+
+    async def get_or_404(self, db: AsyncSession, id: UUID) -> ModelType:
+        """Get a single record by ID or raise 404.
+
+        Raises:
+            HTTPException: 404 if record not found.
+        """
+        obj = await self.get(db, id)
+        if not obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{self.model.__name__} with id {id} not found"
+            )
+        return obj
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        baby_id: Optional[UUID] = None,
+        order_by_field: str = "created_at",
+        order_desc: bool = True,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[ModelType]:
+        """Get multiple records; arguments as for CRUDBase.get_multi."""
+        stmt = self.list_statement(
+            skip=skip,
+            limit=limit,
+            baby_id=baby_id,
+            order_by_field=order_by_field,
+            order_desc=order_desc,
+            cursor=cursor,
+            since=since,
+            until=until,
+        )
+        return list(await db.scalars(stmt))
+
+    async def get_multi_rows(
+        self,
+        db: AsyncSession,
+        *,
+        response_model: Type[PydanticBaseModel],
+        fields: FieldSet = None,
+        **kwargs
+    ) -> List[Row]:
+        """Response columns as Core rows; see CRUDBase.get_multi_rows."""
+        stmt = self.rows_statement(response_model=response_model, fields=fields, **kwargs)
+        return (await db.execute(stmt)).all()
+
+    async def list_etag(self, db: AsyncSession, *, variant: str = "", **filters) -> str:
+        """Weak ETag for a filtered list (see CRUDBase.list_etag)."""
+        count, last_updated = (await db.execute(self._list_stats_statement(**filters))).one()
+        return weak_etag(self.model.__tablename__, count, last_updated, variant)
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """Create a new record."""
+        values = [obj_in.model_dump()]
+        if self.write_hooks:
+            values = await db.run_sync(self._hooked_values, values)
+        db_obj = self.model(**values[0])
+        db.add(db_obj)
+        if self.change_listeners:
+            await db.flush()
+            await self._notify_change(db, [self._change_point(db_obj)])
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def create_multi(self, db: AsyncSession, *, objs_in: List[CreateSchemaType]) -> List[Row]:
+        """Create many records in one transaction (see CRUDBase.create_multi)."""
+        if not objs_in:
+            return []
+        values = [obj_in.model_dump() for obj_in in objs_in]
+        if self.write_hooks:
+            values = await db.run_sync(self._hooked_values, values)
+        result = await db.execute(self._insert_returning(), values)
+        rows = result.all()
+        if self.change_listeners:
+            await self._notify_change(db, [self._change_point(row) for row in rows])
+        await db.commit()
+        return rows
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType
+    ) -> ModelType:
+        """Update an existing record (only set fields are applied)."""
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if update_data and self.write_hooks:
+            update_data = await db.run_sync(self._hooked_update, db_obj, update_data)
+        before = self._change_point(db_obj) if self.change_listeners else None
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+        if update_data and before is not None:
+            await self._notify_change(db, [before, self._change_point(db_obj)])
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: UUID) -> ModelType:
+        """Delete a record by ID.
+
+        Raises:
+            HTTPException: 404 if record not found.
+        """
+        obj = await self.get_or_404(db, id)
+        if self.change_listeners:
+            await self._notify_change(db, [self._change_point(obj)])
+        await db.delete(obj)
+        await db.commit()
+        return obj
+
+    async def _notify_change(self, db: AsyncSession, points: List[ChangePoint]) -> None:
+        """Run the change listeners' statements in the current transaction."""
+        for stmt in self._change_statements(points):
+            await db.execute(stmt)
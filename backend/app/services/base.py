@@ -1,15 +1,34 @@
 """Generic CRUD service base class for SQLAlchemy models."""
 
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from datetime import datetime, time
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import Date, Executable, Row, Select, func, insert, literal, select, tuple_
+from sqlalchemy.orm import Query, Session
+
+from app.schemas.base import _to_naive_utc
+from app.services.etag import weak_etag
+from app.services.pagination import column_python_type, decode_cursor, encode_cursor
+from app.services.serialization import FieldSet, response_columns
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=PydanticBaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=PydanticBaseModel)
+# ORM Query (sync CRUDBase) or Core select() (AsyncCRUDBase); the helpers
+# below only use filter/order_by/offset/limit, which both provide
+Statement = TypeVar("Statement", Query, Select)
+# (baby_id, event time) a write touched; for BabyProfile (id, None)
+ChangePoint = Tuple[UUID, Optional[datetime]]
+# Given the model and the points a write touched, a statement to run in the
+# write's own transaction (or None)
+ChangeListener = Callable[[type, List[ChangePoint]], Optional[Executable]]
+# Given the session and the column values about to be written (a dict per
+# row; for an update, the whole row with the changes applied), adjusts the
+# values in place
+WriteHook = Callable[[Session, List[Dict[str, Any]]], None]
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -17,18 +36,33 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     Provides standard Create, Read, Update, Delete operations with:
     - Automatic 404 handling
-    - Pagination support
-    - Optional baby_id filtering for event models
+    - Offset and keyset (cursor) pagination
+    - Optional baby_id and event-time range filtering for event models
     - Configurable ordering
+    - Change listeners run inside each write's transaction
+    - Write hooks that fill in derived columns on create and update
     """
 
-    def __init__(self, model: Type[ModelType]):
+    def __init__(
+        self,
+        model: Type[ModelType],
+        *,
+        change_listeners: Sequence[ChangeListener] = (),
+        write_hooks: Sequence[WriteHook] = (),
+    ):
         """Initialize with SQLAlchemy model class.
 
         Args:
             model: The SQLAlchemy model class to operate on.
+            change_listeners: Called on create, update and delete with the
+                (baby_id, event time) points touched; a returned statement
+                is executed before the commit.
+            write_hooks: Called on create and update with the column values
+                about to be written, to set derived columns from them.
         """
         self.model = model
+        self.change_listeners = list(change_listeners)
+        self.write_hooks = list(write_hooks)
 
     def get(self, db: Session, id: UUID) -> Optional[ModelType]:
         """Get a single record by ID.
@@ -71,7 +105,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         limit: int = 100,
         baby_id: Optional[UUID] = None,
         order_by_field: str = "created_at",
-        order_desc: bool = True
+        order_desc: bool = True,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
     ) -> List[ModelType]:
         """Get multiple records with optional filtering and pagination.
 
@@ -82,6 +119,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             baby_id: Optional filter by baby_id (for event models).
             order_by_field: Field name to order by.
             order_desc: If True, order descending; otherwise ascending.
+            cursor: Optional keyset cursor from next_cursor(); returns the
+                records that follow it instead of counting from the start.
+            since: Optional inclusive lower bound on the model's event time.
+            until: Optional exclusive upper bound on the model's event time.
 
         Returns:
             List of records matching the criteria.
@@ -91,13 +132,218 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if baby_id is not None and hasattr(self.model, "baby_id"):
             query = query.filter(self.model.baby_id == baby_id)
 
-        order_col = getattr(self.model, order_by_field, self.model.created_at)
+        query = self._filter_time_range(query, since=since, until=until)
+
+        return self._paginate(
+            query,
+            self._order_column(order_by_field),
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        ).all()
+
+    def list_statement(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        baby_id: Optional[UUID] = None,
+        order_by_field: str = "created_at",
+        order_desc: bool = True,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Select:
+        """get_multi's query as a Core select(), e.g. to stream it (see ndjson_response).
+
+        Arguments as for get_multi.
+        """
+        stmt = select(self.model)
+        if baby_id is not None and hasattr(self.model, "baby_id"):
+            stmt = stmt.filter(self.model.baby_id == baby_id)
+        stmt = self._filter_time_range(stmt, since=since, until=until)
+        return self._paginate(
+            stmt,
+            self._order_column(order_by_field),
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def rows_statement(
+        self,
+        *,
+        response_model: Type[PydanticBaseModel],
+        fields: FieldSet = None,
+        **kwargs: Any
+    ) -> Select:
+        """list_statement selecting only the columns response_model (or its `fields`) needs.
+
+        The id and order columns are always selected, for next_cursor().
+        """
+        order = {"order_by_field": kwargs["order_by_field"]} if "order_by_field" in kwargs else {}
+        columns = response_columns(self.model, response_model, fields, keep=self._cursor_fields(**order))
+        return self.list_statement(**kwargs).with_only_columns(*columns)
+
+    def get_multi_rows(
+        self,
+        db: Session,
+        *,
+        response_model: Type[PydanticBaseModel],
+        fields: FieldSet = None,
+        **kwargs: Any
+    ) -> List[Row]:
+        """get_multi without ORM instances: just the response columns, as Core rows.
+
+        For serialising with dump_json_list. next_cursor() accepts the
+        rows too.
+
+        Args:
+            db: Database session.
+            response_model: The route's item schema; selects the columns.
+            fields: Optional sparse fieldset (see parse_fields); narrows
+                the columns to those these fields need.
+            **kwargs: As for get_multi.
+
+        Returns:
+            The rows get_multi would return the records of.
+        """
+        return db.execute(self.rows_statement(response_model=response_model, fields=fields, **kwargs)).all()
+
+    def next_cursor(
+        self,
+        items: List[ModelType],
+        *,
+        limit: int,
+        order_by_field: str = "created_at"
+    ) -> Optional[str]:
+        """Cursor for the page after `items`, or None if this was the last page.
+
+        Args:
+            items: The page just returned by get_multi.
+            limit: The limit that page was requested with.
+            order_by_field: The field that page was ordered by.
+
+        Returns:
+            An opaque cursor to pass back to get_multi, or None.
+        """
+        if limit <= 0 or len(items) < limit:
+            return None
+        last = items[-1]
+        return encode_cursor(getattr(last, self._order_column(order_by_field).key), last.id)
+
+    def list_etag(self, db: Session, *, variant: str = "", **filters: Any) -> str:
+        """Weak ETag for a filtered list, from its row count and max(updated_at).
+
+        Any insert, update or delete within the filtered set changes one of
+        the two, so the ETag changes with the list's contents.
+
+        Args:
+            db: Database session.
+            variant: Distinguishes responses over the same set, e.g. the
+                request's query string (page size, cursor).
+            **filters: The list's filters, as passed to get_multi.
+
+        Returns:
+            A weak ETag string.
+        """
+        count, last_updated = db.execute(self._list_stats_statement(**filters)).one()
+        return weak_etag(self.model.__tablename__, count, last_updated, variant)
+
+    def _list_stats_statement(
+        self,
+        *,
+        baby_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Select:
+        """SELECT count(*), max(updated_at) over get_multi's filtered set."""
+        stmt = select(func.count(), func.max(self.model.updated_at)).select_from(self.model)
+        if baby_id is not None and hasattr(self.model, "baby_id"):
+            stmt = stmt.filter(self.model.baby_id == baby_id)
+        return self._filter_time_range(stmt, since=since, until=until)
+
+    def _cursor_fields(self, order_by_field: str = "created_at") -> Tuple[str, str]:
+        """The attributes next_cursor() reads from the last item."""
+        return "id", self._order_column(order_by_field).key
+
+    def _order_column(self, order_by_field: str) -> Any:
+        """The model column for order_by_field, falling back to created_at."""
+        return getattr(self.model, order_by_field, self.model.created_at)
+
+    def _event_time_column(self) -> Any:
+        """The column an event happened at (event_time_field), else created_at."""
+        return getattr(self.model, getattr(self.model, "event_time_field", "created_at"))
+
+    def _filter_time_range(
+        self,
+        query: Statement,
+        *,
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> Statement:
+        """Restrict query to since <= event time < until.
+
+        Bounds are normalised to naive UTC to match the stored timestamps.
+        Date-only columns (growth measurement_date) compare on the bound's
+        own calendar date, and include until's day unless until is midnight.
+        Combined with a baby_id filter this is a range scan on the
+        (baby_id, event time) index.
+        """
+        if since is None and until is None:
+            return query
+        time_col = self._event_time_column()
+        if since is not None:
+            query = query.filter(time_col >= self._time_bound(time_col, since))
+        if until is not None:
+            query = query.filter(self._until_clause(time_col, until))
+        return query
+
+    @staticmethod
+    def _time_bound(time_col: Any, value: datetime) -> Any:
+        """value as naive UTC, or its calendar date (not moved to UTC) for a Date column."""
+        if isinstance(time_col.type, Date):
+            return value.date()
+        return _to_naive_utc(value)
+
+    @classmethod
+    def _until_clause(cls, time_col: Any, until: datetime) -> Any:
+        """time_col < until; for a Date column, <= until's date unless until is midnight."""
+        bound = cls._time_bound(time_col, until)
+        if isinstance(time_col.type, Date) and until.time() != time.min:
+            return time_col <= bound
+        return time_col < bound
+
+    def _paginate(
+        self,
+        query: Statement,
+        order_col: Any,
+        *,
+        order_desc: bool,
+        skip: int,
+        limit: int,
+        cursor: Optional[str]
+    ) -> Statement:
+        """Order by (order_col, id) and apply the keyset cursor, offset and limit.
+
+        id breaks ties between equal order values so that every row has a
+        unique position and the cursor never skips or repeats a row.
+        """
+        id_col = self.model.id
+        if cursor is not None:
+            last_value, last_id = decode_cursor(cursor, column_python_type(order_col))
+            keyset = tuple_(order_col, id_col)
+            after = tuple_(literal(last_value, order_col.type), literal(last_id, id_col.type))
+            query = query.filter(keyset < after if order_desc else keyset > after)
+
         if order_desc:
-            query = query.order_by(order_col.desc())
+            query = query.order_by(order_col.desc(), id_col.desc())
         else:
-            query = query.order_by(order_col.asc())
+            query = query.order_by(order_col.asc(), id_col.asc())
 
-        return query.offset(skip).limit(limit).all()
+        return query.offset(skip).limit(limit)
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record.
@@ -109,12 +355,46 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The created record.
         """
-        db_obj = self.model(**obj_in.model_dump())
+        db_obj = self.model(**self._hooked_values(db, [obj_in.model_dump()])[0])
         db.add(db_obj)
+        if self.change_listeners:
+            db.flush()  # apply column defaults such as start_time
+            self._notify_change(db, [self._change_point(db_obj)])
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def create_multi(self, db: Session, *, objs_in: List[CreateSchemaType]) -> List[Row]:
+        """Create many records in one transaction.
+
+        Sends multi-row INSERT ... RETURNING statements (SQLAlchemy batches
+        them 1000 rows at a time) instead of an add/commit/refresh round
+        trip per record.
+
+        Args:
+            db: Database session.
+            objs_in: Pydantic schemas with creation data.
+
+        Returns:
+            The inserted rows, in the order of objs_in. These are Core rows
+            rather than ORM instances, so the commit doesn't expire them and
+            reading them back costs no further queries.
+        """
+        if not objs_in:
+            return []
+        rows = db.execute(
+            self._insert_returning(), self._hooked_values(db, [obj_in.model_dump() for obj_in in objs_in])
+        ).all()
+        if self.change_listeners:
+            self._notify_change(db, [self._change_point(row) for row in rows])
+        db.commit()
+        return rows
+
+    def _insert_returning(self) -> Any:
+        """INSERT of all columns, returning them in parameter order."""
+        table = self.model.__table__
+        return insert(table).returning(*table.columns, sort_by_parameter_order=True)
+
     def update(
         self,
         db: Session,
@@ -133,8 +413,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             The updated record.
         """
         update_data = obj_in.model_dump(exclude_unset=True)
+        if update_data and self.write_hooks:
+            update_data = self._hooked_update(db, db_obj, update_data)
+        before = self._change_point(db_obj) if self.change_listeners else None
         for field, value in update_data.items():
             setattr(db_obj, field, value)
+        if update_data and before is not None:
+            self._notify_change(db, [before, self._change_point(db_obj)])
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -153,6 +438,36 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             HTTPException: 404 if record not found.
         """
         obj = self.get_or_404(db, id)
+        if self.change_listeners:
+            self._notify_change(db, [self._change_point(obj)])
         db.delete(obj)
         db.commit()
         return obj
+
+    def _hooked_values(self, db: Session, values: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """`values` after the write hooks have run on them."""
+        for hook in self.write_hooks:
+            hook(db, values)
+        return values
+
+    def _hooked_update(self, db: Session, db_obj: ModelType, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """`update_data` plus the columns the write hooks changed in the updated row."""
+        current = {attr.key: getattr(db_obj, attr.key) for attr in self.model.__mapper__.column_attrs}
+        row = self._hooked_values(db, [{**current, **update_data}])[0]
+        return {key: value for key, value in row.items() if key in update_data or value != current.get(key)}
+
+    def _change_point(self, obj: Any) -> ChangePoint:
+        """The (baby_id, event time) of a record or row; (id, None) for a baby."""
+        if "baby_id" not in self.model.__table__.c:
+            return obj.id, None
+        return obj.baby_id, getattr(obj, self._event_time_column().key)
+
+    def _change_statements(self, points: List[ChangePoint]) -> List[Executable]:
+        points = list(dict.fromkeys(points))
+        statements = (listener(self.model, points) for listener in self.change_listeners)
+        return [stmt for stmt in statements if stmt is not None]
+
+    def _notify_change(self, db: Session, points: List[ChangePoint]) -> None:
+        """Run the change listeners' statements in the current transaction."""
+        for stmt in self._change_statements(points):
+            db.execute(stmt)
@@ -0,0 +1,99 @@
+"""Bulk creation of event records with per-item validation results.
+
+Every item is validated on its own so one bad row doesn't hide the errors
+of the others, then the valid items are written with a single
+CRUDBase.create_multi call: one transaction, multi-row INSERT ... RETURNING.
+"""
+
+from typing import Any, Dict, List, Sequence, Set, Tuple, Type
+from uuid import UUID
+
+from fastapi import status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+
+from app.models import BabyProfile
+
+ValidItems = List[Tuple[int, BaseModel]]
+ItemErrors = Dict[int, List[Dict[str, Any]]]
+
+
+def _validate_items(create_schema: Type[BaseModel], items: Sequence[Any]) -> Tuple[ValidItems, ItemErrors]:
+    valid: ValidItems = []
+    errors: ItemErrors = {}
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, create_schema.model_validate(item)))
+        except ValidationError as exc:
+            errors[index] = exc.errors(include_url=False, include_context=False)
+    return valid, errors
+
+
+def _baby_ids_query(valid: ValidItems):
+    return select(BabyProfile.id).where(BabyProfile.id.in_({obj.baby_id for _, obj in valid}))
+
+
+def _drop_unknown_babies(valid: ValidItems, known: Set[UUID], errors: ItemErrors) -> ValidItems:
+    """Turn items whose baby doesn't exist into errors instead of an FK violation."""
+    kept = []
+    for index, obj in valid:
+        if obj.baby_id in known:
+            kept.append((index, obj))
+        else:
+            errors[index] = [{
+                "type": "not_found",
+                "loc": ["baby_id"],
+                "msg": f"BabyProfile with id {obj.baby_id} not found",
+                "input": str(obj.baby_id),
+            }]
+    return kept
+
+
+def _results(total: int, valid: ValidItems, rows: Sequence[Any], errors: ItemErrors) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = [{"index": i} for i in range(total)]
+    for (index, _), row in zip(valid, rows):
+        results[index]["created"] = row
+    for index, item_errors in errors.items():
+        results[index]["errors"] = item_errors
+    return {"created_count": len(rows), "error_count": len(errors), "results": results}
+
+
+def bulk_status_code(result: Dict[str, Any]) -> int:
+    """201 if everything was created, 207 if some items failed, 422 if none were created."""
+    if not result["error_count"]:
+        return status.HTTP_201_CREATED
+    if result["created_count"]:
+        return status.HTTP_207_MULTI_STATUS
+    return status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def bulk_create(db, service, create_schema: Type[BaseModel], items: Sequence[Any], *, atomic: bool = False) -> Dict[str, Any]:
+    """Validate and insert `items`, returning a BulkCreateResponse payload.
+
+    Args:
+        db: Database session.
+        service: The CRUDBase for the target model.
+        create_schema: The model's *Create schema.
+        items: Raw request items.
+        atomic: If True, insert nothing when any item is invalid.
+    """
+    valid, errors = _validate_items(create_schema, items)
+    if valid:
+        known = set(db.scalars(_baby_ids_query(valid)))
+        valid = _drop_unknown_babies(valid, known, errors)
+    if atomic and errors:
+        valid = []
+    rows = service.create_multi(db, objs_in=[obj for _, obj in valid])
+    return _results(len(items), valid, rows, errors)
+
+
+async def async_bulk_create(db, service, create_schema: Type[BaseModel], items: Sequence[Any], *, atomic: bool = False) -> Dict[str, Any]:
+    """bulk_create for an AsyncSession and AsyncCRUDBase."""
+    valid, errors = _validate_items(create_schema, items)
+    if valid:
+        known = set(await db.scalars(_baby_ids_query(valid)))
+        valid = _drop_unknown_babies(valid, known, errors)
+    if atomic and errors:
+        valid = []
+    rows = await service.create_multi(db, objs_in=[obj for _, obj in valid])
+    return _results(len(items), valid, rows, errors)
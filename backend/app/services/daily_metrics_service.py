@@ -0,0 +1,276 @@
+"""Incrementally maintained daily metrics (the app-owned daily_metrics table).
+
+marts.mart_daily_metrics is only as fresh as the last `dbt run`, and
+that run recomputes every day of every baby. Here, writes to feeds,
+sleeps, diapers and babies through CRUDBase queue their (baby_id, event
+time) in daily_metrics_dirty, in the same transaction as the write (see
+mark_dirty). A background worker claims queued changes, maps them to the
+baby's local days, and recomputes only those rows. The table is a few
+seconds behind, and each refresh costs what changed.
+
+Day attribution follows the baby's timezone: an event belongs to the
+local date of its start. Sleep and feed figures only use sessions that
+started that day, and ongoing sleeps are left out until they end.
+
+Metric definitions:
+- night_*: sleep_type nighttime sessions. Segments are sessions,
+  wakings are segments - 1, awake minutes are the gaps between them
+- naps: sleep_type nap sessions
+- wake windows: gaps between consecutive sleeps of either type
+- feed interval: time between consecutive feed starts
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy import Select, and_, delete, func, insert, or_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models import BabyProfile, DailyMetric, DailyMetricsDirty, DiaperEvent, FeedingSession, SleepSession
+from app.models.feeding import FeedingType
+from app.models.sleep import SleepType
+from app.services.base import ChangePoint
+from app.services.summary_service import baby_zone, local_day_bounds
+
+logger = logging.getLogger(__name__)
+
+# Models whose writes affect daily_metrics
+TRACKED_MODELS = (BabyProfile, FeedingSession, SleepSession, DiaperEvent)
+EVENT_MODELS = (FeedingSession, SleepSession, DiaperEvent)
+
+
+def mark_dirty(model: type, points: List[ChangePoint]):
+    """CRUDBase change listener: queue the touched points for recomputation."""
+    if model not in TRACKED_MODELS or not points:
+        return None
+    now = datetime.utcnow()
+    return insert(DailyMetricsDirty).values(
+        [{"baby_id": baby_id, "event_time": event_time, "marked_at": now} for baby_id, event_time in points]
+    )
+
+
+def _minutes(start: datetime, end: datetime) -> int:
+    return int((end - start).total_seconds() // 60)
+
+
+def _mean(values: Sequence[int]) -> Optional[int]:
+    return round(sum(values) / len(values)) if values else None
+
+
+def compute_day(
+    baby: BabyProfile,
+    day: date,
+    feeds: Sequence[FeedingSession],
+    sleeps: Sequence[SleepSession],
+    diapers: Sequence[DiaperEvent],
+) -> Dict[str, Any]:
+    """One daily_metrics row from the day's events."""
+    ended = sorted((s for s in sleeps if s.end_time is not None), key=lambda s: s.start_time)
+    night = [s for s in ended if s.sleep_type == SleepType.NIGHTTIME]
+    naps = [s for s in ended if s.sleep_type == SleepType.NAP]
+    night_minutes = [_minutes(s.start_time, s.end_time) for s in night]
+    nap_minutes = [_minutes(s.start_time, s.end_time) for s in naps]
+    wake_windows = [
+        gap for a, b in zip(ended, ended[1:]) if (gap := _minutes(a.end_time, b.start_time)) > 0
+    ]
+    feed_times = sorted(f.start_time for f in feeds)
+    volumes = [f.volume_consumed_ml for f in feeds if f.volume_consumed_ml is not None]
+    age_days = (day - baby.date_of_birth).days
+
+    return {
+        "baby_id": baby.id,
+        "metric_date": day,
+        "baby_name": baby.name,
+        "age_days": age_days,
+        "age_weeks": age_days // 7,
+        "night_sleep_minutes": sum(night_minutes),
+        "night_sleep_segments": len(night) or None,
+        "longest_night_stretch_minutes": max(night_minutes, default=None),
+        "night_waking_count": len(night) - 1 if night else None,
+        "awake_at_night_minutes": (
+            sum(max(_minutes(a.end_time, b.start_time), 0) for a, b in zip(night, night[1:]))
+            if night else None
+        ),
+        "nap_count": len(naps),
+        "total_nap_minutes": sum(nap_minutes),
+        "avg_nap_minutes": _mean(nap_minutes),
+        "feed_count": len(feeds),
+        "breast_feed_count": sum(f.feeding_type == FeedingType.BREAST for f in feeds),
+        "bottle_feed_count": sum(f.feeding_type == FeedingType.BOTTLE for f in feeds),
+        "total_volume_ml": sum(volumes) if volumes else None,
+        "avg_feed_interval_minutes": _mean([_minutes(a, b) for a, b in zip(feed_times, feed_times[1:])]),
+        "avg_wake_window_minutes": _mean(wake_windows),
+        "max_wake_window_minutes": max(wake_windows, default=None),
+        "diaper_count": len(diapers),
+        "wet_diaper_count": sum(bool(d.has_urine) for d in diapers),
+        "dirty_diaper_count": sum(bool(d.has_stool) for d in diapers),
+    }
+
+
+def _local_date(value: datetime, zone) -> date:
+    return value.replace(tzinfo=timezone.utc).astimezone(zone).date()
+
+
+def _load_events(db: Session, model: type, baby_id: UUID, ranges: Optional[list]) -> list:
+    """The baby's events within any of `ranges` ([start, end) pairs), or all of them."""
+    time_col = getattr(model, model.event_time_field)
+    query = db.query(model).filter(model.baby_id == baby_id)
+    if ranges is not None:
+        query = query.filter(or_(*(and_(time_col >= start, time_col < end) for start, end in ranges)))
+    return query.all()
+
+
+def _upsert(db: Session, rows: List[Dict[str, Any]]) -> None:
+    now = datetime.utcnow()
+    stmt = postgresql.insert(DailyMetric).values([{**row, "updated_at": now} for row in rows])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["baby_id", "metric_date"],
+        set_={c.name: stmt.excluded[c.name] for c in DailyMetric.__table__.columns if not c.primary_key},
+    )
+    db.execute(stmt)
+
+
+def refresh_baby(db: Session, baby_id: UUID, event_times: Optional[Iterable[datetime]]) -> int:
+    """Recompute the baby's days containing `event_times` (None: every day).
+
+    Returns:
+        The number of days recomputed.
+    """
+    baby = db.get(BabyProfile, baby_id)
+    if baby is None:
+        db.execute(delete(DailyMetric).where(DailyMetric.baby_id == baby_id))
+        return 0
+    zone = baby_zone(baby)
+
+    if event_times is None:
+        days: Optional[Set[date]] = None
+        ranges = None
+    else:
+        days = {_local_date(t, zone) for t in event_times}
+        ranges = [local_day_bounds(day, zone) for day in sorted(days)]
+
+    by_day: Dict[date, Dict[type, list]] = {}
+    for model in EVENT_MODELS:
+        for event in _load_events(db, model, baby_id, ranges):
+            day = _local_date(getattr(event, model.event_time_field), zone)
+            by_day.setdefault(day, {m: [] for m in EVENT_MODELS})[model].append(event)
+
+    if days is None:
+        existing = db.scalars(select(DailyMetric.metric_date).where(DailyMetric.baby_id == baby_id))
+        days = set(existing) | set(by_day)
+
+    rows = [
+        compute_day(baby, day, by_day[day][FeedingSession], by_day[day][SleepSession], by_day[day][DiaperEvent])
+        for day in days if day in by_day
+    ]
+    if rows:
+        _upsert(db, rows)
+    empty = [day for day in days if day not in by_day]
+    if empty:
+        db.execute(delete(DailyMetric).where(
+            DailyMetric.baby_id == baby_id, DailyMetric.metric_date.in_(empty)
+        ))
+    return len(days)
+
+
+def refresh_dirty(db: Session, *, batch_size: int = 500) -> int:
+    """Claim up to batch_size queued changes, recompute their days and commit.
+
+    Claimed rows are locked with SKIP LOCKED, so several workers can drain
+    the queue side by side without recomputing the same change.
+
+    Returns:
+        The number of queued changes processed (0 when the queue is empty).
+    """
+    claimed = db.execute(
+        select(DailyMetricsDirty.id, DailyMetricsDirty.baby_id, DailyMetricsDirty.event_time)
+        .order_by(DailyMetricsDirty.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not claimed:
+        db.rollback()
+        return 0
+
+    # baby_id -> event times to recompute, or None for every day
+    pending: Dict[UUID, Optional[Set[datetime]]] = {}
+    for _, baby_id, event_time in claimed:
+        if event_time is None:
+            pending[baby_id] = None
+        elif pending.setdefault(baby_id, set()) is not None:
+            pending[baby_id].add(event_time)
+
+    for baby_id, event_times in pending.items():
+        refresh_baby(db, baby_id, event_times)
+    db.execute(delete(DailyMetricsDirty).where(DailyMetricsDirty.id.in_([row.id for row in claimed])))
+    db.commit()
+    return len(claimed)
+
+
+def queue_rebuild(db: Session) -> int:
+    """Queue every baby for a full recompute (initial backfill); returns the count."""
+    now = datetime.utcnow()
+    baby_ids = list(db.scalars(select(BabyProfile.id)))
+    if baby_ids:
+        db.execute(insert(DailyMetricsDirty).values(
+            [{"baby_id": baby_id, "event_time": None, "marked_at": now} for baby_id in baby_ids]
+        ))
+    db.commit()
+    return len(baby_ids)
+
+
+def daily_metrics_statement(
+    baby_id: UUID,
+    min_age_days: Optional[int] = None,
+    max_age_days: Optional[int] = None,
+) -> Select:
+    """One baby's daily_metrics rows, oldest first, as plain columns (not entities)."""
+    table = DailyMetric.__table__
+    stmt = select(table).where(table.c.baby_id == baby_id)
+    if min_age_days is not None:
+        stmt = stmt.where(table.c.age_days >= min_age_days)
+    if max_age_days is not None:
+        stmt = stmt.where(table.c.age_days <= max_age_days)
+    return stmt.order_by(table.c.metric_date)
+
+
+def get_daily_metrics(
+    db: Session,
+    baby_id: UUID,
+    min_age_days: Optional[int] = None,
+    max_age_days: Optional[int] = None,
+) -> List[DailyMetric]:
+    """One baby's daily_metrics rows, oldest first."""
+    query = db.query(DailyMetric).filter(DailyMetric.baby_id == baby_id)
+    if min_age_days is not None:
+        query = query.filter(DailyMetric.age_days >= min_age_days)
+    if max_age_days is not None:
+        query = query.filter(DailyMetric.age_days <= max_age_days)
+    return query.order_by(DailyMetric.metric_date).all()
+
+
+def daily_metrics_version(db: Session, baby_id: UUID) -> str:
+    """Changes whenever any of the baby's daily_metrics rows changes."""
+    count, last_updated = db.execute(
+        select(func.count(), func.max(DailyMetric.updated_at)).where(DailyMetric.baby_id == baby_id)
+    ).one()
+    return f"{count}.{last_updated}"
+
+
+async def run_worker(session_factory, *, interval: float, batch_size: int) -> None:
+    """Drain the queue every `interval` seconds until cancelled."""
+    def drain() -> None:
+        with session_factory() as db:
+            while refresh_dirty(db, batch_size=batch_size) == batch_size:
+                pass
+
+    while True:
+        try:
+            await asyncio.to_thread(drain)
+        except Exception:
+            logger.exception("daily_metrics refresh failed")
+        await asyncio.sleep(interval)
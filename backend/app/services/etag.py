@@ -0,0 +1,53 @@
+"""Weak ETags and If-None-Match handling for polled GET endpoints.
+
+List ETags hash the filtered set's row count and max(updated_at) (see
+CRUDBase.list_etag); analytics ETags hash the mart version. Both are
+cheap aggregates, so a client whose data hasn't changed gets a bodiless
+304 without the list being loaded or serialised.
+
+Responses also carry Cache-Control: no-cache, so browsers keep the body
+but revalidate with If-None-Match on every fetch, and Vary: Accept, since
+the same URL can be sent as JSON, NDJSON or Arrow.
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.services.ndjson import NDJSON_MEDIA_TYPE, wants_ndjson
+
+ETAG_HEADER = "ETag"
+
+
+def weak_etag(*parts: Any) -> str:
+    """A weak validator for a response determined by `parts`."""
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def list_variant(request: Request) -> str:
+    """What sets a list response apart from others over the same rows:
+    the query string (page size, cursor) and the negotiated format."""
+    return f"{request.url.query}|{NDJSON_MEDIA_TYPE}" if wants_ndjson(request) else request.url.query
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against `etag`."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def check_etag(request: Request, response: Response, etag: str) -> None:
+    """Raise 304 if the request already has `etag`, else set it on the response.
+
+    Raises:
+        HTTPException: 304 Not Modified (sent without a body).
+    """
+    headers = {ETAG_HEADER: etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
@@ -0,0 +1,174 @@
+"""Score growth_measurements.percentiles as they're written, and in bulk.
+
+growth_service scores each measurement it creates or updates through the
+score_new_values write hook, in the write's own transaction. The bulk
+backfill is needed once when real percentiles replaced the placeholder
+50s, and again whenever the reference tables in growth_standards change
+or a baby's date of birth or gender is corrected. Measurements
+are read in id order, joined to their baby's date_of_birth and gender, a
+chunk at a time (keyset on id, so each chunk is an index range scan). A
+whole chunk is scored in one growth_standards.percentile_records call,
+written back with a single UPDATE ... FROM (VALUES ...) and committed.
+
+Each chunk commits on its own, so an interrupted run loses at most one
+chunk: pass the last reported id as `after` to carry on from there.
+"""
+
+import time
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import JSON, Select, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from app.models import BabyProfile, GrowthMeasurement
+from app.services.growth_standards import MEASUREMENT_COLUMNS, percentile_records
+
+MEASUREMENT_FIELDS = list(MEASUREMENT_COLUMNS.values())
+
+
+def _filtered(stmt: Select, after: Optional[UUID], missing_only: bool) -> Select:
+    if after is not None:
+        stmt = stmt.where(GrowthMeasurement.id > after)
+    if missing_only:
+        stmt = stmt.where(GrowthMeasurement.percentiles.is_(None))
+    return stmt
+
+
+def _chunk_statement(after: Optional[UUID], missing_only: bool, chunk_size: int) -> Select:
+    stmt = (
+        select(
+            GrowthMeasurement.id,
+            GrowthMeasurement.measurement_date,
+            *(getattr(GrowthMeasurement, field) for field in MEASUREMENT_FIELDS),
+            BabyProfile.date_of_birth,
+            BabyProfile.gender,
+        )
+        .join(BabyProfile, BabyProfile.id == GrowthMeasurement.baby_id)
+        .order_by(GrowthMeasurement.id)
+        .limit(chunk_size)
+    )
+    return _filtered(stmt, after, missing_only)
+
+
+def count_pending(db: Session, *, after: Optional[UUID] = None, missing_only: bool = False) -> int:
+    """How many measurements a backfill with these arguments would visit."""
+    return db.scalar(_filtered(select(func.count()).select_from(GrowthMeasurement), after, missing_only))
+
+
+def _score(measured: List[Any], born: List[Any], genders: List[Any], measurements: List[Any]) -> List[Dict[str, float]]:
+    """percentile_records for parallel lists of dates, genders and {field: value} mappings."""
+    ages = np.array(measured, dtype="datetime64[D]") - np.array(born, dtype="datetime64[D]")
+    return percentile_records(
+        ages.astype(np.float64),
+        genders,
+        {field: [values[field] for values in measurements] for field in MEASUREMENT_FIELDS},
+    )
+
+
+def score_rows(rows: List[Any]) -> List[Dict[str, float]]:
+    """Percentiles for rows of _chunk_statement, in one vectorised call."""
+    return _score(
+        [row.measurement_date for row in rows],
+        [row.date_of_birth for row in rows],
+        [row.gender for row in rows],
+        [row._mapping for row in rows],
+    )
+
+
+def score_new_values(db: Session, values: List[Dict[str, Any]]) -> None:
+    """Set "percentiles" in GrowthMeasurement column values about to be written.
+
+    growth_service's write hook (see CRUDBase). The babies are read in one
+    query and every row is scored in one vectorised call; rows for an
+    unknown baby get None (the insert's foreign key check rejects them).
+    """
+    baby_ids = {row["baby_id"] for row in values}
+    babies = {
+        baby.id: baby
+        for baby in db.execute(
+            select(BabyProfile.id, BabyProfile.date_of_birth, BabyProfile.gender)
+            .where(BabyProfile.id.in_(baby_ids))
+        )
+    }
+    for row in values:
+        row["percentiles"] = None
+    known = [row for row in values if row["baby_id"] in babies]
+    if not known:
+        return
+    records = _score(
+        [row["measurement_date"] for row in known],
+        [babies[row["baby_id"]].date_of_birth for row in known],
+        [babies[row["baby_id"]].gender for row in known],
+        known,
+    )
+    for row, record in zip(known, records):
+        row["percentiles"] = record
+
+
+def write_percentiles(db: Session, updates: List[Dict[str, Any]]) -> None:
+    """Set percentiles for many measurements ({"id", "percentiles"} dicts) in one statement.
+
+    On Postgres this is one UPDATE ... FROM (VALUES ...); other databases
+    get an executemany UPDATE by primary key.
+    """
+    if not updates:
+        return
+    if db.get_bind().dialect.name != "postgresql":
+        db.execute(update(GrowthMeasurement), updates)
+        return
+    rows = values(
+        column("id", PG_UUID(as_uuid=True)), column("percentiles", JSON), name="v"
+    ).data([(u["id"], u["percentiles"]) for u in updates])
+    # The VALUES parameters are rendered with ::UUID / ::JSON casts
+    db.execute(
+        update(GrowthMeasurement)
+        .where(GrowthMeasurement.id == rows.c.id)
+        .values(percentiles=rows.c.percentiles),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def backfill_percentiles(
+    db: Session,
+    *,
+    chunk_size: int = 5000,
+    after: Optional[UUID] = None,
+    missing_only: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Recompute percentiles chunk by chunk, committing after each one.
+
+    Args:
+        db: Database session; committed once per chunk.
+        chunk_size: Measurements read, scored and written per chunk.
+        after: Resume after this measurement id (the last one a previous
+            run reported).
+        missing_only: Only measurements whose percentiles are NULL.
+
+    Yields:
+        Per chunk: rows, last_id, and seconds spent reading (read_s),
+        scoring (score_s) and writing + committing (write_s).
+    """
+    while True:
+        started = time.perf_counter()
+        rows = db.execute(_chunk_statement(after, missing_only, chunk_size)).all()
+        if not rows:
+            db.rollback()
+            return
+        read = time.perf_counter()
+        records = score_rows(rows)
+        scored = time.perf_counter()
+        write_percentiles(db, [{"id": row.id, "percentiles": record} for row, record in zip(rows, records)])
+        db.commit()
+        after = rows[-1].id
+        yield {
+            "rows": len(rows),
+            "last_id": after,
+            "read_s": read - started,
+            "score_s": scored - read,
+            "write_s": time.perf_counter() - scored,
+        }
+        if len(rows) < chunk_size:
+            return
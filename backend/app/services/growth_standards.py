@@ -0,0 +1,164 @@
+"""WHO Child Growth Standards percentiles for growth measurements.
+
+The standards give each indicator (weight, length and head circumference
+for age) by sex as LMS parameters: Box-Cox power L, median M and
+coefficient of variation S. A measurement y at that age and sex has
+
+    z = ((y / M) ** L - 1) / (L * S)        (ln(y / M) / S when L == 0)
+
+and its percentile is 100 * Phi(z). Beyond +-3 SD, WHO's restricted
+method is used: the distance past SD3 is measured in units of the
+SD2-SD3 gap, so the skewed weight distribution doesn't give extreme z.
+
+The parameters for whole months 0-24 are in data/who_growth_lms.csv,
+loaded once into one array; ages in between use linearly interpolated
+L, M and S. Everything works on NumPy arrays, so a batch of
+(age_days, sex, value) rows, e.g. a baby's whole growth history, is
+scored in a few array operations rather than row by row. Ages outside
+0-24 months, an unknown sex or a missing value give NaN (no percentile).
+"""
+
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+LMS_PATH = Path(__file__).parent / "data" / "who_growth_lms.csv"
+
+INDICATORS = ("weight", "length", "head_circumference")
+SEXES = ("male", "female")
+# Indicator -> GrowthMeasurement column it scores
+MEASUREMENT_COLUMNS = {
+    "weight": "weight_kg",
+    "length": "length_cm",
+    "head_circumference": "head_circumference_cm",
+}
+DAYS_PER_MONTH = 365.25 / 12
+
+ArrayLike = Union[np.ndarray, Sequence[Any]]
+
+
+@lru_cache(maxsize=None)
+def lms_table() -> np.ndarray:
+    """The LMS parameters, shape (indicator, sex, L/M/S, month)."""
+    indicator, sex, month, l, m, s = np.loadtxt(
+        LMS_PATH, delimiter=",", comments="#", unpack=True,
+        dtype={"names": ("i", "x", "m", "l", "mu", "s"),
+               "formats": ("U24", "U8", "i4", "f8", "f8", "f8")},
+    )
+    table = np.full((len(INDICATORS), len(SEXES), 3, month.max() + 1), np.nan)
+    i = np.array([INDICATORS.index(value) for value in indicator])
+    x = np.array([SEXES.index(value) for value in sex])
+    table[i, x, :, month] = np.column_stack([l, m, s])
+    table.setflags(write=False)
+    return table
+
+
+def sex_codes(sex: ArrayLike) -> np.ndarray:
+    """Index into SEXES per row; -1 for anything else (e.g. "other", None)."""
+    values = np.asarray(sex, dtype=object)
+    codes = np.full(values.shape, -1, dtype=np.intp)
+    for code, name in enumerate(SEXES):
+        codes[values == name] = code
+    return codes
+
+
+def _floats(values: ArrayLike) -> np.ndarray:
+    """values as a float64 array, None -> NaN."""
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64)
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def lms(indicator: str, age_days: ArrayLike, sex: ArrayLike) -> np.ndarray:
+    """Interpolated (L, M, S) per row, shape (3, n); NaN where not covered."""
+    table = lms_table()[INDICATORS.index(indicator)]
+    months = _floats(age_days) / DAYS_PER_MONTH
+    codes = sex_codes(sex)
+    grid = np.arange(table.shape[-1])
+    out = np.full((3, months.size), np.nan)
+    for code in range(len(SEXES)):
+        rows = codes == code
+        for p in range(3):
+            out[p, rows] = np.interp(months[rows], grid, table[code, p])
+    out[:, (months < 0) | (months > grid[-1])] = np.nan
+    return out
+
+
+def _sd(l: np.ndarray, m: np.ndarray, s: np.ndarray, k: float) -> np.ndarray:
+    """The value k SDs from the median."""
+    return m * (1 + l * s * k) ** (1 / l)
+
+
+def z_scores(indicator: str, age_days: ArrayLike, sex: ArrayLike, values: ArrayLike) -> np.ndarray:
+    """WHO z-scores of `values` for the indicator at each row's age and sex."""
+    l, m, s = lms(indicator, age_days, sex)
+    y = _floats(values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Every table has L != 0, so the log form is never needed
+        z = ((y / m) ** l - 1) / (l * s)
+        above, below = z > 3, z < -3
+        if above.any():
+            sd3, sd2 = _sd(l, m, s, 3), _sd(l, m, s, 2)
+            z = np.where(above, 3 + (y - sd3) / (sd3 - sd2), z)
+        if below.any():
+            sd3, sd2 = _sd(l, m, s, -3), _sd(l, m, s, -2)
+            z = np.where(below, -3 + (y - sd3) / (sd2 - sd3), z)
+    return z
+
+
+def _erf(x: np.ndarray) -> np.ndarray:
+    """erf to within 1.5e-7 (Abramowitz and Stegun 7.1.26); NumPy has none."""
+    t = 1 / (1 + 0.3275911 * np.abs(x))
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return np.sign(x) * (1 - poly * np.exp(-x * x))
+
+
+def percentiles(z: np.ndarray) -> np.ndarray:
+    """Percentile (0-100) of each z-score under the standard normal."""
+    return 50 * (1 + _erf(np.asarray(z, dtype=np.float64) / np.sqrt(2)))
+
+
+def percentile_records(
+    age_days: ArrayLike,
+    sex: ArrayLike,
+    measurements: Dict[str, ArrayLike],
+) -> List[Dict[str, float]]:
+    """Per-row percentiles JSON, as stored in GrowthMeasurement.percentiles.
+
+    Args:
+        age_days: Age at measurement, per row.
+        sex: "male" / "female" per row; anything else scores nothing.
+        measurements: GrowthMeasurement column (weight_kg, ...) -> value
+            per row, None where not measured.
+
+    Returns:
+        One {"weight": 45.3, ...} dict per row (rounded to one decimal),
+        with only the indicators that could be scored.
+    """
+    age_days = _floats(age_days)
+    scored = {}
+    for indicator in INDICATORS:
+        values = measurements.get(MEASUREMENT_COLUMNS[indicator])
+        if values is not None:
+            scored[indicator] = np.round(percentiles(z_scores(indicator, age_days, sex, values)), 1)
+    return [
+        {indicator: float(column[row]) for indicator, column in scored.items() if not np.isnan(column[row])}
+        for row in range(age_days.size)
+    ]
+
+
+def score_history(
+    measurements: Iterable[Any],
+    date_of_birth: date,
+    gender: Optional[str],
+) -> List[Dict[str, float]]:
+    """percentile_records for one baby's measurements (GrowthMeasurement-like), in order."""
+    measurements = list(measurements)
+    return percentile_records(
+        [(m.measurement_date - date_of_birth).days for m in measurements],
+        [gender] * len(measurements),
+        {column: [getattr(m, column) for m in measurements] for column in MEASUREMENT_COLUMNS.values()},
+    )
@@ -0,0 +1,368 @@
+"""Diff-based ingest of tracker exports into the source='ingested' rows.
+
+The dbt-baby-data pipeline used to delete and reload every ingested row on
+each run, which rewrites the whole history, bloats the tables and holds
+locks readers wait on. Here each export file is streamed into a temp
+table with COPY and only the differences are applied to the live table,
+keyed on a natural key that stays stable between exports:
+
+- baby_profiles: (name, date_of_birth)
+- event tables: (baby, event time); event files name their baby with
+  baby_name and baby_date_of_birth columns, resolved against the
+  ingested baby_profiles rows
+
+Rows whose key is missing from the export are deleted, rows whose other
+columns differ are updated and new keys are inserted. A baby missing from
+the export is only deleted once nothing references it any more; one that
+still has events (logged through the API, or in a table without an export
+file) is kept and counted as "kept". Only columns present
+in a file are compared and written. A table without an export file is
+left untouched. Everything runs in one transaction, so readers see either
+the old or the new data set.
+
+Every touched row is also queued in daily_metrics_dirty, as CRUDBase
+writes are, so the app's daily_metrics catch up.
+
+Enum columns accept either the API values ("breast") or the database
+labels ("BREAST"). Postgres only: this uses COPY and psycopg2's
+copy_expert.
+"""
+
+import csv
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, TextIO, Tuple, Type
+
+from sqlalchemy import Enum, JSON, text
+from sqlalchemy.orm import Session
+
+from app.models import BabyProfile, DiaperEvent, FeedingSession, SleepSession
+from app.models.base import BaseModel
+
+# Tables the pipeline feeds, in the order they're applied: babies first so
+# event rows can resolve their baby_id
+INGEST_MODELS: List[Type[BaseModel]] = [BabyProfile, DiaperEvent, FeedingSession, SleepSession]
+
+# Columns the ingest manages itself; an export can't set them
+MANAGED_COLUMNS = {"id", "created_at", "updated_at", "source", "baby_id"}
+
+# Extra columns event files use to name their baby
+BABY_REF_COLUMNS = ("baby_name", "baby_date_of_birth")
+
+SOURCE = "ingested"
+
+
+class IngestError(ValueError):
+    """An export file that can't be ingested (e.g. unknown or missing columns)."""
+
+
+def natural_key(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Columns identifying the same row across exports."""
+    if model is BabyProfile:
+        return ("name", "date_of_birth")
+    return ("baby_id", model.event_time_field)
+
+
+def _read_header(file: TextIO, model: Type[BaseModel]) -> List[str]:
+    """Validate a CSV header against the model and return its columns."""
+    header = next(csv.reader([file.readline()]), [])
+    file.seek(0)
+    allowed = {c.name for c in model.__table__.columns} - MANAGED_COLUMNS
+    required = set(natural_key(model)) - {"baby_id"}
+    if model is not BabyProfile:
+        allowed |= set(BABY_REF_COLUMNS)
+        required |= set(BABY_REF_COLUMNS)
+
+    unknown = [c for c in header if c not in allowed]
+    if unknown:
+        raise IngestError(f"{model.__tablename__}: unknown columns {unknown}")
+    missing = sorted(required - set(header))
+    if missing:
+        raise IngestError(f"{model.__tablename__}: missing key columns {missing}")
+    if len(set(header)) != len(header):
+        raise IngestError(f"{model.__tablename__}: duplicate columns in header")
+    return header
+
+
+def _stage_table(db: Session, model: Type[BaseModel], header: Sequence[str]) -> str:
+    """Create the temp table an export file is copied into."""
+    table = model.__table__
+    dialect = db.get_bind().dialect
+    stage = f"ingest_{table.name}"
+
+    columns = []
+    for name in header:
+        if name in BABY_REF_COLUMNS:
+            col_type = "TEXT" if name == "baby_name" else "DATE"
+        elif isinstance(table.c[name].type, Enum):
+            # Loaded as text and converted below so both spellings work
+            col_type = "TEXT"
+        else:
+            col_type = table.c[name].type.compile(dialect=dialect)
+        columns.append(f"{_ident(name)} {col_type}")
+    if model is not BabyProfile:
+        columns.append("baby_id UUID")
+
+    db.execute(text(f"CREATE TEMP TABLE {stage} ({', '.join(columns)}) ON COMMIT DROP"))
+    return stage
+
+
+def _copy(db: Session, stage: str, header: Sequence[str], file: TextIO) -> int:
+    """Stream `file` into the stage table with COPY; returns rows copied."""
+    raw = db.connection().connection.dbapi_connection
+    with raw.cursor() as cur:
+        cur.copy_expert(
+            f"COPY {stage} ({_columns(header)}) FROM STDIN WITH (FORMAT csv, HEADER true)",
+            file,
+        )
+        return cur.rowcount
+
+
+def _convert_enums(db: Session, model: Type[BaseModel], stage: str, header: Sequence[str]) -> None:
+    for name in header:
+        col_type = model.__table__.c[name].type if name in model.__table__.c else None
+        if isinstance(col_type, Enum):
+            db.execute(text(
+                f"ALTER TABLE {stage} ALTER COLUMN {_ident(name)} TYPE {col_type.name} "
+                f"USING upper({_ident(name)})::{col_type.name}"
+            ))
+
+
+def _resolve_babies(db: Session, stage: str) -> None:
+    """Fill the stage's baby_id from its baby_name / baby_date_of_birth."""
+    db.execute(text(
+        f"UPDATE {stage} s SET baby_id = b.id FROM baby_profiles b "
+        f"WHERE b.source = :source AND b.name = s.baby_name "
+        f"AND b.date_of_birth = s.baby_date_of_birth"
+    ), {"source": SOURCE})
+
+
+def _drop_unkeyed(db: Session, model: Type[BaseModel], stage: str) -> int:
+    """Drop rows with a NULL key part (incl. an unknown baby); returns the count."""
+    missing = " OR ".join(f"{_ident(c)} IS NULL" for c in natural_key(model))
+    return db.execute(text(f"DELETE FROM {stage} WHERE {missing}")).rowcount
+
+
+def _ident(column: str) -> str:
+    """A quoted SQL identifier (some columns, e.g. timestamp, are keywords)."""
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _columns(columns: Sequence[str], alias: str = "") -> str:
+    return ", ".join(f"{alias}{_ident(c)}" for c in columns)
+
+
+def _key_match(key: Sequence[str], left: str, right: str) -> str:
+    return " AND ".join(f"{left}.{_ident(c)} = {right}.{_ident(c)}" for c in key)
+
+
+def _is_distinct(model: Type[BaseModel], column: str) -> str:
+    # json has no equality operator; compare as jsonb
+    if isinstance(model.__table__.c[column].type, JSON):
+        return f"t.{_ident(column)}::jsonb IS DISTINCT FROM s.{_ident(column)}::jsonb"
+    return f"t.{_ident(column)} IS DISTINCT FROM s.{_ident(column)}"
+
+
+def _queue_changes(model: Type[BaseModel], statement: str, alias: str) -> str:
+    """Wrap a DML statement so the rows it touches are queued for daily_metrics.
+
+    The outer INSERT's rowcount is the number of rows the statement touched.
+    A changed baby queues all of its days (event_time NULL).
+    """
+    if model is BabyProfile:
+        returning, queued = f"{alias}id", "id, NULL::timestamp"
+    else:
+        time_col = _ident(model.event_time_field)
+        returning, queued = f"{alias}baby_id, {alias}{time_col}", f"baby_id, {time_col}"
+    return (
+        f"WITH changed AS ({statement} RETURNING {returning}) "
+        f"INSERT INTO daily_metrics_dirty (baby_id, event_time, marked_at) "
+        f"SELECT {queued}, :now FROM changed"
+    )
+
+
+def _missing_condition(model: Type[BaseModel], stage: str) -> str:
+    """Ingested rows (alias t) whose key isn't in the stage table."""
+    return (
+        f"t.source = :source AND NOT EXISTS "
+        f"(SELECT 1 FROM {stage} s WHERE {_key_match(natural_key(model), 's', 't')})"
+    )
+
+
+def _unreferenced_condition(model: Type[BaseModel]) -> str:
+    """Rows (alias t) no other table's foreign key still points at.
+
+    Foreign keys with ON DELETE CASCADE don't block a delete, so they're
+    left out.
+    """
+    checks = [
+        f"NOT EXISTS (SELECT 1 FROM {fk.parent.table.name} r "
+        f"WHERE r.{_ident(fk.parent.name)} = t.{_ident(fk.column.name)})"
+        for table in model.metadata.sorted_tables
+        for fk in table.foreign_keys
+        if fk.column.table is model.__table__ and (fk.ondelete or "").upper() != "CASCADE"
+    ]
+    return " AND ".join(checks) or "TRUE"
+
+
+def _delete_missing(db: Session, model: Type[BaseModel], stage: str) -> int:
+    """Delete ingested rows whose key isn't in the stage table.
+
+    Babies are only deleted once no rows reference them; see
+    count_kept_babies().
+    """
+    condition = _missing_condition(model, stage)
+    if model is BabyProfile:
+        condition += f" AND {_unreferenced_condition(model)}"
+    return db.execute(text(_queue_changes(
+        model,
+        f"DELETE FROM {model.__tablename__} t WHERE {condition}",
+        "t.",
+    )), {"source": SOURCE, "now": datetime.utcnow()}).rowcount
+
+
+def _apply_diff(
+    db: Session,
+    model: Type[BaseModel],
+    stage: str,
+    header: Sequence[str],
+    *,
+    delete_missing: bool = True
+) -> Dict[str, int]:
+    """Delete, update and insert so the ingested rows match the stage table."""
+    table = model.__tablename__
+    key = natural_key(model)
+    values = [c for c in header if c not in key and c not in BABY_REF_COLUMNS]
+    params = {"source": SOURCE, "now": datetime.utcnow()}
+    counts = {}
+
+    # Keep the first row for a repeated key so the update below is deterministic
+    counts["duplicates"] = db.execute(text(
+        f"DELETE FROM {stage} a USING {stage} b "
+        f"WHERE {_key_match(key, 'a', 'b')} AND a.ctid > b.ctid"
+    )).rowcount
+
+    counts["deleted"] = _delete_missing(db, model, stage) if delete_missing else 0
+
+    if values:
+        assignments = ", ".join(f"{_ident(c)} = s.{_ident(c)}" for c in values)
+        changed = " OR ".join(_is_distinct(model, c) for c in values)
+        counts["updated"] = db.execute(text(_queue_changes(
+            model,
+            f"UPDATE {table} t SET {assignments}, updated_at = :now FROM {stage} s "
+            f"WHERE t.source = :source AND {_key_match(key, 's', 't')} AND ({changed})",
+            "t.",
+        )), params).rowcount
+    else:
+        counts["updated"] = 0
+
+    columns = _columns([*key, *values])
+    selected = _columns([*key, *values], "s.")
+    insert_new = (
+        f"INSERT INTO {table} (id, created_at, updated_at, source, {columns}) "
+        f"SELECT gen_random_uuid(), :now, :now, :source, {selected} FROM {stage} s "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {table} t "
+        f"WHERE t.source = :source AND {_key_match(key, 's', 't')})"
+    )
+    if model is not BabyProfile:  # a new baby has no days yet
+        insert_new = _queue_changes(model, insert_new, "")
+    counts["inserted"] = db.execute(text(insert_new), params).rowcount
+    return counts
+
+
+def ingest_table(
+    db: Session,
+    model: Type[BaseModel],
+    file: TextIO,
+    *,
+    delete_missing: bool = True
+) -> Dict[str, Any]:
+    """Apply one export file to `model`'s ingested rows (no commit).
+
+    Args:
+        db: Database session (Postgres).
+        model: Target model, one of INGEST_MODELS.
+        file: The CSV export, header row first.
+        delete_missing: Delete ingested rows absent from the file. The
+            stage table lives until commit, so this can be done later
+            with delete_missing_rows().
+
+    Returns:
+        Row counts (copied, skipped, duplicates, deleted, updated,
+        inserted) and timings in seconds (copy_s, apply_s).
+    """
+    header = _read_header(file, model)
+    stage = _stage_table(db, model, header)
+
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"table": model.__tablename__, "copied": _copy(db, stage, header, file)}
+    result["copy_s"] = round(time.perf_counter() - started, 3)
+
+    started = time.perf_counter()
+    # Temp tables are never auto-analyzed; without stats the joins below
+    # get planned for an empty table
+    db.execute(text(f"ANALYZE {stage}"))
+    _convert_enums(db, model, stage, header)
+    if model is not BabyProfile:
+        _resolve_babies(db, stage)
+    result["skipped"] = _drop_unkeyed(db, model, stage)
+    result.update(_apply_diff(db, model, stage, header, delete_missing=delete_missing))
+    result["apply_s"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def delete_missing_rows(db: Session, model: Type[BaseModel]) -> int:
+    """Deferred delete for an ingest_table(..., delete_missing=False) call."""
+    return _delete_missing(db, model, f"ingest_{model.__tablename__}")
+
+
+def count_kept_babies(db: Session) -> int:
+    """Ingested babies missing from the export but kept, as rows still reference them."""
+    return db.execute(text(
+        f"SELECT count(*) FROM {BabyProfile.__tablename__} t "
+        f"WHERE {_missing_condition(BabyProfile, f'ingest_{BabyProfile.__tablename__}')}"
+    ), {"source": SOURCE}).scalar_one()
+
+
+def ingest_export(db: Session, export_dir: Path, *, dry_run: bool = False) -> List[Dict[str, Any]]:
+    """Diff-ingest `<export_dir>/<table>.csv` for every pipeline-fed table.
+
+    Babies are inserted and updated first so event rows can reference
+    them, and deleted last, once their ingested events are gone. Babies
+    still referenced by other rows are kept and counted in the babies
+    result's "kept".
+
+    Args:
+        db: Database session (Postgres).
+        export_dir: Directory holding the export files.
+        dry_run: Compute and report the changes, then roll back.
+
+    Returns:
+        One ingest_table() result per file found, in apply order.
+
+    Raises:
+        IngestError: If a file's header doesn't match its table.
+    """
+    results = []
+    try:
+        for model in INGEST_MODELS:
+            path = Path(export_dir) / f"{model.__tablename__}.csv"
+            if not path.exists():
+                continue
+            with path.open(newline="", encoding="utf-8") as file:
+                results.append(ingest_table(db, model, file, delete_missing=model is not BabyProfile))
+        babies = next((r for r in results if r["table"] == BabyProfile.__tablename__), None)
+        if babies is not None:
+            started = time.perf_counter()
+            babies["deleted"] = delete_missing_rows(db, BabyProfile)
+            babies["kept"] = count_kept_babies(db)
+            babies["apply_s"] = round(babies["apply_s"] + time.perf_counter() - started, 3)
+    except BaseException:
+        db.rollback()
+        raise
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+    return results
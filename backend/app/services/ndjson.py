@@ -0,0 +1,106 @@
+"""Streaming NDJSON responses for list and analytics endpoints.
+
+A request with Accept: application/x-ndjson gets one JSON object per line,
+sent as the rows come off a server-side cursor (yield_per, which also
+turns on stream_results), instead of a JSON array built, validated and
+serialised in full before the first byte. Memory stays flat however many
+rows the query returns, and the client can start on the first rows while
+the rest are still being read.
+
+Dependency sessions are closed before a response body is sent, so the
+stream runs its query on its own session, bound to the same engine as the
+request's. Each line is the row validated through the endpoint's response
+model, so lines match the items of the JSON array.
+"""
+
+import json
+from typing import AbstractSet, Any, AsyncIterator, Dict, Iterator, Optional, Type
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# OpenAPI `responses` entry for routes that can stream
+NDJSON_RESPONSES = {200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+
+# Rows fetched from the cursor, and sent, per chunk
+STREAM_BATCH_SIZE = 500
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the request's Accept header names NDJSON."""
+    accept = request.headers.get("accept", "")
+    return any(part.split(";")[0].strip() == NDJSON_MEDIA_TYPE for part in accept.split(","))
+
+
+def _lines(model: Type[BaseModel], rows, include: Optional[AbstractSet[str]]) -> bytes:
+    return b"".join(
+        model.model_validate(row).model_dump_json(include=include).encode() + b"\n" for row in rows
+    )
+
+
+def _header_line(header: Optional[Dict[str, Any]]) -> bytes:
+    return json.dumps(header, default=str).encode() + b"\n"
+
+
+def ndjson_response(
+    db: Session,
+    statement: Any,
+    model: Type[BaseModel],
+    *,
+    scalars: bool = False,
+    include: Optional[AbstractSet[str]] = None,
+    header: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """Stream `statement`'s rows as NDJSON, one `model` per line.
+
+    Args:
+        db: The request's session; only its engine is used.
+        statement: Query to stream (an ORM select with `scalars`, else any
+            statement whose rows map to `model`'s fields).
+        model: The endpoint's JSON item model.
+        scalars: Stream ORM entities rather than row mappings.
+        include: Only these fields of `model` (a sparse fieldset).
+        header: Sent as the first line, for whatever in the JSON response
+            isn't a row.
+        headers: Extra response headers (e.g. the ETag).
+    """
+    bind = db.get_bind()
+
+    def lines() -> Iterator[bytes]:
+        if header is not None:
+            yield _header_line(header)
+        with Session(bind=bind) as session:
+            result = session.execute(statement, execution_options={"yield_per": STREAM_BATCH_SIZE})
+            rows = result.scalars() if scalars else result.mappings()
+            for partition in rows.partitions(STREAM_BATCH_SIZE):
+                yield _lines(model, partition, include)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+def async_ndjson_response(
+    db: AsyncSession,
+    statement: Any,
+    model: Type[BaseModel],
+    *,
+    scalars: bool = False,
+    include: Optional[AbstractSet[str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """ndjson_response for an AsyncSession; streams through AsyncSession.stream()."""
+    bind = db.bind
+
+    async def lines() -> AsyncIterator[bytes]:
+        async with AsyncSession(bind=bind) as session:
+            result = await session.stream(statement, execution_options={"yield_per": STREAM_BATCH_SIZE})
+            rows = result.scalars() if scalars else result.mappings()
+            async for partition in rows.partitions(STREAM_BATCH_SIZE):
+                yield _lines(model, partition, include)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,82 @@
+"""Opaque keyset cursors for list endpoints.
+
+A cursor encodes the (order column value, id) of the last row on a page.
+The next page is everything strictly after that pair in the list's sort
+order, so each page is an index range scan whose cost does not depend on
+how deep into the history it is — unlike OFFSET, which reads and discards
+every skipped row.
+
+Clients treat the cursor as an opaque string: they read it from the
+X-Next-Cursor response header and pass it back as ?cursor=.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _serialise(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _deserialise(value: Any, python_type: type) -> Any:
+    if value is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return value
+
+
+def encode_cursor(order_value: Any, id: UUID) -> str:
+    """Encode the last row's sort key as an opaque, URL-safe cursor."""
+    payload = json.dumps([_serialise(order_value), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_type: type) -> Tuple[Any, UUID]:
+    """Decode a cursor back into (order value, id).
+
+    Args:
+        cursor: The string previously returned by encode_cursor.
+        order_type: Python type of the order column (datetime, date, str...).
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        order_value, id = json.loads(base64.urlsafe_b64decode(padded))
+        return _deserialise(order_value, order_type), UUID(id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
+def column_python_type(column: Any) -> type:
+    """The Python type a column's values decode to, defaulting to str."""
+    try:
+        return column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return str
+
+
+def next_cursor_headers(next_cursor: Optional[str]) -> dict:
+    """Response headers advertising the next page, if there is one."""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
@@ -0,0 +1,133 @@
+"""One baby's day at a glance: counts and totals over all event tables.
+
+Each event table is aggregated in its own single-row subquery, restricted
+to the baby's local day by an index range scan on (baby_id, event time),
+and the subqueries are cross joined. The database returns one row, so the
+whole summary costs a single round trip however many events the day has.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import Integer, cast, func, select, true
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import (
+    BabyProfile,
+    DiaperEvent,
+    FeedingSession,
+    GrowthMeasurement,
+    HealthEvent,
+    SleepSession,
+)
+from app.models.feeding import FeedingType
+from app.schemas.base import _to_naive_utc
+
+
+def baby_zone(baby: BabyProfile) -> ZoneInfo:
+    """The baby's timezone, falling back to settings.TIMEZONE if unset or unknown."""
+    try:
+        return ZoneInfo(baby.timezone or settings.TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(settings.TIMEZONE)
+
+
+def local_day_bounds(day: date, zone: ZoneInfo) -> Tuple[datetime, datetime]:
+    """[start, end) of the local calendar day as naive UTC, like stored timestamps.
+
+    Computed from both midnights, so DST days are 23 or 25 hours long.
+    """
+    start = datetime.combine(day, time.min, tzinfo=zone)
+    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=zone)
+    return _to_naive_utc(start), _to_naive_utc(end)
+
+
+def _in_day(model: Any, start: datetime, end: datetime, baby_id) -> list:
+    time_col = getattr(model, model.event_time_field)
+    return [model.baby_id == baby_id, time_col >= start, time_col < end]
+
+
+def _summary_statement(baby_id, day: date, start: datetime, end: datetime):
+    feeds = select(
+        func.count().label("feed_count"),
+        func.count().filter(FeedingSession.feeding_type == FeedingType.BREAST).label("breast_feed_count"),
+        func.count().filter(FeedingSession.feeding_type == FeedingType.BOTTLE).label("bottle_feed_count"),
+        func.count().filter(FeedingSession.feeding_type == FeedingType.SOLID).label("solid_feed_count"),
+        func.sum(FeedingSession.volume_consumed_ml).label("total_volume_ml"),
+    ).where(*_in_day(FeedingSession, start, end, baby_id)).subquery("feeds")
+
+    sleep_minutes = cast(
+        func.extract("epoch", SleepSession.end_time - SleepSession.start_time) / 60, Integer
+    )
+    sleeps = select(
+        func.count().label("sleep_count"),
+        func.count().filter(SleepSession.end_time.is_(None)).label("ongoing_sleep_count"),
+        func.coalesce(func.sum(sleep_minutes), 0).label("total_sleep_minutes"),
+        func.max(sleep_minutes).label("longest_sleep_minutes"),
+    ).where(*_in_day(SleepSession, start, end, baby_id)).subquery("sleeps")
+
+    diapers = select(
+        func.count().label("diaper_count"),
+        func.count().filter(DiaperEvent.has_urine.is_(True)).label("wet_diaper_count"),
+        func.count().filter(DiaperEvent.has_stool.is_(True)).label("dirty_diaper_count"),
+    ).where(*_in_day(DiaperEvent, start, end, baby_id)).subquery("diapers")
+
+    health = select(
+        func.count().label("health_event_count"),
+    ).where(*_in_day(HealthEvent, start, end, baby_id)).subquery("health")
+
+    # Most recent weight on or before the day; growth is dated, not timed
+    latest_weight = (
+        select(GrowthMeasurement.weight_kg, GrowthMeasurement.measurement_date)
+        .where(
+            GrowthMeasurement.baby_id == baby_id,
+            GrowthMeasurement.measurement_date <= day,
+            GrowthMeasurement.weight_kg.is_not(None),
+        )
+        .order_by(GrowthMeasurement.measurement_date.desc(), GrowthMeasurement.created_at.desc())
+        .limit(1)
+    )
+
+    return select(
+        feeds,
+        sleeps,
+        diapers,
+        health,
+        latest_weight.with_only_columns(GrowthMeasurement.weight_kg)
+        .scalar_subquery().label("latest_weight_kg"),
+        latest_weight.with_only_columns(GrowthMeasurement.measurement_date)
+        .scalar_subquery().label("latest_weight_date"),
+    ).select_from(
+        # Each side is exactly one row; join them side by side
+        feeds.join(sleeps, true()).join(diapers, true()).join(health, true())
+    )
+
+
+def get_daily_summary(db: Session, baby: BabyProfile, day: Optional[date] = None) -> Dict[str, Any]:
+    """Summary of `baby`'s local day `day` (default: today where the baby is).
+
+    Args:
+        db: Database session.
+        baby: The baby profile; its timezone sets the day boundaries.
+        day: Local calendar date to summarise.
+
+    Returns:
+        A DailySummaryResponse payload.
+    """
+    zone = baby_zone(baby)
+    if day is None:
+        day = datetime.now(zone).date()
+    start, end = local_day_bounds(day, zone)
+
+    row = db.execute(_summary_statement(baby.id, day, start, end)).mappings().one()
+    return {
+        "baby_id": baby.id,
+        "date": day,
+        "timezone": zone.key,
+        "day_start": start,
+        "day_end": end,
+        **row,
+        "total_volume_ml": row["total_volume_ml"] or 0,
+    }
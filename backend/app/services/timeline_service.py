@@ -0,0 +1,122 @@
+"""Merged, newest-first timeline of one baby's events across all event tables.
+
+The timeline is a k-way merge done in Postgres: each event table contributes
+its own newest `limit` rows after the cursor — an index range scan on
+(baby_id, event time) — and a UNION ALL of those pre-sorted branches is
+sorted and cut to `limit` again. A page therefore reads at most
+5 x limit index entries however long the history is, then loads the
+winning rows by primary key.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, cast, literal, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from app.models import (
+    BabyEventModel,
+    DiaperEvent,
+    FeedingSession,
+    GrowthMeasurement,
+    HealthEvent,
+    SleepSession,
+)
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Timeline discriminator value -> event model
+TIMELINE_MODELS: Dict[str, type] = {
+    "feeding": FeedingSession,
+    "sleep": SleepSession,
+    "diaper": DiaperEvent,
+    "growth": GrowthMeasurement,
+    "health": HealthEvent,
+}
+
+TimelineEntry = Tuple[str, datetime, BabyEventModel]
+
+
+def _branch(
+    event_type: str,
+    model: type,
+    baby_id: UUID,
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]],
+):
+    """The newest `limit` (event_type, id, event_time) rows of one table."""
+    time_col = getattr(model, model.event_time_field)
+    # growth_measurements stores a date; put every branch on one timestamp axis
+    event_time = cast(time_col, DateTime) if isinstance(time_col.type, Date) else time_col
+
+    stmt = select(
+        literal(event_type).label("event_type"),
+        model.id.label("id"),
+        event_time.label("event_time"),
+    ).where(model.baby_id == baby_id)
+
+    if after is not None:
+        last_time, last_id = after
+        bound = last_time.date() if isinstance(time_col.type, Date) else last_time
+        stmt = stmt.where(
+            time_col <= bound,  # index range condition
+            tuple_(event_time, model.id) < tuple_(literal(last_time, DateTime), literal(last_id, model.id.type)),
+        )
+
+    branch = stmt.order_by(time_col.desc(), model.id.desc()).limit(limit).subquery(event_type)
+    return select(branch)
+
+
+def get_timeline(
+    db: Session,
+    baby_id: UUID,
+    *,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    event_types: Optional[Sequence[str]] = None,
+) -> Tuple[List[TimelineEntry], Optional[str]]:
+    """One page of a baby's events across all tables, newest first.
+
+    Args:
+        db: Database session.
+        baby_id: The baby whose events to list.
+        limit: Maximum number of events to return.
+        cursor: Optional cursor returned with the previous page.
+        event_types: Restrict to these TIMELINE_MODELS keys (default all).
+
+    Returns:
+        (entries, next_cursor) where each entry is
+        (event_type, event_time, ORM object) and next_cursor is None on
+        the last page.
+    """
+    after = decode_cursor(cursor, datetime) if cursor else None
+    models = {
+        event_type: model
+        for event_type, model in TIMELINE_MODELS.items()
+        if not event_types or event_type in event_types
+    }
+
+    merged = union_all(
+        *(_branch(event_type, model, baby_id, limit, after) for event_type, model in models.items())
+    ).subquery("timeline")
+    page = db.execute(
+        select(merged.c.event_type, merged.c.id, merged.c.event_time)
+        .order_by(merged.c.event_time.desc(), merged.c.id.desc())
+        .limit(limit)
+    ).all()
+
+    ids_by_type: Dict[str, List[UUID]] = {}
+    for event_type, id, _ in page:
+        ids_by_type.setdefault(event_type, []).append(id)
+
+    objects: Dict[UUID, BabyEventModel] = {}
+    for event_type, ids in ids_by_type.items():
+        model = models[event_type]
+        objects.update((obj.id, obj) for obj in db.query(model).filter(model.id.in_(ids)))
+
+    entries = [(event_type, event_time, objects[id]) for event_type, id, event_time in page]
+    next_cursor = None
+    if len(page) == limit:
+        _, last_id, last_time = page[-1]
+        next_cursor = encode_cursor(last_time, last_id)
+    return entries, next_cursor
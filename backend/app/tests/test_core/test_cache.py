@@ -0,0 +1,218 @@
+"""Tests for the result cache backends."""
+
+import pickle
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import ANY, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.cache import LRUCache, RedisCache
+from app.services import analytics_service
+
+
+class FakeRedis:
+    """Stand-in for the redis client methods RedisCache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if not (nx and key in self.data):
+            self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class TestLRUCache:
+    """Tests for the in-process LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_expired_entry_is_a_miss(self):
+        """Test entries older than the TTL are misses."""
+        cache = LRUCache(ttl_seconds=10)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", [])
+        with patch("app.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+    def test_bump_generation_clears_entries(self):
+        """Test bumping the generation drops every entry."""
+        cache = LRUCache()
+        cache.set("a", [])
+
+        assert cache.bump_generation() == 1
+        assert cache.get("a") is None
+
+    def test_get_returns_a_copy(self):
+        """Test mutating a returned value doesn't change the cached entry."""
+        cache = LRUCache()
+        cache.set("a", [{"x": 1}])
+
+        cache.get("a")[0]["x"] = 2
+
+        assert cache.get("a") == [{"x": 1}]
+
+
+class TestRedisCache:
+    """Tests for RedisCache."""
+
+    def test_round_trips_original_types(self):
+        """Test cached values come back with their original types."""
+        cache = RedisCache(FakeRedis(), prefix="analytics")
+        rows = [{
+            "metric_date": date(2026, 1, 1),
+            "refreshed_at": datetime(2026, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            "avg_feed_count": Decimal("7.25"),
+            "baby_id": uuid4(),
+        }]
+        cache.set("k", rows)
+
+        [row] = cache.get("k")
+        assert row == rows[0]
+        assert [type(value) for value in row.values()] == [type(value) for value in rows[0].values()]
+
+    def test_stores_json_not_pickle(self):
+        """Test entries are stored as JSON, which is never unpickled."""
+        client = FakeRedis()
+        RedisCache(client, prefix="analytics").set("k", [{"metric_date": date(2026, 1, 1)}])
+
+        assert client.data["analytics:k"] == b'[{"metric_date":{"$date":"2026-01-01"}}]'
+
+    @pytest.mark.parametrize("raw", [pickle.dumps([1]), b"not json", b'{"$decimal":"x"}', b'{"$uuid":1}'])
+    def test_undecodable_entries_are_misses(self, raw):
+        """Test foreign or corrupt values under the prefix are misses, not errors."""
+        client = FakeRedis()
+        client.data["analytics:k"] = raw
+        cache = RedisCache(client, prefix="analytics")
+
+        assert cache.get("k") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_errors_are_misses(self):
+        """Test Redis errors are treated as misses and an unknown generation."""
+        client = MagicMock()
+        client.get.side_effect = ConnectionError("down")
+        cache = RedisCache(client, prefix="analytics")
+
+        assert cache.get("k") is None
+        assert cache.generation() is None
+
+    def test_lost_generation_restarts_from_the_time(self):
+        """Test a missing generation key restarts past every earlier generation, not at 0."""
+        client = FakeRedis()
+        cache = RedisCache(client, prefix="analytics")
+
+        with patch("app.core.cache.time.time_ns", return_value=10**18):
+            assert cache.generation() == 10**18
+            assert cache.bump_generation() == 10**18 + 1
+
+    def test_generation_key_has_no_ttl(self):
+        """Test the generation key is written without an expiry, unlike entries."""
+        client = MagicMock()
+        client.get.side_effect = [None, b"5"]
+
+        assert RedisCache(client, prefix="analytics", ttl_seconds=60).generation() == 5
+        client.set.assert_called_once_with("analytics:generation", ANY, nx=True)
+
+    def test_bump_generation_errors_are_logged(self):
+        """Test a failed generation bump doesn't raise."""
+        client = MagicMock()
+        client.incr.side_effect = ConnectionError("down")
+        client.get.return_value = b"3"
+
+        assert RedisCache(client, prefix="analytics").bump_generation() == 3
+
+    def test_generation_shared_through_redis(self):
+        """Test a bumped generation is seen by other workers' caches."""
+        client = FakeRedis()
+        generation = RedisCache(client, prefix="analytics").bump_generation()
+
+        assert RedisCache(client, prefix="analytics").generation() == generation
+
+
+class TestAnalyticsResultCache:
+    """Tests for analytics_service's result caching."""
+
+    @pytest.fixture
+    def cache(self):
+        """Use an empty LRUCache as the analytics result cache."""
+        cache = LRUCache()
+        with patch.object(analytics_service, "result_cache", cache):
+            yield cache
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create a mock session with a mart and view fingerprint and one result row."""
+        db = MagicMock()
+        db.execute.return_value.all.return_value = [MagicMock(oid=1, writes=10), MagicMock(oid=5, writes=0)]
+        db.execute.return_value.mappings.return_value = [{"baby_id": "x"}]
+        return db
+
+    def test_second_call_served_from_cache(self, cache, mock_db):
+        """Test a repeated query only runs the fingerprint query."""
+        first = analytics_service.get_weekly_comparison(mock_db)
+        second = analytics_service.get_weekly_comparison(mock_db)
+
+        assert first == second == [{"baby_id": "x"}]
+        # fingerprint + query, then fingerprint only
+        assert mock_db.execute.call_count == 3
+
+    def test_changed_mart_is_a_miss(self, cache, mock_db):
+        """Test a rebuilt mart invalidates cached results."""
+        analytics_service.get_weekly_comparison(mock_db)
+        mock_db.execute.return_value.all.return_value = [MagicMock(oid=2, writes=0), MagicMock(oid=5, writes=0)]
+        analytics_service.get_weekly_comparison(mock_db)
+
+        assert mock_db.execute.call_count == 4
+
+    def test_changed_view_is_a_miss(self, cache, mock_db):
+        """Test a refreshed comparison view invalidates results read from it."""
+        analytics_service.get_weekly_comparison(mock_db)
+        mock_db.execute.return_value.all.return_value = [MagicMock(oid=1, writes=10), MagicMock(oid=5, writes=40)]
+        analytics_service.get_weekly_comparison(mock_db)
+
+        assert mock_db.execute.call_count == 4
+        relations = mock_db.execute.call_args_list[0].args[1]["relations"]
+        assert relations == [analytics_service.DAILY_METRICS_TABLE, analytics_service.WEEKLY_VIEW]
+
+    def test_fingerprint_read_from_the_primary(self, cache, mock_db):
+        """Test the fingerprint bypasses read replicas, whose table statistics don't advance."""
+        analytics_service.get_weekly_comparison(mock_db)
+
+        assert mock_db.execute.call_args_list[0].kwargs["bind_arguments"] == {"primary": True}
+
+    def test_invalidate_is_a_miss(self, cache, mock_db):
+        """Test invalidate_cache() invalidates cached results."""
+        analytics_service.get_weekly_comparison(mock_db)
+        analytics_service.invalidate_cache()
+        analytics_service.get_weekly_comparison(mock_db)
+
+        assert mock_db.execute.call_count == 4
+
+    def test_unknown_generation_bypasses_the_cache(self, cache, mock_db):
+        """Test results are neither read from nor written to the cache while the generation is unknown."""
+        analytics_service.get_weekly_comparison(mock_db)
+        with patch.object(cache, "generation", return_value=None):
+            assert analytics_service.mart_version(mock_db) is None
+            analytics_service.get_weekly_comparison(mock_db)
+
+        assert mock_db.execute.call_count == 5
+        assert cache.stats()["hits"] == 0
@@ -0,0 +1,151 @@
+"""Tests for negotiated response compression."""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, Encoder, choose_encoding
+
+BODY = b'{"volume_consumed_ml":120,"feeding_type":"bottle"},' * 200
+
+
+@pytest.fixture
+def client():
+    """Create an app with the compression middleware and a route per kind of body."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, thread_threshold=1000)
+
+    @app.get("/json")
+    def json_body():
+        return Response(BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return Response(b"[]", media_type="application/json")
+
+    @app.get("/binary")
+    def binary():
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BODY, BODY]), media_type="application/x-ndjson")
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse(BODY.decode())
+
+    return TestClient(app)
+
+
+def raw(client, path, accept_encoding):
+    """The response to GET `path` and its body as sent, still encoded."""
+    with client.stream("GET", path, headers={"accept-encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestChooseEncoding:
+    """Tests for choose_encoding()."""
+
+    @pytest.mark.parametrize("header, expected", [
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+        ("deflate, identity", None),
+        ("", None),
+        ("gzip;q=x", None),
+    ])
+    def test_negotiation(self, header, expected):
+        """Test the Accept-Encoding q-values pick the encoding, preferring brotli."""
+        assert choose_encoding(header, ("br", "gzip")) == expected
+
+    def test_gzip_only_without_brotli(self):
+        """Test gzip is chosen when brotli isn't available."""
+        assert choose_encoding("br, gzip", ("gzip",)) == "gzip"
+
+
+class TestEncoder:
+    """Tests for Encoder."""
+
+    def test_gzip_chunks_form_one_stream(self):
+        """Test chunks compressed in turn decompress as one gzip stream."""
+        encoder = Encoder("gzip", gzip_level=6, brotli_quality=4)
+
+        out = encoder.compress(b"abc" * 100, last=False) + encoder.compress(b"def", last=True)
+
+        assert gzip.decompress(out) == b"abc" * 100 + b"def"
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    def test_gzip(self, client):
+        """Test a JSON body is gzipped, with Content-Length and Vary set."""
+        response, body = raw(client, "/json", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-length"] == str(len(body))
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert gzip.decompress(body) == BODY
+
+    def test_identity_when_not_accepted(self, client):
+        """Test the body is sent as is when no supported encoding is accepted."""
+        response, body = raw(client, "/json", "identity")
+
+        assert "content-encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert body == BODY
+
+    def test_small_bodies_left_alone(self, client):
+        """Test bodies under minimum_size aren't compressed."""
+        response, body = raw(client, "/small", "gzip")
+
+        assert "content-encoding" not in response.headers
+        assert body == b"[]"
+
+    def test_binary_types_left_alone(self, client):
+        """Test already compressed media types aren't compressed or varied."""
+        response, body = raw(client, "/binary", "gzip")
+
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+        assert body == BODY
+
+    def test_text_compressed(self, client):
+        """Test text/plain bodies are compressed."""
+        response, body = raw(client, "/text", "gzip")
+
+        assert gzip.decompress(body) == BODY
+
+    def test_streaming_compressed_per_chunk(self, client):
+        """Test streamed bodies are compressed chunk by chunk without Content-Length."""
+        response, body = raw(client, "/stream", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(body) == BODY + BODY
+
+    def test_large_bodies_compressed_in_thread(self, client):
+        """Test bodies over thread_threshold are compressed off the event loop."""
+        with patch.object(compression.anyio.to_thread, "run_sync", wraps=compression.anyio.to_thread.run_sync) as run_sync:
+            response, body = raw(client, "/json", "gzip")
+
+        assert run_sync.called
+        assert gzip.decompress(body) == BODY
+
+    def test_brotli(self, client):
+        """Test brotli is used when accepted and installed."""
+        brotli = pytest.importorskip("brotli")
+
+        response, body = raw(client, "/json", "br, gzip")
+
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(body) == BODY
@@ -0,0 +1,40 @@
+"""Tests for lazy engine creation."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def run_python(code: str) -> str:
+    """Run `code` in a fresh interpreter and return what it printed."""
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestLazyEngine:
+    """Tests for creating engines on first use."""
+
+    def test_importing_the_app_creates_no_engine(self):
+        """Test importing the app builds no engine or schema and loads no driver or numpy."""
+        output = run_python(
+            "import sys, app.main\n"
+            "from app.core import database\n"
+            "print(database.get_engine.cache_info().currsize, app.main.app.openapi_schema,"
+            " 'psycopg2' in sys.modules, 'numpy' in sys.modules)"
+        )
+
+        assert output == "0 None False False"
+
+    def test_module_attributes_resolve_to_the_shared_engine(self):
+        """Test the engine and SessionLocal attributes resolve to the shared ones."""
+        output = run_python(
+            "from app.core import database\n"
+            "from app.core.database import SessionLocal, engine\n"
+            "print(engine is database.get_engine(), SessionLocal.kw['bind'] is engine,"
+            " database.async_engine)"
+        )
+
+        assert output == "True True None"
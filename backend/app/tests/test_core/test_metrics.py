@@ -0,0 +1,131 @@
+"""Tests for per-route request metrics."""
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.metrics import UNMATCHED_ROUTE, MetricsMiddleware, RouteMetrics, route_template
+
+
+@pytest.fixture
+def registry():
+    """Create an empty metrics registry."""
+    return RouteMetrics()
+
+
+@pytest.fixture
+def app(registry):
+    """Create an app with the metrics middleware and a few routes."""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, router=app.router, metrics=registry)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return Response(b"x" * 2000, media_type="application/json")
+
+    @app.post("/items/")
+    def create_item():
+        return {"ok": True}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def scope(method, path):
+    """An HTTP scope for `method` and `path`."""
+    return {"type": "http", "method": method, "path": path}
+
+
+class TestRouteTemplate:
+    """Tests for route_template()."""
+
+    def test_path_parameters_use_the_template(self, app):
+        """Test a concrete path maps to its route template."""
+        assert route_template(app.router, scope("GET", "/items/42")) == "/items/{item_id}"
+
+    def test_wrong_method_uses_the_template(self, app):
+        """Test a path with the wrong method still maps to its template."""
+        assert route_template(app.router, scope("DELETE", "/items/42")) == "/items/{item_id}"
+
+    def test_unknown_path(self, app):
+        """Test a path matching no route is grouped as unmatched."""
+        assert route_template(app.router, scope("GET", "/nope/1")) == UNMATCHED_ROUTE
+
+
+class TestMetricsMiddleware:
+    """Tests for MetricsMiddleware."""
+
+    def test_counts_by_template_and_status(self, app, registry):
+        """Test requests are counted by method, route template and status."""
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/items/x")
+        client.get("/nope")
+
+        assert registry.requests == {
+            ("GET", "/items/{item_id}", 200): 2,
+            ("GET", "/items/{item_id}", 422): 1,
+            ("GET", UNMATCHED_ROUTE, 404): 1,
+        }
+        assert registry.in_progress[("GET", "/items/{item_id}")] == 0
+
+    def test_sizes_and_durations(self, app, registry):
+        """Test response sizes and durations are recorded per route."""
+        TestClient(app).get("/items/1")
+
+        key = ("GET", "/items/{item_id}")
+        assert registry.sizes[key].snapshot()["sum_ms"] == 2000
+        assert registry.durations[key].snapshot()["count"] == 1
+
+    def test_errors_recorded_as_500(self, app, registry):
+        """Test an unhandled error counts as a 500 and ends the in-flight count."""
+        TestClient(app, raise_server_exceptions=False).get("/boom")
+
+        assert registry.requests[("GET", "/boom", 500)] == 1
+        assert registry.in_progress[("GET", "/boom")] == 0
+
+
+class TestRender:
+    """Tests for RouteMetrics.render()."""
+
+    def test_prometheus_text(self, app, registry):
+        """Test counters and histograms are rendered in Prometheus text format."""
+        client = TestClient(app)
+        client.get("/items/1")
+        client.post("/items/")
+
+        text = registry.render()
+
+        assert '# TYPE http_requests_total counter' in text
+        assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 1' in text
+        assert 'http_requests_total{method="POST",route="/items/",status="200"} 1' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/items/{item_id}",le="+Inf"} 1' in text
+        assert 'http_response_size_bytes_bucket{method="GET",route="/items/{item_id}",le="1024"} 0' in text
+        assert 'http_response_size_bytes_bucket{method="GET",route="/items/{item_id}",le="4096"} 1' in text
+        assert 'http_response_size_bytes_sum{method="GET",route="/items/{item_id}"} 2000' in text
+        assert text.endswith("\n")
+
+    def test_large_and_fractional_values_in_full(self, registry):
+        """Test large byte bounds and sums are integers, and seconds keep every digit."""
+        registry.started(("GET", "/big"))
+        registry.finished(("GET", "/big"), 200, 12.345, 3_000_001)
+
+        text = registry.render()
+
+        assert 'http_response_size_bytes_bucket{method="GET",route="/big",le="1048576"} 0' in text
+        assert 'http_response_size_bytes_bucket{method="GET",route="/big",le="4194304"} 1' in text
+        assert 'http_response_size_bytes_sum{method="GET",route="/big"} 3000001' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/big",le="0.025"} 1' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/big",le="10"} 1' in text
+        assert 'http_request_duration_seconds_sum{method="GET",route="/big"} 0.012345' in text
+
+    def test_label_values_escaped(self, registry):
+        """Test quotes and backslashes in label values are escaped."""
+        registry.started(("GET", 'a"b\\c'))
+        registry.finished(("GET", 'a"b\\c'), 200, 1.0, 10)
+
+        assert 'route="a\\"b\\\\c"' in registry.render()
@@ -0,0 +1,83 @@
+"""Tests for connection pool instrumentation."""
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+from app.core.pool import LatencyHistogram, PoolStats, instrumented_pool_class, pool_status
+
+
+@pytest.fixture
+def stats():
+    """Create empty pool statistics."""
+    return PoolStats()
+
+
+@pytest.fixture
+def engine(stats):
+    """Create an instrumented one-connection pool with one overflow and a 50 ms timeout."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=instrumented_pool_class(QueuePool, stats),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestInstrumentedPool:
+    """Tests for instrumented_pool_class()."""
+
+    def test_checkouts_are_counted_and_timed(self, engine, stats):
+        """Test each checkout is counted and its wait timed."""
+        with engine.connect():
+            pass
+        with engine.connect():
+            pass
+
+        assert stats.checkouts == 2
+        assert stats.checkout_latency.snapshot()["count"] == 2
+
+    def test_overflow_checkout_recorded(self, engine, stats):
+        """Test checkouts beyond pool_size are counted as overflow."""
+        with engine.connect(), engine.connect():
+            status = pool_status(engine.pool)
+
+        assert stats.overflow_checkouts == 1
+        assert status["checked_out"] == 2
+        assert status["overflow"] == 1
+
+    def test_timeout_recorded(self, engine, stats):
+        """Test a checkout that times out is counted with its wait."""
+        with engine.connect(), engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert stats.timeouts == 1
+        assert stats.max_wait_ms >= 50
+
+    def test_stats_survive_dispose(self, engine, stats):
+        """Test the pool recreated by dispose() keeps recording into the same stats."""
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert engine.pool.stats is stats
+        assert stats.checkouts == 1
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_observations_land_in_upper_bound_bucket(self):
+        """Test values land in the first bucket whose bound is at least the value."""
+        histogram = LatencyHistogram([1, 10])
+
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"1": 2, "10": 1, "+Inf": 1}
+        assert snapshot["count"] == 4
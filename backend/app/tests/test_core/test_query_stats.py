@@ -0,0 +1,109 @@
+"""Tests for per-request SQL statement counts and timing."""
+
+import logging
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.query_stats import QueryStatsMiddleware, RequestQueries, instrument_engine
+
+
+@pytest.fixture
+def engine():
+    """Create an instrumented in-memory SQLite engine."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    """Create an app with the query stats middleware, a budget of 3 and repeat threshold of 3."""
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, budget=3, repeat_threshold=3)
+
+    @app.get("/queries/{n}")
+    def run_queries(n: int):
+        with engine.connect() as conn:
+            for i in range(n):
+                conn.execute(text("select :i"), {"i": i})
+        return {"ran": n}
+
+    @app.get("/mixed")
+    def run_distinct():
+        with engine.connect() as conn:
+            for i in range(4):
+                conn.execute(text(f"select {i}"))
+        return {}
+
+    return TestClient(app)
+
+
+def timing(response):
+    """The (duration, query count) in a response's Server-Timing header."""
+    match = re.fullmatch(r'db;dur=([\d.]+);desc="(\d+) queries"', response.headers["server-timing"])
+    return float(match[1]), int(match[2])
+
+
+class TestQueryStatsMiddleware:
+    """Tests for QueryStatsMiddleware."""
+
+    def test_server_timing_counts_statements(self, client):
+        """Test Server-Timing reports the request's statement count and time."""
+        duration, count = timing(client.get("/queries/2"))
+
+        assert count == 2
+        assert duration >= 0
+
+    def test_no_statements(self, client):
+        """Test a request that runs no SQL reports zero."""
+        assert timing(client.get("/queries/0")) == (0.0, 0)
+
+    def test_statements_outside_requests_are_ignored(self, engine, client):
+        """Test statements run outside a request aren't counted."""
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+
+        assert timing(client.get("/queries/1"))[1] == 1
+
+    def test_within_budget_logs_nothing(self, client, caplog):
+        """Test nothing is logged within the budget."""
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            client.get("/queries/2")
+
+        assert caplog.records == []
+
+    def test_over_budget_logged(self, client, caplog):
+        """Test requests over the query budget are logged."""
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            client.get("/mixed")
+
+        [record] = caplog.records
+        assert "GET /mixed ran 4 queries (budget 3)" in record.getMessage()
+
+    def test_repeated_statement_flagged(self, client, caplog):
+        """Test a statement repeated past the threshold is logged as a likely N+1."""
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            client.get("/queries/3")
+
+        [record] = caplog.records
+        assert "ran the same statement 3 times, likely N+1: select ?" in record.getMessage()
+
+
+class TestRequestQueries:
+    """Tests for RequestQueries."""
+
+    def test_repeated_most_common_first(self):
+        """Test repeated statements are listed most frequent first, with totals."""
+        queries = RequestQueries()
+        for statement in ["a", "b", "b", "a", "b", "c"]:
+            queries.record(statement, 1.0)
+
+        assert queries.repeated(2) == [("b", 3), ("a", 2)]
+        assert queries.count == 6
+        assert queries.server_timing() == 'db;dur=6.0;desc="6 queries"'
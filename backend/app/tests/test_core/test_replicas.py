@@ -0,0 +1,250 @@
+"""Tests for read-replica routing."""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import database, replicas as replicas_module
+from app.core.replicas import READ_PRIMARY_COOKIE, RecentWrites, ReplicaSet, RoutingSession, read_replayed_or_primary
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+class Clock:
+    """A settable clock for RecentWrites."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_db(path, name):
+    """Create a SQLite database at `path` with one item called `name`."""
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(items).values(name=name))
+    return engine
+
+
+@pytest.fixture
+def primary(tmp_path):
+    """Create the primary database."""
+    engine = make_db(tmp_path / "primary.db", "on primary")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica_url(tmp_path):
+    """Create the replica database and return its URL."""
+    make_db(tmp_path / "replica.db", "on replica").dispose()
+    return f"sqlite:///{tmp_path / 'replica.db'}"
+
+
+@pytest.fixture
+def replicas(replica_url):
+    """Create a ReplicaSet of the one replica."""
+    return ReplicaSet([replica_url], engine_factory=lambda name, url: create_engine(url), max_lag_s=30)
+
+
+@pytest.fixture
+def clock():
+    """Create a clock for read-your-writes."""
+    return Clock()
+
+
+@pytest.fixture
+def client(monkeypatch, primary, replicas, clock):
+    """Create an app whose get_db routes between the primary and replica."""
+    monkeypatch.setattr(database, "get_session_factory", lambda: sessionmaker(class_=RoutingSession, bind=primary))
+    monkeypatch.setattr(database, "get_replicas", lambda: replicas)
+    monkeypatch.setattr(database, "recent_writes", RecentWrites(5.0, clock=clock))
+
+    app = FastAPI()
+
+    @app.get("/items")
+    def list_items(db: Session = Depends(database.get_db)):
+        return db.execute(select(items.c.name)).scalars().all()
+
+    @app.post("/items")
+    def create_item(db: Session = Depends(database.get_db)):
+        db.execute(insert(items).values(name="written"))
+        db.commit()
+        return {}
+
+    @app.get("/broken")
+    def broken(db: Session = Depends(database.get_db)):
+        db.execute(text("select * from missing_table"))
+
+    return TestClient(app)
+
+
+def names(response):
+    """The sorted item names in a response."""
+    return sorted(response.json())
+
+
+class TestGetDbRouting:
+    """Tests for get_db's replica routing."""
+
+    def test_reads_use_the_replica(self, client):
+        """Test GET requests read from the replica."""
+        assert names(client.get("/items")) == ["on replica"]
+
+    def test_writes_use_the_primary(self, client, primary):
+        """Test write requests go to the primary."""
+        client.post("/items")
+
+        with primary.connect() as conn:
+            assert conn.execute(select(items.c.name)).scalars().all() == ["on primary", "written"]
+
+    def test_read_your_writes_within_the_window(self, client, clock):
+        """Test a client reads the primary for a while after its own writes."""
+        client.post("/items", headers={"X-Client-Id": "a"})
+
+        assert names(client.get("/items")) == ["on primary", "written"]
+        assert names(TestClient(client.app).get("/items", headers={"X-Client-Id": "b"})) == ["on replica"]
+
+        clock.now += 6
+        assert names(client.get("/items")) == ["on replica"]
+
+    def test_write_carried_to_other_workers(self, client, clock, monkeypatch):
+        """Test the cookie sends a client's next read to the primary in a worker that didn't see the write."""
+        client.post("/items")
+        monkeypatch.setattr(database, "recent_writes", RecentWrites(5.0, clock=clock))
+
+        assert names(client.get("/items")) == ["on primary", "written"]
+
+    def test_client_id_without_cookies(self, client):
+        """Test clients that drop cookies are still matched by X-Client-Id within a worker."""
+        client.post("/items", headers={"X-Client-Id": "a"})
+        client.cookies.clear()
+
+        assert names(client.get("/items", headers={"X-Client-Id": "a"})) == ["on primary", "written"]
+        assert names(client.get("/items", headers={"X-Client-Id": "b"})) == ["on replica"]
+
+    def test_write_marked_on_the_response(self, client, monkeypatch):
+        """Test a write request records its client and sets the read-primary cookie."""
+        marked = []
+        monkeypatch.setattr(database.recent_writes, "record", marked.append)
+
+        response = client.post("/items", headers={"X-Client-Id": "a"})
+
+        assert marked == ["id:a"]
+        assert READ_PRIMARY_COOKIE in response.cookies
+
+    def test_no_healthy_replica_reads_the_primary(self, client, replicas):
+        """Test reads fall back to the primary with no healthy replica."""
+        replicas.replicas[0].healthy = False
+
+        assert names(client.get("/items")) == ["on primary"]
+
+    def test_replica_errors_take_it_out_of_rotation(self, client, replicas):
+        """Test a failed replica connection marks the replica unhealthy."""
+        TestClient(client.app, raise_server_exceptions=False).get("/broken")
+
+        assert replicas.replicas[0].healthy is False
+        assert names(client.get("/items")) == ["on primary"]
+
+
+class TestRoutingSession:
+    """Tests for RoutingSession."""
+
+    def test_dml_goes_to_the_primary(self, primary, replicas):
+        """Test DML goes to the primary while reads use the replica."""
+        with RoutingSession(bind=primary, replica=replicas.choose()) as db:
+            db.execute(insert(items).values(name="written"))
+            db.commit()
+            assert db.execute(select(items.c.name)).scalars().all() == ["on replica"]
+
+        with primary.connect() as conn:
+            assert "written" in conn.execute(select(items.c.name)).scalars().all()
+
+    def test_without_replica_uses_the_primary(self, primary):
+        """Test a session without a replica reads the primary."""
+        with RoutingSession(bind=primary) as db:
+            assert db.execute(select(items.c.name)).scalars().all() == ["on primary"]
+
+    def test_primary_bind_argument(self, primary, replicas):
+        """Test bind_arguments={"primary": True} reads one statement from the primary."""
+        with RoutingSession(bind=primary, replica=replicas.choose()) as db:
+            stmt = select(items.c.name)
+
+            assert db.execute(stmt, bind_arguments={"primary": True}).scalars().all() == ["on primary"]
+            assert db.execute(stmt).scalars().all() == ["on replica"]
+
+
+class TestReadReplayedOrPrimary:
+    """Tests for read_replayed_or_primary()."""
+
+    @pytest.fixture(autouse=True)
+    def replayed_up_to(self, monkeypatch):
+        """Pretend every replica has replayed exactly up to WAL position 0/10."""
+        monkeypatch.setattr(replicas_module, "_REPLAYED_QUERY", text("select :lsn = '0/10'"))
+
+    @pytest.mark.parametrize("lsn, expected", [("0/10", ["on replica"]), ("0/20", ["on primary"])])
+    def test_lagging_replica_switches_to_the_primary(self, primary, replicas, lsn, expected):
+        """Test the session keeps its replica only if it has replayed the position."""
+        with RoutingSession(bind=primary, replica=replicas.choose()) as db:
+            read_replayed_or_primary(db, lsn)
+
+            assert db.execute(select(items.c.name)).scalars().all() == expected
+
+    def test_sessions_without_a_replica_are_left_alone(self, primary):
+        """Test nothing is queried for sessions that already read the primary."""
+        with Session(bind=primary) as db:
+            read_replayed_or_primary(db, "0/20")
+
+            assert not db.in_transaction()
+
+
+class TestReplicaSet:
+    """Tests for ReplicaSet."""
+
+    def test_health_check_failover_and_recovery(self, tmp_path, replica_url):
+        """Test failing replicas leave rotation and rejoin once their check passes."""
+        urls = [replica_url, f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"]
+        replicas = ReplicaSet(urls, engine_factory=lambda name, url: create_engine(url), max_lag_s=30)
+
+        replicas.check()
+
+        status = replicas.status()
+        assert status["replica-0"]["healthy"] is True
+        assert status["replica-1"]["healthy"] is False
+        assert "OperationalError" in status["replica-1"]["error"]
+        assert {replicas.choose() for _ in range(4)} == {replicas.replicas[0].engine}
+
+        (tmp_path / "missing").mkdir()
+        replicas.check()
+        assert replicas.replicas[1].healthy is True
+        assert {replicas.choose() for _ in range(4)} == {r.engine for r in replicas.replicas}
+
+    def test_no_replicas(self):
+        """Test choose() returns None without replicas."""
+        assert ReplicaSet([], engine_factory=create_engine, max_lag_s=30).choose() is None
+
+
+class TestRecentWrites:
+    """Tests for RecentWrites."""
+
+    def test_window_and_pruning(self, clock):
+        """Test writes count within the window and older ones are pruned."""
+        writes = RecentWrites(5.0, clock=clock)
+        writes.record("a")
+        clock.now += 3
+        writes.record("b")
+
+        assert writes.recent("a") and writes.recent("b")
+        assert not writes.recent("c")
+
+        clock.now += 3
+        writes.record("c")
+
+        assert not writes.recent("a")
+        assert "a" not in writes._written
@@ -0,0 +1,61 @@
+"""Tests for the discriminated timeline response schema."""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.timeline import (
+    DiaperTimelineItem,
+    GrowthTimelineItem,
+    TimelineResponse,
+)
+
+
+def make_event(**fields) -> dict:
+    """Event payload with the response base fields filled in."""
+    now = datetime(2026, 2, 1, 9, 0)
+    return {"id": uuid4(), "baby_id": uuid4(), "created_at": now, "updated_at": now, **fields}
+
+
+class TestTimelineResponse:
+    """Tests for TimelineResponse."""
+
+    def test_items_resolve_by_event_type(self):
+        """Test each item's event is parsed as the schema its event_type names."""
+        resp = TimelineResponse(items=[
+            {
+                "event_type": "diaper",
+                "event_time": datetime(2026, 2, 1, 9, 0),
+                "event": make_event(timestamp=datetime(2026, 2, 1, 9, 0), has_urine=True),
+            },
+            {
+                "event_type": "growth",
+                "event_time": datetime(2026, 2, 1),
+                "event": make_event(measurement_date=date(2026, 2, 1), weight_kg=4.2),
+            },
+        ])
+
+        assert isinstance(resp.items[0], DiaperTimelineItem)
+        assert isinstance(resp.items[1], GrowthTimelineItem)
+        assert resp.items[1].event.weight_kg == 4.2
+        assert resp.next_cursor is None
+
+    def test_unknown_event_type_rejected(self):
+        """Test an unknown event_type fails validation."""
+        with pytest.raises(ValidationError):
+            TimelineResponse(items=[{
+                "event_type": "bath",
+                "event_time": datetime(2026, 2, 1),
+                "event": make_event(),
+            }])
+
+    def test_payload_must_match_event_type(self):
+        """Test an event that doesn't fit its event_type's schema fails validation."""
+        with pytest.raises(ValidationError):
+            TimelineResponse(items=[{
+                "event_type": "health",
+                "event_time": datetime(2026, 2, 1),
+                "event": make_event(timestamp=datetime(2026, 2, 1), has_urine=True),
+            }])
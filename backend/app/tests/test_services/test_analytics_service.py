@@ -0,0 +1,58 @@
+"""Tests for the materialized comparison views in analytics_service."""
+
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import ProgrammingError
+
+from app.services import analytics_service
+from app.services.analytics_service import BABIES_VIEW, WEEKLY_VIEW, refresh_comparison_views
+
+
+def executed_sql(db):
+    """The SQL of every statement executed on a mock session, in order."""
+    return [str(call.args[0]) for call in db.execute.call_args_list]
+
+
+class TestRefreshComparisonViews:
+    """Tests for refresh_comparison_views()."""
+
+    def test_missing_views_are_created_with_unique_index(self):
+        """Test missing views are created, each with the unique index CONCURRENTLY needs."""
+        db = MagicMock()
+        db.execute.return_value.scalar.return_value = None
+
+        actions = refresh_comparison_views(db)
+
+        assert actions == {WEEKLY_VIEW: "created", BABIES_VIEW: "created"}
+        sql = executed_sql(db)
+        assert any(s.startswith(f"create materialized view {WEEKLY_VIEW}") for s in sql)
+        assert any(s.startswith("create unique index analytics_weekly_comparison_key") for s in sql)
+        db.commit.assert_called_once()
+
+    def test_existing_views_are_refreshed_concurrently(self):
+        """Test existing views are refreshed CONCURRENTLY."""
+        db = MagicMock()
+        db.execute.return_value.scalar.return_value = "public.view"
+
+        actions = refresh_comparison_views(db)
+
+        assert set(actions.values()) == {"refreshed"}
+        assert f"refresh materialized view concurrently {BABIES_VIEW}" in executed_sql(db)
+
+
+class TestComparisonQueries:
+    """Tests for the /analytics/compare queries."""
+
+    def test_comparison_falls_back_to_live_query_without_view(self, monkeypatch):
+        """Test the live aggregate runs when the view hasn't been created yet."""
+        monkeypatch.setattr(analytics_service, "result_cache", None)
+        db = MagicMock()
+        live = MagicMock()
+        live.mappings.return_value = [{"baby_id": "a", "age_weeks": 1}]
+        db.execute.side_effect = [ProgrammingError("select", {}, Exception("no view")), live]
+
+        rows = analytics_service.get_weekly_comparison(db)
+
+        assert rows == [{"baby_id": "a", "age_weeks": 1}]
+        db.rollback.assert_called_once()
+        assert "group by baby_id, baby_name, age_weeks" in executed_sql(db)[1]
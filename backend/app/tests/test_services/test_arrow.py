@@ -0,0 +1,79 @@
+"""Tests for Arrow IPC analytics responses."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.analytics import BabySummary, WeeklyMetricsRow
+from app.services.arrow import ARROW_STREAM_MEDIA_TYPE, arrow_response, wants_arrow
+
+pa = pytest.importorskip("pyarrow")
+
+
+def request_accepting(accept):
+    """A mock request sending `accept` as its Accept header (None: no header)."""
+    request = MagicMock()
+    request.headers = {"accept": accept} if accept is not None else {}
+    return request
+
+
+def read(response):
+    """The Arrow table in a response's IPC stream."""
+    return pa.ipc.open_stream(response.body).read_all()
+
+
+class TestWantsArrow:
+    """Tests for Accept header negotiation of Arrow responses."""
+
+    @pytest.mark.parametrize(
+        "accept, expected",
+        [
+            (None, False),
+            ("application/json", False),
+            (ARROW_STREAM_MEDIA_TYPE, True),
+            (f"application/json;q=0.5, {ARROW_STREAM_MEDIA_TYPE};q=1", True),
+        ],
+    )
+    def test_wants_arrow(self, accept, expected):
+        """Test Arrow is chosen only when the client prefers the Arrow stream type."""
+        assert wants_arrow(request_accepting(accept)) is expected
+
+
+class TestArrowResponse:
+    """Tests for arrow_response()."""
+
+    def test_columns_typed_from_response_model(self):
+        """Test columns follow the response model's fields and types, dropping extras."""
+        baby_id = uuid4()
+        columns = {
+            "baby_id": [baby_id],
+            "baby_name": ["A"],
+            "date_of_birth": [date(2026, 1, 1)],
+            "max_age_days": [30],
+            "extra": ["ignored"],
+        }
+
+        response = arrow_response(columns, BabySummary, headers={"ETag": 'W/"x"'})
+
+        table = read(response)
+        assert response.media_type == ARROW_STREAM_MEDIA_TYPE
+        assert response.headers["etag"] == 'W/"x"'
+        assert table.schema.names == list(BabySummary.model_fields)
+        assert table.schema.field("date_of_birth").type == pa.date32()
+        assert table.to_pylist()[0]["baby_id"] == str(baby_id)
+
+    def test_decimal_averages_become_nullable_doubles(self):
+        """Test Decimal averages are sent as nullable doubles and metadata as JSON."""
+        columns = {name: [None] for name in WeeklyMetricsRow.model_fields}
+        columns.update(baby_id=[uuid4()], baby_name=["A"], age_weeks=[1], days_in_week=[7])
+        columns["avg_feed_count"] = [Decimal("7.5")]
+
+        table = read(arrow_response(columns, WeeklyMetricsRow, metadata={"align": "age_weeks"}))
+
+        row = table.to_pylist()[0]
+        assert row["avg_feed_count"] == 7.5 and row["avg_diaper_count"] is None
+        assert table.schema.field("avg_feed_count").nullable
+        assert table.schema.metadata[b"align"] == b'"age_weeks"'
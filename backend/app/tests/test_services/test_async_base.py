@@ -0,0 +1,106 @@
+"""Tests for the async CRUD service base class."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.models import FeedingSession
+from app.services.async_base import AsyncCRUDBase
+
+
+class SampleCreateSchema(BaseModel):
+    """Sample schema for create operations."""
+    baby_id: UUID
+    notes: str | None = None
+
+
+class SampleUpdateSchema(BaseModel):
+    """Sample schema for update operations."""
+    notes: str | None = None
+
+
+@pytest.fixture
+def service():
+    """Create an AsyncCRUDBase for FeedingSession."""
+    return AsyncCRUDBase(FeedingSession)
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock AsyncSession."""
+    db = MagicMock()
+    db.get = AsyncMock()
+    db.scalars = AsyncMock(return_value=[])
+    db.commit = AsyncMock()
+    db.refresh = AsyncMock()
+    db.delete = AsyncMock()
+    return db
+
+
+class TestAsyncCRUDBase:
+    """Tests for AsyncCRUDBase."""
+
+    @pytest.mark.asyncio
+    async def test_get_or_404_raises_when_missing(self, service, mock_db):
+        """Test get_or_404() raises 404 naming the model when no record is found."""
+        mock_db.get.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_or_404(mock_db, uuid4())
+
+        assert exc_info.value.status_code == 404
+        assert "FeedingSession" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_get_multi_builds_same_sql_as_sync(self, service, mock_db):
+        """Test get_multi() filters and orders as the sync CRUDBase does."""
+        baby_id = uuid4()
+
+        await service.get_multi(mock_db, baby_id=baby_id, order_by_field="start_time", limit=20)
+
+        (stmt,), _ = mock_db.scalars.call_args
+        sql = str(stmt)
+        assert "feeding_sessions.baby_id = :baby_id_1" in sql
+        assert "ORDER BY feeding_sessions.start_time DESC, feeding_sessions.id DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_update_commits_and_refreshes(self, service, mock_db):
+        """Test update() applies the fields, commits and refreshes."""
+        db_obj = MagicMock()
+
+        result = await service.update(mock_db, db_obj=db_obj, obj_in=SampleUpdateSchema(notes="hi"))
+
+        assert db_obj.notes == "hi"
+        mock_db.commit.assert_awaited_once()
+        mock_db.refresh.assert_awaited_once_with(db_obj)
+        assert result is db_obj
+
+    @pytest.mark.asyncio
+    async def test_remove_deletes_and_commits(self, service, mock_db):
+        """Test remove() deletes the record and commits."""
+        existing = MagicMock()
+        mock_db.get.return_value = existing
+
+        await service.remove(mock_db, id=uuid4())
+
+        mock_db.delete.assert_awaited_once_with(existing)
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_hooks_run_on_the_sync_session(self, mock_db):
+        """Test write hooks get the values through run_sync before the insert."""
+        def shout(db, values):
+            for row in values:
+                row["notes"] = row["notes"].upper()
+
+        service = AsyncCRUDBase(FeedingSession, write_hooks=[shout])
+        mock_db.run_sync = AsyncMock(side_effect=lambda fn, *args: fn(mock_db.sync_session, *args))
+
+        created = await service.create(mock_db, obj_in=SampleCreateSchema(baby_id=uuid4(), notes="hi"))
+
+        assert created.notes == "HI"
+        mock_db.run_sync.assert_awaited_once()
+
@@ -1,6 +1,6 @@
 """Tests for the generic CRUD service base class."""
 
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -154,6 +154,86 @@ class TestCRUDBase:
 
         mock_query.order_by.assert_called_once()
 
+    def test_get_multi_with_cursor_filters_after_cursor(self, mock_db):
+        """Test get_multi() adds a keyset filter when given a cursor."""
+        from app.models import FeedingSession
+        from app.services.pagination import encode_cursor
+
+        service = CRUDBase(FeedingSession)
+        cursor = encode_cursor(datetime(2026, 1, 1, 8, 0), uuid4())
+        mock_query = mock_db.query.return_value
+        mock_query.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
+
+        service.get_multi(mock_db, order_by_field="start_time", cursor=cursor)
+
+        (keyset_filter,), _ = mock_query.filter.call_args
+        assert "<" in str(keyset_filter)
+
+    def test_get_multi_with_time_range_filters_event_time(self, mock_db):
+        """Test get_multi() bounds the model's event_time_field by since/until."""
+        from app.models import DiaperEvent
+
+        service = CRUDBase(DiaperEvent)
+        mock_query = mock_db.query.return_value
+        mock_query.filter.return_value.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
+
+        service.get_multi(
+            mock_db, since=datetime(2026, 2, 1), until=datetime(2026, 2, 8)
+        )
+
+        since_filter = mock_query.filter.call_args.args[0]
+        until_filter = mock_query.filter.return_value.filter.call_args.args[0]
+        assert str(since_filter) == "diaper_events.timestamp >= :timestamp_1"
+        assert str(until_filter) == "diaper_events.timestamp < :timestamp_1"
+
+    def test_time_range_bounds_normalised_to_naive_utc(self):
+        """Test aware bounds are converted to naive UTC, and to dates for Date columns."""
+        from app.models import DiaperEvent, GrowthMeasurement
+
+        aware = datetime(2026, 2, 1, 10, 0, tzinfo=timezone(timedelta(hours=10)))
+
+        assert CRUDBase._time_bound(DiaperEvent.timestamp, aware) == datetime(2026, 2, 1, 0, 0)
+        assert CRUDBase._time_bound(GrowthMeasurement.measurement_date, aware) == date(2026, 2, 1)
+
+    def test_date_bounds_keep_the_local_calendar_date(self):
+        """Test Date column bounds use the bound's own date, not its UTC date."""
+        from app.models import GrowthMeasurement
+
+        sydney_morning = datetime(2026, 2, 2, 7, 0, tzinfo=timezone(timedelta(hours=11)))
+
+        assert CRUDBase._time_bound(GrowthMeasurement.measurement_date, sydney_morning) == date(2026, 2, 2)
+
+    def test_date_until_includes_its_day_unless_midnight(self):
+        """Test a Date column's until day is included unless until is exactly midnight."""
+        from app.models import GrowthMeasurement
+
+        column = GrowthMeasurement.measurement_date
+        later_that_day = CRUDBase._until_clause(column, datetime(2026, 2, 8, 18, 30))
+        midnight = CRUDBase._until_clause(column, datetime(2026, 2, 8))
+
+        assert str(later_that_day) == "growth_measurements.measurement_date <= :measurement_date_1"
+        assert later_that_day.right.value == date(2026, 2, 8)
+        assert str(midnight) == "growth_measurements.measurement_date < :measurement_date_1"
+
+    def test_next_cursor_none_on_short_page(self, crud_service):
+        """Test next_cursor() returns None when fewer than limit rows came back."""
+        assert crud_service.next_cursor([MagicMock()], limit=2) is None
+
+    def test_next_cursor_encodes_last_row(self):
+        """Test next_cursor() encodes the last row's order value and id."""
+        from app.models import FeedingSession
+        from app.services.pagination import decode_cursor
+
+        service = CRUDBase(FeedingSession)
+        rows = [
+            FeedingSession(id=uuid4(), start_time=datetime(2026, 1, 2, 9, 0)),
+            FeedingSession(id=uuid4(), start_time=datetime(2026, 1, 1, 9, 0)),
+        ]
+
+        cursor = service.next_cursor(rows, limit=2, order_by_field="start_time")
+
+        assert decode_cursor(cursor, datetime) == (rows[-1].start_time, rows[-1].id)
+
     def test_create_adds_and_commits(self, crud_service, mock_db, mock_model):
         """Test create() adds record to session and commits."""
         create_data = SampleCreateSchema(name="test", value=42)
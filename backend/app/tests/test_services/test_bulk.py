@@ -0,0 +1,103 @@
+"""Tests for bulk creation with per-item results."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import diaper as diaper_api
+from app.core.database import get_db
+from app.main import app
+from app.schemas.diaper import DiaperEventCreate
+from app.services.bulk import bulk_create, bulk_status_code
+
+
+@pytest.fixture
+def baby_id():
+    """Create the id of the one baby that exists."""
+    return uuid4()
+
+
+@pytest.fixture
+def mock_db(baby_id):
+    """Create a mock session in which only `baby_id` exists."""
+    db = MagicMock()
+    db.scalars.return_value = [baby_id]
+    return db
+
+
+@pytest.fixture
+def service():
+    """Create a mock service whose create_multi returns one row per item."""
+    service = MagicMock()
+    service.create_multi.side_effect = lambda db, objs_in: [f"row-{i}" for i in range(len(objs_in))]
+    return service
+
+
+def diaper(baby_id, **fields):
+    """A raw diaper bulk item for `baby_id`."""
+    return {"baby_id": str(baby_id), "timestamp": "2026-02-01T10:00:00", "has_urine": True, **fields}
+
+
+class TestBulkCreate:
+    """Tests for bulk_create() and bulk_status_code()."""
+
+    def test_all_valid_items_inserted_in_one_call(self, mock_db, service, baby_id):
+        """Test valid items are inserted with one create_multi call and a 201."""
+        result = bulk_create(mock_db, service, DiaperEventCreate, [diaper(baby_id)] * 3)
+
+        service.create_multi.assert_called_once()
+        assert len(service.create_multi.call_args.kwargs["objs_in"]) == 3
+        assert result["created_count"] == 3
+        assert result["error_count"] == 0
+        assert [r["created"] for r in result["results"]] == ["row-0", "row-1", "row-2"]
+        assert bulk_status_code(result) == 201
+
+    def test_invalid_items_reported_at_their_index(self, mock_db, service, baby_id):
+        """Test invalid items get their errors at their index and the rest a 207."""
+        items = [diaper(baby_id), diaper(baby_id, urine_volume="flood"), diaper(baby_id)]
+
+        result = bulk_create(mock_db, service, DiaperEventCreate, items)
+
+        assert result["created_count"] == 2
+        assert result["results"][1]["errors"][0]["loc"] == ("urine_volume",)
+        assert result["results"][2]["created"] == "row-1"
+        assert bulk_status_code(result) == 207
+
+    def test_unknown_baby_is_an_item_error(self, mock_db, service, baby_id):
+        """Test an item for a missing baby is a not_found item error."""
+        result = bulk_create(mock_db, service, DiaperEventCreate, [diaper(uuid4()), diaper(baby_id)])
+
+        assert result["results"][0]["errors"][0]["type"] == "not_found"
+        assert result["results"][1]["created"] == "row-0"
+
+    def test_non_object_items_reported_at_their_index(self, mock_db, service, baby_id):
+        """Test items that are not objects are item errors, not a failed request."""
+        result = bulk_create(mock_db, service, DiaperEventCreate, ["nope", None, 3, diaper(baby_id)])
+
+        assert [r["errors"][0]["type"] for r in result["results"][:3]] == ["model_type"] * 3
+        assert result["results"][3]["created"] == "row-0"
+        assert bulk_status_code(result) == 207
+
+    def test_route_accepts_non_object_items(self, mock_db, service, monkeypatch):
+        """Test the bulk route passes non-object items through to per-item validation."""
+        monkeypatch.setattr(diaper_api, "diaper_service", service)
+        app.dependency_overrides[get_db] = lambda: mock_db
+        try:
+            response = TestClient(app).post("/api/v1/diaper/bulk", json=["nope", None])
+        finally:
+            app.dependency_overrides.pop(get_db)
+
+        assert response.status_code == 422
+        assert [r["index"] for r in response.json()["results"]] == [0, 1]
+
+    def test_atomic_inserts_nothing_when_any_item_fails(self, mock_db, service, baby_id):
+        """Test atomic mode inserts nothing and answers 422 if any item is invalid."""
+        result = bulk_create(
+            mock_db, service, DiaperEventCreate, [diaper(baby_id), {"baby_id": "nope"}], atomic=True
+        )
+
+        assert service.create_multi.call_args.kwargs["objs_in"] == []
+        assert result["created_count"] == 0
+        assert bulk_status_code(result) == 422
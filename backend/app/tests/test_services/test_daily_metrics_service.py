@@ -0,0 +1,97 @@
+"""Tests for the incrementally maintained daily metrics."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.models import DiaperEvent, GrowthMeasurement
+from app.models.feeding import FeedingType
+from app.models.sleep import SleepType
+from app.schemas.analytics import DailyMetricsRow
+from app.schemas.diaper import DiaperEventCreate
+from app.services.base import CRUDBase
+from app.services.daily_metrics_service import compute_day, mark_dirty
+
+DAY = date(2026, 2, 1)
+
+
+def at(hour, minute=0):
+    """A time on DAY."""
+    return datetime(2026, 2, 1, hour, minute)
+
+
+def sleep(start, end, sleep_type=SleepType.NAP):
+    """A SleepSession-like row."""
+    return SimpleNamespace(start_time=start, end_time=end, sleep_type=sleep_type)
+
+
+def feed(start, feeding_type=FeedingType.BOTTLE, volume=None):
+    """A FeedingSession-like row."""
+    return SimpleNamespace(start_time=start, feeding_type=feeding_type, volume_consumed_ml=volume)
+
+
+class TestComputeDay:
+    """Tests for compute_day()."""
+
+    baby = SimpleNamespace(id=uuid4(), name="A", date_of_birth=date(2026, 1, 1))
+
+    def test_sleep_metrics(self):
+        """Test night sleep, waking, nap and wake window metrics."""
+        sleeps = [
+            sleep(at(1), at(3), SleepType.NIGHTTIME),
+            sleep(at(3, 30), at(5), SleepType.NIGHTTIME),
+            sleep(at(10), at(11)),
+            sleep(at(20), None),  # ongoing: ignored until it ends
+        ]
+
+        row = compute_day(self.baby, DAY, [], sleeps, [])
+
+        assert row["night_sleep_minutes"] == 210
+        assert row["night_sleep_segments"] == 2
+        assert row["night_waking_count"] == 1
+        assert row["awake_at_night_minutes"] == 30
+        assert row["longest_night_stretch_minutes"] == 120
+        assert row["nap_count"] == 1
+        assert row["max_wake_window_minutes"] == 300
+
+    def test_feed_and_diaper_metrics(self):
+        """Test feed counts, volume and interval, diaper counts and age."""
+        feeds = [feed(at(9), volume=90), feed(at(6), FeedingType.BREAST), feed(at(12), volume=110)]
+        diapers = [SimpleNamespace(has_urine=True, has_stool=False), SimpleNamespace(has_urine=True, has_stool=True)]
+
+        row = compute_day(self.baby, DAY, feeds, [], diapers)
+
+        assert row["feed_count"] == 3
+        assert row["breast_feed_count"] == 1
+        assert row["total_volume_ml"] == 200
+        assert row["avg_feed_interval_minutes"] == 180
+        assert row["wet_diaper_count"] == 2 and row["dirty_diaper_count"] == 1
+        assert row["age_days"] == 31 and row["age_weeks"] == 4
+
+    def test_row_matches_response_schema(self):
+        """Test a computed row validates as DailyMetricsRow."""
+        row = compute_day(self.baby, DAY, [], [], [SimpleNamespace(has_urine=True, has_stool=False)])
+
+        assert DailyMetricsRow.model_validate(row).night_sleep_segments is None
+
+
+class TestMarkDirty:
+    """Tests for the mark_dirty change listener."""
+
+    def test_untracked_model_ignored(self):
+        """Test writes to models that don't feed daily_metrics queue nothing."""
+        assert mark_dirty(GrowthMeasurement, [(uuid4(), datetime(2026, 2, 1))]) is None
+
+    def test_crud_create_queues_change_in_same_transaction(self):
+        """Test a create queues its day before the commit."""
+        service = CRUDBase(DiaperEvent, change_listeners=[mark_dirty])
+        db = MagicMock()
+        baby_id = uuid4()
+
+        service.create(db, obj_in=DiaperEventCreate(baby_id=baby_id, timestamp=at(7), has_urine=True))
+
+        queued = db.execute.call_args.args[0]
+        assert queued.table.name == "daily_metrics_dirty"
+        names = [call[0] for call in db.method_calls]
+        assert names.index("execute") < names.index("commit")
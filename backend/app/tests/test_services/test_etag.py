@@ -0,0 +1,82 @@
+"""Tests for ETag generation and If-None-Match handling."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.models import DiaperEvent
+from app.services.base import CRUDBase
+from app.services.etag import check_etag, etag_matches, weak_etag
+
+
+def request_with(if_none_match=None):
+    """A mock request with the given If-None-Match header."""
+    request = MagicMock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+    return request
+
+
+class TestWeakEtag:
+    """Tests for weak_etag() and etag_matches()."""
+
+    def test_same_parts_same_etag(self):
+        """Test equal parts give equal weak ETags and different parts different ones."""
+        assert weak_etag(3, datetime(2026, 1, 1)) == weak_etag(3, datetime(2026, 1, 1))
+        assert weak_etag(3, datetime(2026, 1, 1)) != weak_etag(4, datetime(2026, 1, 1))
+        assert weak_etag(1).startswith('W/"')
+
+    @pytest.mark.parametrize("header", ['W/"abc"', '"abc"', '"x", W/"abc"', "*"])
+    def test_matches_weakly(self, header):
+        """Test weak and strong forms, lists and * all match."""
+        assert etag_matches(header, 'W/"abc"')
+
+    def test_no_match(self):
+        """Test a different ETag doesn't match."""
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+
+
+class TestCheckEtag:
+    """Tests for check_etag()."""
+
+    def test_match_raises_304_with_etag(self):
+        """Test a matching If-None-Match raises a 304 carrying the ETag."""
+        with pytest.raises(HTTPException) as exc_info:
+            check_etag(request_with('W/"abc"'), Response(), 'W/"abc"')
+
+        assert exc_info.value.status_code == 304
+        assert exc_info.value.headers["ETag"] == 'W/"abc"'
+
+    def test_miss_sets_headers(self):
+        """Test a miss sets ETag and Cache-Control on the response."""
+        response = Response()
+
+        check_etag(request_with('W/"old"'), response, 'W/"abc"')
+
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.headers["cache-control"] == "no-cache"
+
+
+class TestListEtag:
+    """Tests for CRUDBase.list_etag()."""
+
+    def test_stats_query_uses_list_filters(self):
+        """Test the count and max(updated_at) query applies the list's filters."""
+        service = CRUDBase(DiaperEvent)
+        stmt = service._list_stats_statement(baby_id="b", since=datetime(2026, 1, 1))
+
+        sql = str(stmt)
+        assert "count(*)" in sql and "max(diaper_events.updated_at)" in sql
+        assert "diaper_events.baby_id =" in sql and "diaper_events.timestamp >=" in sql
+
+    def test_etag_varies_with_stats_and_variant(self):
+        """Test the ETag changes with the variant, count or last update."""
+        service = CRUDBase(DiaperEvent)
+        db = MagicMock()
+        db.execute.return_value.one.return_value = (2, datetime(2026, 1, 1))
+
+        first = service.list_etag(db, baby_id="b", variant="limit=10")
+        assert service.list_etag(db, baby_id="b", variant="limit=20") != first
+        db.execute.return_value.one.return_value = (3, datetime(2026, 1, 1))
+        assert service.list_etag(db, baby_id="b", variant="limit=10") != first
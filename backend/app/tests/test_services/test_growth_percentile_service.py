@@ -0,0 +1,155 @@
+"""Tests for the growth percentile backfill."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models import BabyProfile, GrowthMeasurement
+from app.schemas.growth import GrowthMeasurementCreate, GrowthMeasurementUpdate
+from app.services import growth_service
+from app.services.growth_percentile_service import backfill_percentiles, count_pending, write_percentiles
+
+BORN = date(2026, 1, 1)
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory session with a girl's 11 weekly weights and one for a baby of other gender."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        girl = BabyProfile(name="A", date_of_birth=BORN, gender="female")
+        other = BabyProfile(name="B", date_of_birth=BORN, gender="other")
+        session.add_all([girl, other])
+        session.flush()
+        session.add_all(
+            GrowthMeasurement(baby_id=girl.id, measurement_date=BORN + timedelta(days=7 * i),
+                              weight_kg=3.2 + 0.2 * i, percentiles={"weight": 50})
+            for i in range(11)
+        )
+        session.add(GrowthMeasurement(baby_id=other.id, measurement_date=BORN, weight_kg=3.3))
+        session.commit()
+        yield session
+
+
+def percentiles_by_date(db, baby_name):
+    """The stored percentiles of a baby's measurements, oldest first."""
+    return [
+        m.percentiles for m in db.query(GrowthMeasurement).join(BabyProfile)
+        .filter(BabyProfile.name == baby_name).order_by(GrowthMeasurement.measurement_date)
+    ]
+
+
+class TestBackfill:
+    """Tests for backfill_percentiles() and count_pending()."""
+
+    def test_recomputes_every_measurement_in_chunks(self, db):
+        """Test every measurement is rescored, chunk_size rows at a time."""
+        chunks = list(backfill_percentiles(db, chunk_size=5))
+
+        assert [chunk["rows"] for chunk in chunks] == [5, 5, 2]
+        first = percentiles_by_date(db, "A")[0]
+        assert first["weight"] == pytest.approx(46.9, abs=0.5)
+        assert percentiles_by_date(db, "B") == [{}]
+
+    def test_resumes_after_last_id(self, db):
+        """Test a run started after a chunk's last id covers the rest."""
+        first = next(backfill_percentiles(db, chunk_size=5))
+
+        rest = list(backfill_percentiles(db, chunk_size=5, after=first["last_id"]))
+
+        assert sum(chunk["rows"] for chunk in rest) == 7
+        assert count_pending(db, after=first["last_id"]) == 7
+        assert all(p != {"weight": 50} for p in percentiles_by_date(db, "A"))
+
+    def test_missing_only(self, db):
+        """Test missing_only skips measurements that already have percentiles."""
+        assert count_pending(db, missing_only=True) == 1
+
+        chunks = list(backfill_percentiles(db, missing_only=True))
+
+        assert [chunk["rows"] for chunk in chunks] == [1]
+        assert percentiles_by_date(db, "A")[0] == {"weight": 50}
+        assert count_pending(db, missing_only=True) == 0
+
+    def test_nothing_left(self, db):
+        """Test a run with nothing to score yields no chunks."""
+        list(backfill_percentiles(db, missing_only=True))
+
+        assert list(backfill_percentiles(db, missing_only=True)) == []
+
+
+class TestWritePercentiles:
+    """Tests for write_percentiles()."""
+
+    def test_postgres_updates_from_values(self):
+        """Test Postgres gets one UPDATE ... FROM (VALUES ...) for the whole chunk."""
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        updates = [{"id": uuid4(), "percentiles": {"weight": 40.0}} for _ in range(3)]
+
+        write_percentiles(db, updates)
+
+        (stmt,), _ = db.execute.call_args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert db.execute.call_count == 1
+        assert "FROM (VALUES" in sql
+        assert sql.count("::UUID") == 3
+
+    def test_nothing_to_write(self):
+        """Test no statement is sent for an empty chunk."""
+        db = MagicMock()
+
+        write_percentiles(db, [])
+
+        db.execute.assert_not_called()
+
+
+class TestScoredOnWrite:
+    """Tests for growth_service scoring measurements as they're written."""
+
+    def baby_id(self, db, name):
+        """The id of the fixture baby called `name`."""
+        return db.query(BabyProfile.id).filter(BabyProfile.name == name).scalar()
+
+    def test_create_scores_the_measurement(self, db):
+        """Test create() stores the measurement's percentiles."""
+        created = growth_service.create(db, obj_in=GrowthMeasurementCreate(
+            baby_id=self.baby_id(db, "A"), measurement_date=BORN, weight_kg=3.2, length_cm=49.1,
+        ))
+
+        assert created.percentiles["weight"] == pytest.approx(46.9, abs=0.5)
+        assert set(created.percentiles) == {"weight", "length"}
+
+    def test_create_multi_scores_every_row(self, db):
+        """Test create_multi() scores every row, leaving unscorable ones empty."""
+        rows = growth_service.create_multi(db, objs_in=[
+            GrowthMeasurementCreate(baby_id=self.baby_id(db, "A"), measurement_date=BORN, weight_kg=3.2),
+            GrowthMeasurementCreate(baby_id=self.baby_id(db, "B"), measurement_date=BORN, weight_kg=3.2),
+            GrowthMeasurementCreate(baby_id=self.baby_id(db, "A"), measurement_date=BORN, notes="no measures"),
+        ])
+
+        assert [set(row.percentiles) for row in rows] == [{"weight"}, set(), set()]
+
+    def test_update_rescores_from_the_whole_row(self, db):
+        """Test update() rescores from the changed fields and the row's other values."""
+        measurement = db.query(GrowthMeasurement).join(BabyProfile).filter(
+            BabyProfile.name == "A", GrowthMeasurement.measurement_date == BORN
+        ).one()
+
+        growth_service.update(db, db_obj=measurement, obj_in=GrowthMeasurementUpdate(weight_kg=4.0))
+        heavier = measurement.percentiles["weight"]
+        growth_service.update(db, db_obj=measurement, obj_in=GrowthMeasurementUpdate(
+            measurement_date=BORN + timedelta(days=70)
+        ))
+
+        assert heavier > 90
+        assert measurement.percentiles["weight"] < 10
+
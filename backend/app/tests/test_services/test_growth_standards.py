@@ -0,0 +1,131 @@
+"""Tests for the WHO growth-standard percentiles."""
+
+import math
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.models.growth import GrowthMeasurement
+from app.services.growth_standards import (
+    DAYS_PER_MONTH,
+    lms,
+    lms_table,
+    percentile_records,
+    percentiles,
+    score_history,
+    z_scores,
+)
+
+
+class TestLmsTable:
+    """Tests for the LMS reference table and lms()."""
+
+    def test_loaded_once_and_read_only(self):
+        """Test the table is loaded once, complete and read-only."""
+        table = lms_table()
+
+        assert lms_table() is table
+        assert table.shape == (3, 2, 3, 25)
+        assert not np.isnan(table).any()
+        with pytest.raises(ValueError):
+            table[0, 0, 0, 0] = 1
+
+    def test_interpolates_between_months(self):
+        """Test ages between months get linearly interpolated parameters."""
+        l, m, s = lms("weight", [0, DAYS_PER_MONTH / 2, DAYS_PER_MONTH], ["male"] * 3)
+
+        assert m[0] == pytest.approx(3.3464)
+        assert m[1] == pytest.approx((3.3464 + 4.4709) / 2)
+        assert m[2] == pytest.approx(4.4709)
+
+    def test_uncovered_rows_are_nan(self):
+        """Test out-of-range ages and unknown sexes get NaN parameters."""
+        params = lms("length", [-1, 30, 800, 30], ["male", "other", "female", None])
+
+        assert np.isnan(params).all()
+
+
+class TestZScores:
+    """Tests for z_scores()."""
+
+    def test_median_is_zero(self):
+        """Test the reference median scores zero."""
+        z = z_scores("weight", [0, 0, 12 * DAYS_PER_MONTH], ["male", "female", "male"], [3.3464, 3.2322, 9.6479])
+
+        assert z == pytest.approx([0, 0, 0], abs=1e-4)
+
+    def test_length_is_normal(self):
+        """Test length z-scores follow the normal distribution (L = 1)."""
+        # L is 1 for length, so z is (y - M) / (M * S)
+        z = z_scores("length", [0], ["female"], [49.1477 * (1 + 2 * 0.03790)])
+
+        assert z[0] == pytest.approx(2)
+
+    def test_restricted_beyond_three_sd(self):
+        """Test weight z-scores beyond 3 SD use the WHO restricted application."""
+        l, m, s = 0.3487, 3.3464, 0.14602
+        sd = lambda k: m * (1 + l * s * k) ** (1 / l)
+
+        z = z_scores("weight", [0, 0], ["male", "male"], [sd(3) + (sd(3) - sd(2)), sd(-3) - (sd(-2) - sd(-3))])
+
+        assert z == pytest.approx([4, -4])
+
+    def test_missing_values_are_nan(self):
+        """Test missing measurements score NaN."""
+        z = z_scores("head_circumference", [0, 0], ["male", "male"], [None, 34.4618])
+
+        assert math.isnan(z[0])
+        assert z[1] == pytest.approx(0, abs=1e-4)
+
+
+class TestPercentiles:
+    """Tests for percentiles() and percentile_records()."""
+
+    def test_matches_normal_cdf(self):
+        """Test percentiles follow the standard normal CDF."""
+        z = np.linspace(-4, 4, 81)
+        expected = [50 * (1 + math.erf(v / math.sqrt(2))) for v in z]
+
+        assert percentiles(z) == pytest.approx(expected, abs=1e-4)
+
+    def test_records_skip_unscored_indicators(self):
+        """Test records leave out indicators that couldn't be scored."""
+        records = percentile_records(
+            [0, 30, 1000],
+            ["male", "female", "male"],
+            {"weight_kg": [3.3464, None, 14.0], "length_cm": [49.8842, 54.0, None]},
+        )
+
+        assert records[0] == {"weight": 50.0, "length": 50.0}
+        assert set(records[1]) == {"length"}
+        assert records[2] == {}
+
+
+class TestScoreHistory:
+    """Tests for score_history() and GrowthMeasurement.calculate_percentiles()."""
+
+    def test_scores_every_measurement(self):
+        """Test every measurement in a history is scored for its age."""
+        born = date(2026, 1, 1)
+        history = [
+            SimpleNamespace(measurement_date=date(2026, 1, 1), weight_kg=3.2322,
+                            length_cm=None, head_circumference_cm=33.8787),
+            SimpleNamespace(measurement_date=date(2027, 1, 1), weight_kg=8.9481,
+                            length_cm=74.0150, head_circumference_cm=None),
+        ]
+
+        records = score_history(history, born, "female")
+
+        assert records[0] == {"weight": 50.0, "head_circumference": 50.0}
+        # A year less a quarter day, so just short of the 12-month medians
+        assert records[1] == {"weight": pytest.approx(50, abs=0.5), "length": pytest.approx(50, abs=0.5)}
+
+    def test_model_calculate_percentiles(self):
+        """Test calculate_percentiles() stores the scored indicators."""
+        measurement = GrowthMeasurement(weight_kg=3.3464, length_cm=None, head_circumference_cm=None)
+
+        measurement.calculate_percentiles(0, "male")
+
+        assert measurement.percentiles == {"weight": 50.0}
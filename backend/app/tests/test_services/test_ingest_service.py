@@ -0,0 +1,108 @@
+"""Tests for the diff-based export ingest."""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models import BabyProfile, DiaperEvent, FeedingSession
+from app.services.ingest_service import IngestError, _apply_diff, _delete_missing, _read_header, natural_key
+
+
+def executed_sql(db):
+    """The SQL of every statement executed on a mock session, in order."""
+    return [str(call.args[0]) for call in db.execute.call_args_list]
+
+
+class TestReadHeader:
+    """Tests for reading and validating the export's CSV header."""
+
+    def test_event_header_needs_baby_reference(self):
+        """Test an event file without a baby reference column is rejected."""
+        file = io.StringIO("start_time,feeding_type\n2026-01-01T10:00:00,breast\n")
+
+        with pytest.raises(IngestError, match="baby_date_of_birth"):
+            _read_header(file, FeedingSession)
+
+    def test_managed_columns_rejected(self):
+        """Test columns the database manages can't be imported."""
+        file = io.StringIO("id,name,date_of_birth\n")
+
+        with pytest.raises(IngestError, match="unknown columns \\['id'\\]"):
+            _read_header(file, BabyProfile)
+
+    def test_valid_header_rewinds_file(self):
+        """Test a valid header leaves the file at its start for COPY."""
+        file = io.StringIO("baby_name,baby_date_of_birth,start_time,feeding_type\n")
+
+        assert _read_header(file, FeedingSession)[2] == "start_time"
+        assert file.tell() == 0
+
+
+class TestApplyDiff:
+    """Tests for applying a staged export as a diff."""
+
+    def test_event_key_is_baby_and_event_time(self):
+        """Test events are matched on baby and event time."""
+        assert natural_key(FeedingSession) == ("baby_id", "start_time")
+
+    def test_only_changed_rows_are_updated(self):
+        """Test the UPDATE only touches rows whose values differ."""
+        db = MagicMock()
+        header = ["baby_name", "baby_date_of_birth", "start_time", "feeding_type", "food_items"]
+
+        counts = _apply_diff(db, FeedingSession, "ingest_feeding_sessions", header)
+
+        dedupe, delete, update, insert = executed_sql(db)
+        assert "a.ctid > b.ctid" in dedupe
+        assert "NOT EXISTS" in delete and "t.source = :source" in delete
+        assert 't."feeding_type" IS DISTINCT FROM s."feeding_type"' in update
+        assert 't."food_items"::jsonb IS DISTINCT FROM s."food_items"::jsonb' in update
+        assert "baby_name" not in insert
+        assert set(counts) == {"duplicates", "deleted", "updated", "inserted"}
+
+    def test_deferred_delete(self):
+        """Test delete_missing=False leaves deleting missing rows for later."""
+        db = MagicMock()
+
+        counts = _apply_diff(db, BabyProfile, "ingest_baby_profiles", ["name", "date_of_birth"], delete_missing=False)
+
+        assert counts["deleted"] == 0
+        assert not any(sql.startswith("DELETE FROM baby_profiles") for sql in executed_sql(db))
+
+    def test_keyword_columns_are_quoted(self):
+        """Test column names, including keywords like timestamp, are quoted."""
+        db = MagicMock()
+        header = ["baby_name", "baby_date_of_birth", "timestamp", "has_urine"]
+
+        _apply_diff(db, DiaperEvent, "ingest_diaper_events", header)
+
+        dedupe, delete, update, insert = executed_sql(db)
+        assert 'a."timestamp" = b."timestamp"' in dedupe
+        assert 'RETURNING t.baby_id, t."timestamp"' in delete
+        assert 'INSERT INTO diaper_events (id, created_at, updated_at, source, "baby_id", "timestamp", "has_urine")' in insert
+
+
+class TestDeleteMissingBabies:
+    """Tests for deleting babies missing from the export."""
+
+    def test_referenced_babies_are_not_deleted(self):
+        """Test a missing baby is only deleted when no event table references it."""
+        db = MagicMock()
+
+        _delete_missing(db, BabyProfile, "ingest_baby_profiles")
+
+        [delete] = executed_sql(db)
+        for table in ["feeding_sessions", "sleep_sessions", "diaper_events", "growth_measurements", "health_events"]:
+            assert f'NOT EXISTS (SELECT 1 FROM {table} r WHERE r."baby_id" = t."id")' in delete
+        # daily_metrics rows cascade
+        assert "FROM daily_metrics r" not in delete
+
+    def test_event_deletes_are_not_restricted(self):
+        """Test event rows are deleted without a referencing-rows check."""
+        db = MagicMock()
+
+        _delete_missing(db, FeedingSession, "ingest_feeding_sessions")
+
+        [delete] = executed_sql(db)
+        assert " r " not in delete
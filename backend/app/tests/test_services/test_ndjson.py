@@ -0,0 +1,100 @@
+"""Tests for streaming NDJSON responses."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.services import ndjson
+from app.services.etag import list_variant
+from app.services.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
+
+
+class Row(BaseModel):
+    """Sample response model for streamed rows."""
+    n: int
+    label: str
+
+
+def request_with(accept=None, query=""):
+    """A mock request with the given Accept header and query string."""
+    request = MagicMock()
+    request.headers = {"accept": accept} if accept else {}
+    request.url.query = query
+    return request
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory session with a 1203-row table."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    with Session(engine) as session:
+        session.execute(text("create table t (n integer, label text)"))
+        session.execute(text("insert into t values (:n, :label)"), [
+            {"n": n, "label": f"row {n}"} for n in range(1203)
+        ])
+        session.commit()
+        yield session
+
+
+def chunks(response):
+    """The chunks a streaming response sends."""
+    async def collect():
+        return [chunk async for chunk in response.body_iterator]
+    return asyncio.run(collect())
+
+
+def body(response):
+    """A streaming response's whole body."""
+    return b"".join(chunks(response))
+
+
+class TestWantsNdjson:
+    """Tests for NDJSON content negotiation."""
+
+    def test_wants_ndjson(self):
+        """Test NDJSON is chosen only when the Accept header asks for it."""
+        assert wants_ndjson(request_with(f"{NDJSON_MEDIA_TYPE}; charset=utf-8"))
+        assert not wants_ndjson(request_with("application/json"))
+        assert not wants_ndjson(request_with())
+
+    def test_list_variant_separates_formats(self):
+        """Test NDJSON and JSON lists get different ETag variants."""
+        assert list_variant(request_with(query="limit=5")) == "limit=5"
+        assert list_variant(request_with(NDJSON_MEDIA_TYPE, "limit=5")) != "limit=5"
+
+
+class TestNdjsonResponse:
+    """Tests for ndjson_response()."""
+
+    def test_streams_every_row_in_batches(self, db, monkeypatch):
+        """Test every row is streamed, one chunk per batch, with only model fields."""
+        monkeypatch.setattr(ndjson, "STREAM_BATCH_SIZE", 500)
+        response = ndjson_response(db, text("select n, label, 'x' as extra from t order by n"), Row,
+                                   headers={"ETag": 'W/"x"'})
+
+        sent = chunks(response)
+
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        assert response.headers["etag"] == 'W/"x"'
+        assert len(sent) == 3
+        lines = b"".join(sent).splitlines()
+        assert len(lines) == 1203
+        assert json.loads(lines[-1]) == {"n": 1202, "label": "row 1202"}
+
+    def test_header_line_comes_first(self, db):
+        """Test the header object is sent as the first line, before the rows."""
+        response = ndjson_response(db, text("select n, label from t where n < 2"), Row,
+                                   header={"align": "age_days"})
+
+        lines = body(response).splitlines()
+
+        assert json.loads(lines[0]) == {"align": "age_days"}
+        assert len(lines) == 3
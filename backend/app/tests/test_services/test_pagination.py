@@ -0,0 +1,55 @@
+"""Tests for keyset cursor encoding."""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    next_cursor_headers,
+)
+
+
+class TestCursorRoundTrip:
+    """Tests for encode_cursor() and decode_cursor()."""
+
+    @pytest.mark.parametrize("value,python_type", [
+        (datetime(2026, 3, 13, 4, 25, 9, 123456), datetime),
+        (date(2026, 3, 13), date),
+        ("Imogen", str),
+    ])
+    def test_round_trip(self, value, python_type):
+        """Test a cursor decodes back to its sort value and id."""
+        record_id = uuid4()
+
+        cursor = encode_cursor(value, record_id)
+
+        assert decode_cursor(cursor, python_type) == (value, record_id)
+
+    def test_cursor_is_url_safe(self):
+        """Test cursors only use URL-safe characters."""
+        cursor = encode_cursor("a/b+c?d=e", uuid4())
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4Il0"])
+    def test_malformed_cursor_raises_400(self, cursor):
+        """Test malformed cursors are rejected with a 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, datetime)
+        assert exc_info.value.status_code == 400
+
+
+class TestNextCursorHeaders:
+    """Tests for next_cursor_headers()."""
+
+    def test_header_set_when_cursor_present(self):
+        """Test the next cursor is sent in its header."""
+        assert next_cursor_headers("abc") == {NEXT_CURSOR_HEADER: "abc"}
+
+    def test_no_header_on_last_page(self):
+        """Test no header is sent after the last page."""
+        assert next_cursor_headers(None) == {}
@@ -0,0 +1,143 @@
+"""Tests for the Core-row list read path."""
+
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models import BabyProfile, FeedingSession, GrowthMeasurement
+from app.models.feeding import FeedingType
+from app.schemas.feeding import FeedingSessionResponse
+from app.schemas.growth import GrowthMeasurementResponse
+from app.services import feeding_service, growth_service
+from app.services.serialization import (
+    dump_json_list,
+    parse_fields,
+    response_columns,
+    source_fields,
+    sparse_model,
+)
+
+
+def fastapi_json(items, response_model) -> bytes:
+    """What FastAPI renders for a response_model=List[response_model] route."""
+    content = [response_model.model_validate(item).model_dump(mode="json", by_alias=True) for item in items]
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory session with a baby, five feedings and five measurements."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        baby = BabyProfile(name="Zoë", date_of_birth=date(2026, 1, 1))
+        session.add(baby)
+        session.flush()
+        start = datetime(2026, 2, 1, 6)
+        for i in range(5):
+            session.add(FeedingSession(
+                baby_id=baby.id,
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=20) if i % 2 else None,
+                feeding_type=FeedingType.SOLID,
+                food_items=["pêche", "rice"],
+                notes='said "more"\n',
+            ))
+            session.add(GrowthMeasurement(
+                baby_id=baby.id, measurement_date=date(2026, 2, 1 + i), weight_kg=4.1 + i * 0.1
+            ))
+        session.commit()
+        session.baby_id = baby.id
+        yield session
+
+
+class TestRowsReadPath:
+    """Tests for the Core-row list read path."""
+
+    def test_response_columns_only_cover_response_fields(self):
+        """Test only columns the response model renders are selected."""
+        keys = [column.key for column in response_columns(FeedingSession, FeedingSessionResponse)]
+
+        assert "source" not in keys
+        assert {"id", "baby_id", "start_time", "end_time", "food_items"} <= set(keys)
+
+    @pytest.mark.parametrize(
+        "service, response_model, order_by_field",
+        [
+            (feeding_service, FeedingSessionResponse, "start_time"),
+            (growth_service, GrowthMeasurementResponse, "measurement_date"),
+        ],
+    )
+    def test_rows_serialise_to_the_same_bytes_as_orm_path(self, db, service, response_model, order_by_field):
+        """Test rows render to exactly the JSON FastAPI renders for ORM objects."""
+        params = dict(baby_id=db.baby_id, order_by_field=order_by_field)
+
+        rows = service.get_multi_rows(db, response_model=response_model, **params)
+        orm = service.get_multi(db, **params)
+
+        assert len(rows) == 5
+        assert dump_json_list(rows, response_model) == fastapi_json(orm, response_model)
+
+    def test_rows_support_next_cursor(self, db):
+        """Test next_cursor() works on rows as it does on ORM objects."""
+        params = dict(baby_id=db.baby_id, order_by_field="start_time")
+        rows = feeding_service.get_multi_rows(db, response_model=FeedingSessionResponse, limit=2, **params)
+
+        cursor = feeding_service.next_cursor(rows, limit=2, order_by_field="start_time")
+        following = feeding_service.get_multi(db, limit=2, cursor=cursor, **params)
+
+        assert following[0].start_time < rows[-1].start_time
+
+
+class TestSparseFieldsets:
+    """Tests for ?fields= sparse fieldsets."""
+
+    def test_parse_fields(self):
+        """Test fields are parsed into a set, and no parameter means every field."""
+        assert parse_fields(FeedingSessionResponse, None) is None
+        assert parse_fields(FeedingSessionResponse, "start_time, duration_minutes") == {
+            "start_time", "duration_minutes"
+        }
+
+    @pytest.mark.parametrize("fields", ["", "start_time,nope"])
+    def test_unknown_or_empty_fields_rejected(self, fields):
+        """Test unknown or empty field lists are rejected with a 422."""
+        with pytest.raises(HTTPException) as exc_info:
+            parse_fields(FeedingSessionResponse, fields)
+        assert exc_info.value.status_code == 422
+
+    def test_computed_field_pulls_in_its_sources(self):
+        """Test a computed field selects the columns it is computed from."""
+        needed = source_fields(FeedingSessionResponse, frozenset({"duration_minutes"}))
+
+        assert {"start_time", "end_time", "left_breast_duration"} <= needed
+        assert "notes" not in needed
+
+    def test_sparse_model_is_cached_per_field_set(self):
+        """Test the same field set reuses the same sparse model."""
+        fields = frozenset({"notes"})
+
+        assert sparse_model(FeedingSessionResponse, fields) is sparse_model(FeedingSessionResponse, fields)
+
+    def test_select_and_output_narrowed(self, db):
+        """Test both the SELECT and the JSON output are narrowed to the fields."""
+        fields = frozenset({"feeding_type", "duration_minutes"})
+        statement = feeding_service.rows_statement(
+            response_model=FeedingSessionResponse, fields=fields,
+            baby_id=db.baby_id, order_by_field="start_time",
+        )
+        selected = {column.key for column in statement.selected_columns}
+
+        rows = db.execute(statement).all()
+        items = json.loads(dump_json_list(rows, FeedingSessionResponse, fields))
+
+        assert "notes" not in selected and "food_items" not in selected
+        assert {"id", "start_time"} <= selected  # for next_cursor
+        assert items[0] == {"feeding_type": "solid", "duration_minutes": None}
+        assert items[1]["duration_minutes"] == 20
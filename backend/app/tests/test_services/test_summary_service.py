@@ -0,0 +1,61 @@
+"""Tests for the per-baby daily summary."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+from app.schemas.summary import DailySummaryResponse
+from app.services.summary_service import baby_zone, get_daily_summary, local_day_bounds
+
+
+def summary_row(**overrides):
+    """A summary query result row, with `overrides` applied."""
+    row = {
+        "feed_count": 3, "breast_feed_count": 2, "bottle_feed_count": 1, "solid_feed_count": 0,
+        "total_volume_ml": None, "sleep_count": 0, "ongoing_sleep_count": 0,
+        "total_sleep_minutes": 0, "longest_sleep_minutes": None, "diaper_count": 4,
+        "wet_diaper_count": 4, "dirty_diaper_count": 1, "health_event_count": 0,
+        "latest_weight_kg": 4.2, "latest_weight_date": date(2026, 1, 20),
+    }
+    return {**row, **overrides}
+
+
+class TestLocalDayBounds:
+    """Tests for local_day_bounds() and baby_zone()."""
+
+    def test_day_in_utc(self):
+        """Test a local day's bounds are returned as naive UTC."""
+        start, end = local_day_bounds(date(2026, 2, 1), ZoneInfo("Australia/Sydney"))
+
+        assert start == datetime(2026, 1, 31, 13)
+        assert end == datetime(2026, 2, 1, 13)
+
+    def test_dst_end_day_is_25_hours(self):
+        """Test the day daylight saving ends is 25 hours long."""
+        start, end = local_day_bounds(date(2026, 4, 5), ZoneInfo("Australia/Sydney"))
+
+        assert (end - start).total_seconds() == 25 * 3600
+
+    def test_unknown_timezone_falls_back_to_settings(self):
+        """Test an unknown baby timezone falls back to the default one."""
+        baby = MagicMock(timezone="Mars/Olympus_Mons")
+
+        assert baby_zone(baby).key == "Australia/Sydney"
+
+
+class TestGetDailySummary:
+    """Tests for get_daily_summary()."""
+
+    def test_one_query_and_valid_response(self):
+        """Test the summary takes one query and validates as the response schema."""
+        db = MagicMock()
+        db.execute.return_value.mappings.return_value.one.return_value = summary_row()
+        baby = MagicMock(id=uuid4(), timezone="UTC")
+
+        summary = get_daily_summary(db, baby, date(2026, 2, 1))
+
+        db.execute.assert_called_once()
+        assert summary["day_start"] == datetime(2026, 2, 1)
+        assert summary["total_volume_ml"] == 0
+        assert DailySummaryResponse.model_validate(summary).feed_count == 3
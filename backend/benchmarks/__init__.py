@@ -0,0 +1 @@
+# Benchmarks and performance regression checks (run manually against a scratch database)
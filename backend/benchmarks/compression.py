@@ -0,0 +1,124 @@
+"""Response bytes and latency per endpoint, uncompressed vs gzip vs br.
+
+Runs the app in-process (TestClient, with get_db on --database-url) and,
+for each endpoint and encoding, prints the bytes on the wire, the median
+server latency including compression, and an estimated total time for a
+phone on a --mobile-mbps link (latency + bytes / bandwidth). br needs the
+`compression` extra.
+
+Endpoints are the 2000-row feeding, sleep and diaper lists of one baby
+and /analytics/compare (skipped if the dbt marts aren't built). Seeds
+rows like benchmarks.query_plans (tagged source='benchmark', deleted
+afterwards unless --keep):
+
+    python -m benchmarks.compression --rows-per-table 100000 --mobile-mbps 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import List, Tuple
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.compression import ENCODINGS
+from app.core.config import settings
+from app.core.database import get_db
+from app.main import app
+from benchmarks.query_plans import BENCHMARK_SOURCE, cleanup, seed
+
+API = settings.API_V1_STR
+
+
+def endpoints(baby_id: UUID) -> List[Tuple[str, str]]:
+    """(label, path) of each endpoint to measure."""
+    return [
+        ("feeding list x2000", f"{API}/feeding/?baby_id={baby_id}&limit=2000"),
+        ("sleep list x2000", f"{API}/sleep/?baby_id={baby_id}&limit=2000"),
+        ("diaper list x2000", f"{API}/diaper/?baby_id={baby_id}&limit=2000"),
+        ("analytics compare", f"{API}/analytics/compare"),
+    ]
+
+
+def _fetch(client: TestClient, path: str, encoding: str) -> Tuple[int, int, float]:
+    """(status, bytes on the wire, seconds) for one request."""
+    started = time.perf_counter()
+    with client.stream("GET", path, headers={"accept-encoding": encoding}) as response:
+        size = sum(len(chunk) for chunk in response.iter_raw())
+    return response.status_code, size, time.perf_counter() - started
+
+
+def run(engine: Engine, repeat: int, mobile_mbps: float) -> None:
+    with engine.connect() as conn:
+        # The baby with the most feeds, so the lists are full
+        baby_id = UUID(str(conn.execute(
+            text("""
+                select baby_id from feeding_sessions where source = :source
+                group by baby_id order by count(*) desc limit 1
+            """),
+            {"source": BENCHMARK_SOURCE},
+        ).scalar_one()))
+
+    session_factory = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    encodings = ["identity", *reversed(ENCODINGS)]
+    bytes_per_second = mobile_mbps * 1_000_000 / 8
+    print(f"{'endpoint':<20} {'encoding':<9} {'bytes':>11} {'ratio':>6} {'p50 ms':>8} "
+          f"{f'@{mobile_mbps:g}Mbps ms':>12}")
+    # Not entered as a context manager, so the lifespan (daily_metrics
+    # worker) doesn't start; errors (e.g. no marts) come back as 500s
+    client = TestClient(app, raise_server_exceptions=False)
+    try:
+        for label, path in endpoints(baby_id):
+            identity_size = None
+            for encoding in encodings:
+                status, size, _ = _fetch(client, path, encoding)  # warm up
+                if status != 200:
+                    print(f"{label:<20} skipped (HTTP {status})")
+                    break
+                identity_size = identity_size or size
+                latency = statistics.median(_fetch(client, path, encoding)[2] for _ in range(repeat))
+                total = latency + size / bytes_per_second
+                print(f"{label:<20} {encoding:<9} {size:>11,} {identity_size / size:>5.1f}x "
+                      f"{latency * 1000:>8.1f} {total * 1000:>12.0f}")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=str(settings.DATABASE_URL))
+    parser.add_argument("--babies", type=int, default=5)
+    parser.add_argument("--rows-per-table", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--mobile-mbps", type=float, default=10.0, help="Link speed for the total time estimate")
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse rows from a --keep run")
+    parser.add_argument("--keep", action="store_true", help="Leave the seeded rows in place")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if not args.skip_seed:
+        seed(engine, args.babies, args.rows_per_table)
+    try:
+        run(engine, args.repeat, args.mobile_mbps)
+    finally:
+        if not args.keep:
+            cleanup(engine)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
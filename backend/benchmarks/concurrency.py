@@ -0,0 +1,130 @@
+"""Sync vs async route throughput at increasing client concurrency.
+
+Starts the API twice under uvicorn (one worker each), once with the sync
+psycopg2 routers and once with DATABASE_ASYNC=true, and drives each with
+N concurrent keep-alive clients hammering a list endpoint for a fixed
+time. Prints requests/s, error count and p50/p95/p99 latency side by side.
+
+Needs a database with at least one baby (run benchmarks.query_plans
+--keep first for a realistic table size) and the `async` extra installed:
+
+    python -m benchmarks.concurrency --clients 50 200 1000 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.core.config import settings
+
+LIST_PATH = f"{settings.API_V1_STR}/feeding/"
+
+
+async def _wait_until_up(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def _drive(base_url: str, clients: int, duration: float, params: dict) -> Dict[str, float]:
+    """Run `clients` request loops for `duration` seconds and summarise them."""
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        deadline = time.monotonic() + duration
+
+        async def loop() -> None:
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(LIST_PATH, params=params)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(loop() for _ in range(clients)))
+
+    if not latencies:
+        return {"rps": 0.0, "errors": errors, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / duration,
+        "errors": errors,
+        "p50": cuts[49] * 1000,
+        "p95": cuts[94] * 1000,
+        "p99": cuts[98] * 1000,
+    }
+
+
+def _first_baby_id(base_url: str) -> str:
+    babies = httpx.get(f"{base_url}{settings.API_V1_STR}/babies/", params={"limit": 1}).json()
+    if not babies:
+        raise SystemExit("No babies in the database; seed some data first.")
+    return babies[0]["id"]
+
+
+def run_mode(mode: str, port: int, clients: List[int], duration: float, limit: int) -> Dict[int, dict]:
+    env = {**os.environ, "DATABASE_ASYNC": "true" if mode == "async" else "false"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(_wait_until_up(base_url))
+        params = {"baby_id": _first_baby_id(base_url), "limit": limit}
+        results = {}
+        for n in clients:
+            results[n] = asyncio.run(_drive(base_url, n, duration, params))
+            print(f"{mode:<5} clients={n:<5} {results[n]['rps']:8.1f} req/s")
+        return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per run")
+    parser.add_argument("--limit", type=int, default=50, help="Page size requested")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    sync = run_mode("sync", args.port, args.clients, args.duration, args.limit)
+    async_ = run_mode("async", args.port, args.clients, args.duration, args.limit)
+
+    print(f"\n{'clients':>7} | {'mode':<5} | {'req/s':>8} | {'errors':>6} | "
+          f"{'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8}")
+    for n in args.clients:
+        for mode, results in (("sync", sync), ("async", async_)):
+            r = results[n]
+            print(f"{n:>7} | {mode:<5} | {r['rps']:8.1f} | {r['errors']:>6} | "
+                  f"{r['p50']:8.1f} | {r['p95']:8.1f} | {r['p99']:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Deterministic synthetic history for N babies, loaded with COPY.
+
+Unlike benchmarks.query_plans' seed (evenly spaced identical rows), this
+writes day-by-day histories that look like the real thing, so that load
+tests and plans see realistic row counts, value spreads and per-baby skew:
+
+- feeds every 2-4 hours, breast/bottle early on and solids from ~6 months
+- a night sleep broken into fewer segments as the baby grows, plus naps
+  (4 a day for newborns down to 1)
+- 5-10 diapers a day, stools less often with age
+- growth measurements weekly, then monthly, along a per-baby WHO centile
+- vaccinations on the usual schedule, occasional illnesses and milestones
+
+Every row is generated from --seed, so two runs with the same arguments
+write the same ids and values. Rows are tagged source='benchmark' and
+streamed into each table with COPY in --batch-rows chunks, in one
+transaction:
+
+    python -m benchmarks.datagen --babies 50 --years 2
+    python -m benchmarks.datagen --cleanup      # delete them again
+"""
+
+import argparse
+import csv
+import io
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.services.growth_standards import lms
+from benchmarks.query_plans import BENCHMARK_SOURCE, cleanup
+
+Row = Sequence[Any]
+
+# Columns written per table, after the common id/baby_id/created_at/updated_at/source
+TABLE_COLUMNS = {
+    "feeding_sessions": (
+        "start_time", "end_time", "feeding_type", "breast_started", "left_breast_duration",
+        "right_breast_duration", "volume_offered_ml", "volume_consumed_ml", "appetite",
+    ),
+    "sleep_sessions": ("start_time", "end_time", "sleep_type", "location", "sleep_quality", "wake_reason"),
+    "diaper_events": (
+        "timestamp", "has_urine", "urine_volume", "has_stool", "stool_consistency", "stool_color", "diaper_type",
+    ),
+    "growth_measurements": (
+        "measurement_date", "weight_kg", "length_cm", "head_circumference_cm", "measurement_context",
+    ),
+    "health_events": ("event_date", "event_type", "title", "temperature_celsius", "follow_up_required"),
+}
+BABY_COLUMNS = (
+    "id", "name", "date_of_birth", "birth_weight", "birth_length", "birth_head_circumference",
+    "gender", "timezone", "is_active", "created_at", "updated_at", "source",
+)
+
+# Days of age for the usual vaccination visits
+VACCINATION_DAYS = (0, 42, 120, 180, 365, 540)
+MILESTONES = ((45, "First smile"), (120, "Rolled over"), (200, "Sat unassisted"),
+              (280, "Crawled"), (330, "First word"), (380, "First steps"))
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _at(day: date, hours: float) -> datetime:
+    return datetime.combine(day, datetime.min.time()) + timedelta(hours=hours)
+
+
+class Baby:
+    """One baby's profile and the random state its history is drawn from."""
+
+    def __init__(self, index: int, seed: int, today: date, years: float):
+        self.rng = random.Random(seed * 1_000_003 + index)
+        self.id = _uuid(self.rng)
+        self.name = f"Benchmark baby {index + 1}"
+        self.gender = self.rng.choice(["male", "female"])
+        self.date_of_birth = today - timedelta(days=int(years * 365.25) - self.rng.randint(0, 60))
+        self.centile_z = self.rng.gauss(0, 0.8)  # where on the WHO charts this baby tracks
+        self.breastfed = self.rng.random() < 0.7
+        self.milestones = {age + self.rng.randint(-20, 20): title for age, title in MILESTONES}
+
+    def profile(self) -> Row:
+        weight, length, head = (self.standard(i, 0) for i in ("weight", "length", "head_circumference"))
+        created = _at(self.date_of_birth, 0)
+        return (self.id, self.name, self.date_of_birth, weight, length, head, self.gender,
+                "Australia/Sydney", True, created, created, BENCHMARK_SOURCE)
+
+    def standard(self, indicator: str, age_days: int) -> float:
+        """The baby's own centile of the WHO standard at this age."""
+        l, m, s = lms(indicator, [min(age_days, 730)], [self.gender])[:, 0]
+        z = self.centile_z + self.rng.gauss(0, 0.15)
+        return round(float(m * (1 + l * s * z) ** (1 / l)), 2)
+
+
+def _feeds(baby: Baby, day: date, age: int) -> Iterator[Row]:
+    rng = baby.rng
+    interval = min(2.5 + age / 180, 4.0)
+    hour = rng.uniform(0, interval)
+    while hour < 24:
+        start = _at(day, hour)
+        solids = age >= 180 and 7 <= hour <= 19 and rng.random() < min(age / 720, 0.5)
+        if solids:
+            yield (start, start + timedelta(minutes=rng.randint(10, 25)), "SOLID", None, None, None,
+                   None, None, rng.choice(["POOR", "FAIR", "GOOD", "EXCELLENT"]))
+        elif baby.breastfed and rng.random() < max(0.9 - age / 500, 0.2):
+            left, right = rng.randint(5, 20), rng.randint(0, 15)
+            yield (start, start + timedelta(minutes=left + right), "BREAST", rng.choice(["LEFT", "RIGHT"]),
+                   left, right or None, None, None, None)
+        else:
+            offered = int(min(60 + age * 0.8, 240) // 10 * 10)
+            yield (start, start + timedelta(minutes=rng.randint(10, 30)), "BOTTLE", None, None, None,
+                   offered, max(offered - rng.randint(0, 40), 10), None)
+        hour += rng.gauss(interval, 0.4)
+
+
+def _sleeps(baby: Baby, day: date, age: int) -> Iterator[Row]:
+    rng = baby.rng
+    naps = max(4 - age // 120, 1)
+    for n in range(naps):
+        start = _at(day, 8 + n * (10 / naps) + rng.uniform(0, 1))
+        minutes = rng.randint(30, 120)
+        yield (start, start + timedelta(minutes=minutes), "NAP", rng.choice(["CRIB", "STROLLER", "CAR_SEAT"]),
+               rng.choice(["FAIR", "GOOD", "DEEP"]), "NATURAL")
+    segments = max(5 - age // 90, 1)
+    hour, end_hour = 19 + rng.uniform(0, 1.5), 30 + rng.uniform(0, 1.5)
+    for n in range(segments):
+        length = (end_hour - hour) / (segments - n)
+        start, end = _at(day, hour), _at(day, hour + length * rng.uniform(0.85, 1.0))
+        last = n == segments - 1
+        yield (start, end, "NIGHTTIME", "CRIB", rng.choice(["RESTLESS", "FAIR", "GOOD", "DEEP"]),
+               "NATURAL" if last else rng.choice(["CRYING", "FEEDING", "DIAPER"]))
+        hour += length
+
+
+def _diapers(baby: Baby, day: date, age: int) -> Iterator[Row]:
+    rng = baby.rng
+    for _ in range(max(10 - age // 120, 5)):
+        stool = rng.random() < max(0.6 - age / 1000, 0.25)
+        yield (_at(day, rng.uniform(0, 24)), True, rng.choice(["LIGHT", "MODERATE", "HEAVY"]), stool,
+               rng.choice(["LIQUID", "SOFT", "FORMED"]) if stool else None,
+               rng.choice(["YELLOW", "BROWN", "GREEN"]) if stool else None, "DISPOSABLE")
+
+
+def _growth(baby: Baby, day: date, age: int) -> Iterator[Row]:
+    if (age <= 60 and age % 7 == 0) or (60 < age <= 730 and age % 30 == 0) or (age > 730 and age % 90 == 0):
+        yield (day, baby.standard("weight", age), baby.standard("length", age),
+               baby.standard("head_circumference", age), "HOME" if age % 60 else "DOCTOR_VISIT")
+
+
+def _health(baby: Baby, day: date, age: int) -> Iterator[Row]:
+    rng = baby.rng
+    if age in VACCINATION_DAYS:
+        yield (_at(day, 10), "VACCINATION", f"Vaccinations ({age // 30} months)", None, False)
+    if age in baby.milestones:
+        yield (_at(day, 12), "MILESTONE", baby.milestones[age], None, False)
+    if age > 90 and rng.random() < 1 / 60:
+        yield (_at(day, rng.uniform(6, 20)), "ILLNESS", "Cold", round(rng.uniform(37.5, 39.2), 1),
+               rng.random() < 0.3)
+
+
+GENERATORS = {
+    "feeding_sessions": _feeds,
+    "sleep_sessions": _sleeps,
+    "diaper_events": _diapers,
+    "growth_measurements": _growth,
+    "health_events": _health,
+}
+
+
+def history(baby: Baby, today: date) -> Iterator[Tuple[str, Row]]:
+    """(table, row) for each event in the baby's life so far, day by day.
+
+    created_at/updated_at are the start of the event's day, so reruns
+    produce identical rows.
+    """
+    day = baby.date_of_birth
+    while day < today:
+        age = (day - baby.date_of_birth).days
+        created = _at(day, 0)
+        for table, generate in GENERATORS.items():
+            for values in generate(baby, day, age):
+                yield table, (_uuid(baby.rng), baby.id, created, created, BENCHMARK_SOURCE, *values)
+        day += timedelta(days=1)
+
+
+class CopyWriter:
+    """Buffers rows per table as CSV and COPYs each buffer once it's full."""
+
+    def __init__(self, cursor, batch_rows: int):
+        self.cursor = cursor
+        self.batch_rows = batch_rows
+        self.buffers: Dict[str, Tuple[io.StringIO, Any]] = {}
+        self.columns: Dict[str, Sequence[str]] = {}
+        self.pending: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+
+    def write(self, table: str, columns: Sequence[str], row: Row) -> None:
+        if table not in self.buffers:
+            buffer = io.StringIO()
+            self.buffers[table] = (buffer, csv.writer(buffer))
+            self.columns[table] = columns
+            self.pending[table] = 0
+        self.buffers[table][1].writerow(["" if v is None else v for v in row])
+        self.pending[table] += 1
+        if self.pending[table] >= self.batch_rows:
+            self.flush(table)
+
+    def flush(self, table: str) -> None:
+        buffer, _ = self.buffers[table]
+        if not self.pending[table]:
+            return
+        buffer.seek(0)
+        quoted = ", ".join(f'"{c}"' for c in self.columns[table])
+        self.cursor.copy_expert(f"COPY {table} ({quoted}) FROM STDIN WITH (FORMAT csv)", buffer)
+        self.counts[table] = self.counts.get(table, 0) + self.pending[table]
+        buffer.seek(0)
+        buffer.truncate()
+        self.pending[table] = 0
+
+    def close(self) -> None:
+        for table in list(self.buffers):
+            self.flush(table)
+
+
+def generate(engine: Engine, babies: int, years: float, seed: int, batch_rows: int) -> Dict[str, int]:
+    """Write the babies and their histories; returns rows written per table."""
+    today = date.today()
+    common = ("id", "baby_id", "created_at", "updated_at", "source")
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            writer = CopyWriter(cursor, batch_rows)
+            for index in range(babies):
+                baby = Baby(index, seed, today, years)
+                writer.write("baby_profiles", BABY_COLUMNS, baby.profile())
+                writer.flush("baby_profiles")
+                for table, row in history(baby, today):
+                    writer.write(table, common + TABLE_COLUMNS[table], row)
+            writer.close()
+        raw.commit()
+    finally:
+        raw.close()
+    return writer.counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=str(settings.DATABASE_URL))
+    parser.add_argument("--babies", type=int, default=20)
+    parser.add_argument("--years", type=float, default=2.0, help="Age of each baby, i.e. history length")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--batch-rows", type=int, default=50_000, help="Rows per COPY")
+    parser.add_argument("--cleanup", action="store_true", help="Delete benchmark rows and exit")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    cleanup(engine)
+    if args.cleanup:
+        print("Deleted benchmark rows")
+        return 0
+
+    started = time.perf_counter()
+    counts = generate(engine, args.babies, args.years, args.seed, args.batch_rows)
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    for table, count in counts.items():
+        print(f"{table:<20} {count:>12,}")
+    print(f"Wrote {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Cold import time of the app and CLI entry points, with a regression check.
+
+Imports each module in a fresh interpreter under `python -X importtime`
+--runs times and prints the median cumulative import time, plus the
+modules with the most self time in the median run. Needs no database:
+nothing should connect, or even create an engine, at import.
+
+Save a run with --output and check later ones against it; the exit code
+is 1 if any module got more than --max-regression slower than the
+baseline, or is over --budget-ms:
+
+    python -m benchmarks.import_time --output imports.json
+    python -m benchmarks.import_time --compare imports.json --max-regression 0.2
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# The app (uvicorn / scale-to-zero cold starts) and what CLIs and Alembic import
+MODULES = ["app.main", "app.core.database", "app.models", "app.cli.daily_metrics"]
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module with its indentation, self µs, cumulative µs) per line of -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_once(module: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Cumulative ms to import `module` in a new interpreter, and the raw rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr[-2000:]}")
+    rows = parse_importtime(result.stderr)
+    # Top-level (unindented) entry for the module itself; it covers
+    # everything imported on its behalf
+    cumulative = next(us for name, _, us in rows if name == module)
+    return cumulative / 1000, rows
+
+
+def measure(module: str, runs: int, top: int) -> Dict[str, object]:
+    """Median import time of `module` over `runs`, and its heaviest imports."""
+    measure_once(module)  # warm up the bytecode cache
+    samples = sorted((measure_once(module) for _ in range(runs)), key=lambda sample: sample[0])
+    median_ms, rows = samples[len(samples) // 2]
+    heaviest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return {
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(samples[0][0], 1),
+        "max_ms": round(samples[-1][0], 1),
+        "heaviest_self_ms": {name.strip(): round(self_us / 1000, 1) for name, self_us, _ in heaviest},
+    }
+
+
+def regressions(
+    results: Dict[str, Dict[str, object]],
+    baseline: Optional[Dict[str, object]],
+    max_regression: float,
+    budget_ms: Optional[float],
+) -> List[str]:
+    """A message per module over its budget or slower than the baseline allows."""
+    failures = []
+    for module, result in results.items():
+        median = result["median_ms"]
+        if budget_ms is not None and median > budget_ms:
+            failures.append(f"{module}: {median:.0f} ms is over the {budget_ms:.0f} ms budget")
+        base = (baseline or {}).get("modules", {}).get(module)
+        if base and median > base["median_ms"] * (1 + max_regression):
+            failures.append(
+                f"{module}: {median:.0f} ms vs {base['median_ms']:.0f} ms baseline "
+                f"({median / base['median_ms'] - 1:+.0%}, allowed {max_regression:+.0%})"
+            )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=5, help="Heaviest imports shown per module")
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--compare", type=Path, help="A saved run to check against")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed slowdown vs --compare, as a fraction")
+    parser.add_argument("--budget-ms", type=float, help="Fail any module slower than this")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    results = {}
+    print(f"{'module':<24} {'median ms':>9} {'min ms':>7} {'max ms':>7}"
+          + (f" {'vs base':>8}" if baseline else ""))
+    for module in args.modules:
+        result = results[module] = measure(module, args.runs, args.top)
+        line = (f"{module:<24} {result['median_ms']:>9.1f} {result['min_ms']:>7.1f} "
+                f"{result['max_ms']:>7.1f}")
+        base = (baseline or {}).get("modules", {}).get(module)
+        if base:
+            line += f" {result['median_ms'] / base['median_ms'] - 1:>+8.0%}"
+        print(line)
+        for name, self_ms in result["heaviest_self_ms"].items():
+            print(f"    {name:<40} {self_ms:>7.1f} ms self")
+
+    if args.output:
+        args.output.write_text(json.dumps({"python": sys.version, "modules": results}, indent=2))
+        print(f"\nSaved to {args.output}")
+    failures = regressions(results, baseline, args.max_regression, args.budget_ms)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
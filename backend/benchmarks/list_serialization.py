@@ -0,0 +1,129 @@
+"""Rows/s of the list endpoints' read path, ORM vs Core rows.
+
+For each event table, loads and serialises 10k-row pages both ways:
+
+- orm:  get_multi (ORM instances), then what FastAPI does with a
+        response_model: validate each instance with from_attributes,
+        dump to Python objects and json.dumps the list
+- rows: get_multi_rows (only the response columns, as Core rows), then
+        dump_json_list, as the list routes now do
+
+Checks that both produce the same bytes, and prints rows/s for each and
+the speedup. Seeds rows like benchmarks.query_plans (tagged
+source='benchmark', deleted afterwards unless --keep):
+
+    python -m benchmarks.list_serialization --page-size 10000 --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Callable, List
+from uuid import UUID
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.schemas.diaper import DiaperEventResponse
+from app.schemas.feeding import FeedingSessionResponse
+from app.schemas.growth import GrowthMeasurementResponse
+from app.schemas.health import HealthEventResponse
+from app.schemas.sleep import SleepSessionResponse
+from app.services.serialization import dump_json_list
+from benchmarks.query_plans import BENCHMARK_SOURCE, LIST_ROUTES, cleanup, seed
+
+RESPONSE_MODELS = {
+    "feeding_sessions": FeedingSessionResponse,
+    "sleep_sessions": SleepSessionResponse,
+    "diaper_events": DiaperEventResponse,
+    "growth_measurements": GrowthMeasurementResponse,
+    "health_events": HealthEventResponse,
+}
+
+
+def fastapi_json(items: List, response_model) -> bytes:
+    """What FastAPI sends for `items` under response_model=List[response_model]."""
+    content = [
+        response_model.model_validate(item, from_attributes=True).model_dump(mode="json", by_alias=True)
+        for item in items
+    ]
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _time(fn: Callable[[], bytes], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run(engine: Engine, page_size: int, repeat: int) -> bool:
+    """Time both read paths per table; False if any output differs."""
+    with engine.connect() as conn:
+        # The baby with the most feeds, so pages are full
+        baby_id = UUID(str(conn.execute(
+            text("""
+                select baby_id from feeding_sessions where source = :source
+                group by baby_id order by count(*) desc limit 1
+            """),
+            {"source": BENCHMARK_SOURCE},
+        ).scalar_one()))
+
+    identical = True
+    print(f"{'table':<22} {'orm rows/s':>12} {'rows rows/s':>12} {'speedup':>8}  same bytes")
+    for service, order_by_field in LIST_ROUTES:
+        table_name = service.model.__tablename__
+        response_model = RESPONSE_MODELS[table_name]
+        params = dict(baby_id=baby_id, limit=page_size, order_by_field=order_by_field)
+
+        def orm_path() -> bytes:
+            with Session(engine) as db:
+                return fastapi_json(service.get_multi(db, **params), response_model)
+
+        def rows_path() -> bytes:
+            with Session(engine) as db:
+                rows = service.get_multi_rows(db, response_model=response_model, **params)
+                return dump_json_list(rows, response_model)
+
+        same = orm_path() == rows_path()
+        identical = identical and same
+        rows = len(json.loads(rows_path()))
+        orm_rate = rows / statistics.median(_time(orm_path, repeat))
+        rows_rate = rows / statistics.median(_time(rows_path, repeat))
+        print(f"{table_name:<22} {orm_rate:>12,.0f} {rows_rate:>12,.0f} "
+              f"{rows_rate / orm_rate:>7.1f}x  {'yes' if same else 'NO'}")
+    return identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=str(settings.DATABASE_URL))
+    parser.add_argument("--babies", type=int, default=5)
+    parser.add_argument("--rows-per-table", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse rows from a --keep run")
+    parser.add_argument("--keep", action="store_true", help="Leave the seeded rows in place")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if not args.skip_seed:
+        seed(engine, args.babies, args.rows_per_table)
+    try:
+        ok = run(engine, args.page_size, args.repeat)
+    finally:
+        if not args.keep:
+            cleanup(engine)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
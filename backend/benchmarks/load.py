@@ -0,0 +1,270 @@
+"""Scenario-driven HTTP load test: latency percentiles and throughput per route.
+
+Drives a running API (--base-url) with --concurrency keep-alive clients
+for --duration seconds. Each client repeatedly picks a step of the
+scenario at random, weighted by the step's weight, fills in its path
+(a random baby, one of that baby's feeds, ...) and sends it. Results
+are grouped by route template, e.g. GET /api/v1/feeding/{feeding_id}:
+requests/s, errors, and p50/p95/p99/max latency.
+
+Scenarios are built in (see SCENARIOS) or read from a JSON file with
+the same shape: {"steps": [{"route": "GET /api/v1/babies/{baby_id}",
+"weight": 1, "json": {...}}]}. Path and body strings can use {api},
+{baby_id}, {feeding_id} and {now}.
+
+Point it at a database filled by benchmarks.datagen. --output saves the
+results as JSON, and --compare prints the change from a saved run:
+
+    python -m benchmarks.load --scenario browse --concurrency 50 --output browse.json
+    python -m benchmarks.load --scenario browse --concurrency 50 --compare browse.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+@dataclass
+class Step:
+    """One kind of request in a scenario."""
+
+    route: str  # "METHOD /path/{template}"; results are grouped on it
+    weight: float = 1.0
+    json: Optional[Dict[str, Any]] = None
+
+    @property
+    def method(self) -> str:
+        return self.route.split(" ", 1)[0]
+
+    @property
+    def path(self) -> str:
+        return self.route.split(" ", 1)[1]
+
+
+SCENARIOS: Dict[str, List[Step]] = {
+    # A parent scrolling through the app
+    "browse": [
+        Step("GET {api}/feeding/?baby_id={baby_id}&limit=50", 30),
+        Step("GET {api}/sleep/?baby_id={baby_id}&limit=50", 20),
+        Step("GET {api}/diaper/?baby_id={baby_id}&limit=50", 15),
+        Step("GET {api}/feeding/{feeding_id}", 10),
+        Step("GET {api}/babies/{baby_id}/summary", 10),
+        Step("GET {api}/babies/{baby_id}/timeline?limit=50", 10),
+        Step("GET {api}/babies/", 5),
+    ],
+    # Dashboards and exports
+    "analytics": [
+        Step("GET {api}/analytics/daily-metrics?baby_id={baby_id}", 40),
+        Step("GET {api}/analytics/compare", 20),
+        Step("GET {api}/feeding/?baby_id={baby_id}&limit=2000", 20),
+        Step("GET {api}/sleep/?baby_id={baby_id}&limit=2000", 20),
+    ],
+    # Logging events during the day, with the lists refreshed after each
+    "logging": [
+        Step("POST {api}/feeding/", 20, {
+            "baby_id": "{baby_id}", "feeding_type": "bottle", "start_time": "{now}",
+            "volume_offered_ml": 150, "volume_consumed_ml": 120,
+        }),
+        Step("POST {api}/diaper/", 20, {"baby_id": "{baby_id}", "timestamp": "{now}", "has_urine": True}),
+        Step("GET {api}/feeding/?baby_id={baby_id}&limit=50", 30),
+        Step("GET {api}/babies/{baby_id}/summary", 30),
+    ],
+}
+
+
+@dataclass
+class Sample:
+    """Outcomes recorded for one route."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    bytes: int = 0
+
+
+def _fill(value: Any, values: Dict[str, str]) -> Any:
+    """`value` with {placeholders} in its strings replaced."""
+    if isinstance(value, str):
+        return value.format_map(values)
+    if isinstance(value, dict):
+        return {k: _fill(v, values) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, values) for v in value]
+    return value
+
+
+def _label(step: Step) -> str:
+    return step.route.replace("{api}", settings.API_V1_STR)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile (0-100) of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+async def _targets(client: httpx.AsyncClient) -> Dict[str, List[str]]:
+    """Baby ids, and some feed ids per baby, to fill paths with."""
+    api = settings.API_V1_STR
+    babies = (await client.get(f"{api}/babies/", params={"limit": 100})).json()
+    if not babies:
+        raise SystemExit("No babies in the database; run benchmarks.datagen first.")
+    feeds = {}
+    for baby in babies:
+        page = (await client.get(f"{api}/feeding/", params={"baby_id": baby["id"], "limit": 100})).json()
+        feeds[baby["id"]] = [feed["id"] for feed in page]
+    return feeds
+
+
+async def drive(
+    base_url: str,
+    steps: List[Step],
+    *,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Dict[str, Sample]:
+    """Run the scenario and return the samples per route."""
+    samples: Dict[str, Sample] = {_label(step): Sample() for step in steps}
+    weights = [step.weight for step in steps]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        feeds = await _targets(client)
+        baby_ids = list(feeds)
+        started = time.monotonic()
+        record_from, deadline = started + warmup, started + warmup + duration
+
+        async def loop(rng: random.Random) -> None:
+            while (now := time.monotonic()) < deadline:
+                step = rng.choices(steps, weights)[0]
+                baby_id = rng.choice(baby_ids)
+                values = {
+                    "api": settings.API_V1_STR,
+                    "baby_id": baby_id,
+                    "feeding_id": rng.choice(feeds[baby_id]) if feeds[baby_id] else "",
+                    "now": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+                }
+                sent = time.perf_counter()
+                try:
+                    response = await client.request(
+                        step.method, _fill(step.path, values), json=_fill(step.json, values)
+                    )
+                    ok, size = response.status_code < 400, len(response.content)
+                except httpx.HTTPError:
+                    ok, size = False, 0
+                if now < record_from:
+                    continue
+                sample = samples[_label(step)]
+                if ok:
+                    sample.latencies.append(time.perf_counter() - sent)
+                    sample.bytes += size
+                else:
+                    sample.errors += 1
+
+        await asyncio.gather(*(loop(random.Random(seed + n)) for n in range(concurrency)))
+    return samples
+
+
+def summarise(samples: Dict[str, Sample], duration: float) -> Dict[str, Dict[str, float]]:
+    """Per route (and "total"): rps, errors, mean bytes and latency percentiles in ms."""
+    def stats(latencies: List[float], errors: int, size: int) -> Dict[str, float]:
+        ordered = sorted(latencies)
+        return {
+            "requests": len(ordered),
+            "rps": len(ordered) / duration,
+            "errors": errors,
+            "mean_bytes": size / len(ordered) if ordered else 0,
+            **{f"p{q}_ms": percentile(ordered, q) * 1000 for q in (50, 95, 99)},
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        }
+
+    routes = {route: stats(s.latencies, s.errors, s.bytes) for route, s in samples.items()}
+    routes["total"] = stats(
+        [latency for s in samples.values() for latency in s.latencies],
+        sum(s.errors for s in samples.values()),
+        sum(s.bytes for s in samples.values()),
+    )
+    return routes
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(routes: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Any]] = None) -> None:
+    header = f"{'route':<58} {'req/s':>8} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    print(header + (f" {'p95 vs base':>11} {'req/s vs base':>13}" if baseline else ""))
+    for route, r in routes.items():
+        line = (f"{route:<58} {r['rps']:>8.1f} {r['errors']:>6} {r['p50_ms']:>8.1f} "
+                f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}")
+        base = (baseline or {}).get("routes", {}).get(route)
+        if base and base["p95_ms"] and base["rps"]:
+            line += (f" {r['p95_ms'] / base['p95_ms'] - 1:>+11.0%}"
+                     f" {r['rps'] / base['rps'] - 1:>+13.0%}")
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", default="browse",
+                        help=f"One of {', '.join(SCENARIOS)}, or a JSON scenario file")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds measured")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Seconds run before measuring")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--compare", type=Path, help="A saved run to compare against")
+    args = parser.parse_args()
+
+    if args.scenario in SCENARIOS:
+        steps = SCENARIOS[args.scenario]
+    else:
+        spec = json.loads(Path(args.scenario).read_text())
+        steps = [Step(**step) for step in spec["steps"]]
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    routes = summarise(asyncio.run(drive(
+        args.base_url, steps,
+        concurrency=args.concurrency, duration=args.duration, warmup=args.warmup, seed=args.seed,
+    )), args.duration)
+    results = {
+        "scenario": args.scenario,
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "started_at": started_at,
+        "git_commit": _git_commit(),
+        "routes": routes,
+    }
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_results(routes, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nSaved to {args.output}")
+    return 1 if routes["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Query-plan regression check for the event list endpoints.
+
+Seeds a few million synthetic event rows, then EXPLAINs the exact SQL each
+list route issues through CRUDBase.get_multi and fails if any of them is
+planned as a sequential scan instead of the (baby_id, event time) index.
+
+Run from the backend directory against a scratch database. Seeded rows are
+tagged source='benchmark' and deleted again afterwards unless --keep is set:
+
+    python -m benchmarks.query_plans --rows-per-table 1000000
+    python -m benchmarks.query_plans --database-url postgresql://.../baby_bench --keep
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services import (
+    diaper_service,
+    feeding_service,
+    growth_service,
+    health_service,
+    sleep_service,
+)
+
+BENCHMARK_SOURCE = "benchmark"
+
+# (service, order_by_field) exactly as the list routers call get_multi
+LIST_ROUTES = [
+    (feeding_service, "start_time"),
+    (sleep_service, "start_time"),
+    (diaper_service, "timestamp"),
+    (growth_service, "measurement_date"),
+    (health_service, "event_date"),
+]
+
+# Table -> (extra columns, matching select expressions) for the seed insert.
+# `g` is the generate_series counter; NOT NULL enum columns get a fixed value.
+_SEED_COLUMNS = {
+    "feeding_sessions": (
+        "start_time, end_time, feeding_type, left_breast_duration",
+        "localtimestamp - g * interval '47 seconds', "
+        "localtimestamp - g * interval '47 seconds' + interval '15 minutes', "
+        "'BREAST'::feedingtype, 15",
+    ),
+    "sleep_sessions": (
+        "start_time, end_time, sleep_type",
+        "localtimestamp - g * interval '53 seconds', "
+        "localtimestamp - g * interval '53 seconds' + interval '45 minutes', "
+        "'NAP'::sleeptype",
+    ),
+    "diaper_events": (
+        '"timestamp", has_urine, has_stool',
+        "localtimestamp - g * interval '41 seconds', true, g % 3 = 0",
+    ),
+    "growth_measurements": (
+        "measurement_date, weight_kg",
+        "current_date - (g % 3650), 3.5 + (g % 900) / 100.0",
+    ),
+    "health_events": (
+        "event_date, event_type, title",
+        "localtimestamp - g * interval '59 seconds', 'OTHER'::healtheventtype, 'Benchmark event'",
+    ),
+}
+
+
+def seed(engine: Engine, babies: int, rows_per_table: int) -> None:
+    """Insert `babies` profiles and `rows_per_table` events per event table."""
+    with engine.begin() as conn:
+        conn.execute(
+            text("""
+                insert into baby_profiles
+                    (id, name, date_of_birth, timezone, is_active, created_at, updated_at, source)
+                select gen_random_uuid(), 'Benchmark baby ' || g, current_date - (g % 700),
+                       'Australia/Sydney', true, localtimestamp, localtimestamp, :source
+                from generate_series(1, :babies) g
+            """),
+            {"babies": babies, "source": BENCHMARK_SOURCE},
+        )
+        for table_name, (columns, values) in _SEED_COLUMNS.items():
+            started = time.perf_counter()
+            conn.execute(
+                text(f"""
+                    with b as (
+                        select array_agg(id) as ids from baby_profiles where source = :source
+                    )
+                    insert into {table_name}
+                        (id, baby_id, created_at, updated_at, source, {columns})
+                    select gen_random_uuid(), b.ids[1 + g % array_length(b.ids, 1)],
+                           localtimestamp, localtimestamp, :source, {values}
+                    from b, generate_series(1, :rows) g
+                """),
+                {"rows": rows_per_table, "source": BENCHMARK_SOURCE},
+            )
+            print(f"seeded {rows_per_table:>10,} rows into {table_name} "
+                  f"in {time.perf_counter() - started:.1f}s")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table_name in ["baby_profiles", *_SEED_COLUMNS]:
+            conn.execute(text(f"analyze {table_name}"))
+
+
+def cleanup(engine: Engine) -> None:
+    """Delete everything seed() inserted."""
+    with engine.begin() as conn:
+        for table_name in _SEED_COLUMNS:
+            conn.execute(
+                text(f"delete from {table_name} where source = :source"),
+                {"source": BENCHMARK_SOURCE},
+            )
+        conn.execute(
+            text("delete from baby_profiles where source = :source"),
+            {"source": BENCHMARK_SOURCE},
+        )
+
+
+def capture_list_statement(engine: Engine, service, order_by_field: str, baby_id) -> Tuple[str, dict]:
+    """Run get_multi as the router does and return the SQL it sent to Postgres."""
+    captured: List[Tuple[str, dict]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        with Session(engine) as db:
+            service.get_multi(db, baby_id=baby_id, order_by_field=order_by_field)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return captured[-1]
+
+
+def check_plans(engine: Engine) -> bool:
+    """EXPLAIN ANALYZE every list query; True if all of them use an index scan."""
+    with engine.connect() as conn:
+        baby_id = conn.execute(
+            text("select id from baby_profiles where source = :source limit 1"),
+            {"source": BENCHMARK_SOURCE},
+        ).scalar_one()
+
+    ok = True
+    for service, order_by_field in LIST_ROUTES:
+        table_name = service.model.__tablename__
+        statement, parameters = capture_list_statement(engine, service, order_by_field, baby_id)
+        with engine.connect() as conn:
+            plan = [
+                row[0]
+                for row in conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                )
+            ]
+        uses_index = any("Index Scan" in line or "Index Only Scan" in line for line in plan)
+        seq_scan = any(f"Seq Scan on {table_name}" in line for line in plan)
+        passed = uses_index and not seq_scan
+        ok = ok and passed
+        execution = next((line.strip() for line in plan if line.startswith("Execution Time")), "")
+        print(f"{'PASS' if passed else 'FAIL'}  {table_name:<22} {execution}")
+        if not passed:
+            print("\n".join(f"      {line}" for line in plan))
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=str(settings.DATABASE_URL))
+    parser.add_argument("--babies", type=int, default=50)
+    parser.add_argument("--rows-per-table", type=int, default=1_000_000)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse rows from a --keep run")
+    parser.add_argument("--keep", action="store_true", help="Leave the seeded rows in place")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if not args.skip_seed:
+        seed(engine, args.babies, args.rows_per_table)
+    try:
+        ok = check_plans(engine)
+    finally:
+        if not args.keep:
+            cleanup(engine)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
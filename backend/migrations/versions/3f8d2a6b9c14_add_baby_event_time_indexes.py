@@ -0,0 +1,57 @@
+"""add_baby_event_time_indexes
+
+Revision ID: 3f8d2a6b9c14
+Revises: e7a91b4c2d58
+Create Date: 2026-10-16
+
+Adds a (baby_id, <event time> DESC) index to every event table so the
+list endpoints — filter by baby, newest first, LIMIT n — become an index
+range scan instead of a full scan plus sort.
+
+The indexes are built with CREATE INDEX CONCURRENTLY so the tables stay
+writable during the build. CONCURRENTLY cannot run inside a transaction,
+hence the autocommit block. If a build is interrupted Postgres leaves an
+INVALID index behind; drop it and re-run the upgrade.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3f8d2a6b9c14'
+down_revision = 'e7a91b4c2d58'
+branch_labels = None
+depends_on = None
+
+# Event table -> the column its events are ordered by
+EVENT_TIME_COLUMNS = {
+    'feeding_sessions': 'start_time',
+    'sleep_sessions': 'start_time',
+    'diaper_events': 'timestamp',
+    'growth_measurements': 'measurement_date',
+    'health_events': 'event_date',
+}
+
+
+def _index_name(table_name: str, column: str) -> str:
+    return f"ix_{table_name}_baby_id_{column}"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name, column in EVENT_TIME_COLUMNS.items():
+            op.create_index(
+                _index_name(table_name, column),
+                table_name,
+                ['baby_id', sa.text(f'"{column}" DESC')],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name, column in EVENT_TIME_COLUMNS.items():
+            op.drop_index(
+                _index_name(table_name, column),
+                table_name=table_name,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,57 @@
+"""add_daily_metrics_tables
+
+Revision ID: 8c21d4e7f0a3
+Revises: 3f8d2a6b9c14
+Create Date: 2026-10-16
+
+Adds the app-maintained daily_metrics table (same shape as
+marts.mart_daily_metrics) and daily_metrics_dirty, the queue of event
+changes whose days still need recomputing. Fill daily_metrics after
+upgrading with `python -m app.cli.daily_metrics rebuild`.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '8c21d4e7f0a3'
+down_revision = '3f8d2a6b9c14'
+branch_labels = None
+depends_on = None
+
+INT_NOT_NULL = [
+    'night_sleep_minutes', 'nap_count', 'total_nap_minutes', 'feed_count',
+    'breast_feed_count', 'bottle_feed_count', 'diaper_count',
+    'wet_diaper_count', 'dirty_diaper_count',
+]
+INT_NULLABLE = [
+    'night_sleep_segments', 'longest_night_stretch_minutes', 'night_waking_count',
+    'awake_at_night_minutes', 'avg_nap_minutes', 'total_volume_ml',
+    'avg_feed_interval_minutes', 'avg_wake_window_minutes', 'max_wake_window_minutes',
+]
+
+
+def upgrade() -> None:
+    op.create_table('daily_metrics',
+    sa.Column('baby_id', sa.UUID(), nullable=False),
+    sa.Column('metric_date', sa.Date(), nullable=False),
+    sa.Column('baby_name', sa.String(length=100), nullable=False),
+    sa.Column('age_days', sa.Integer(), nullable=False),
+    sa.Column('age_weeks', sa.Integer(), nullable=False),
+    *[sa.Column(name, sa.Integer(), nullable=False) for name in INT_NOT_NULL],
+    *[sa.Column(name, sa.Integer(), nullable=True) for name in INT_NULLABLE],
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['baby_id'], ['baby_profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('baby_id', 'metric_date')
+    )
+    op.create_table('daily_metrics_dirty',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('baby_id', sa.UUID(), nullable=False),
+    sa.Column('event_time', sa.DateTime(), nullable=True),
+    sa.Column('marked_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_metrics_dirty')
+    op.drop_table('daily_metrics')